@@ -4,19 +4,24 @@ import os
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
+from app.db_pool import DB_POOL_PRE_PING, install_idle_ping, pool_options
+
 # 환경 변수에서 DATABASE_URL 가져오기
 db_url = os.getenv("DATABASE_URL")
 
 if not db_url:
     raise ValueError("❌ DATABASE_URL environment variable is not set!")
 
-# 데이터베이스 엔진 생성
+# 데이터베이스 엔진 생성 (풀 크기 / overflow / timeout / recycle / pre-ping 은 환경 변수, app/db_pool.py)
 engine = create_engine(
     db_url,
     echo=False,  # ← 프로덕션에서는 False로 (SQL 쿼리 로깅 끄기)
-    pool_pre_ping=True
+    **pool_options(db_url)
 )
 
+if DB_POOL_PRE_PING == "idle":
+    install_idle_ping(engine)
+
 Session = sessionmaker(
     autocommit=False,
     autoflush=False,
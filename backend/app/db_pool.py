@@ -0,0 +1,136 @@
+"""
+DB 커넥션 풀 설정 / 지표
+
+- TimedQueuePool: QueuePool 과 같고, 커넥션을 빌릴 때 기다린 시간과 타임아웃 수를 기록
+- pre-ping 방식 (DB_POOL_PRE_PING)
+  - always: 빌릴 때마다 ping (SQLAlchemy pool_pre_ping=True, 요청마다 왕복 1회 추가)
+  - idle  : DB_POOL_PING_IDLE_SECONDS 이상 쉬고 있던 커넥션만 ping
+  - never : ping 하지 않음 (끊긴 커넥션은 첫 쿼리에서 오류 → DB_POOL_RECYCLE 로 미리 교체 권장)
+
+지표는 GET /metrics/db-pool (워커 프로세스마다 따로 집계됨)
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+# 풀 설정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))  # 초, -1 = 교체 안 함
+DB_POOL_USE_LIFO = os.getenv("DB_POOL_USE_LIFO", "false").lower() == "true"
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "always").lower()
+DB_POOL_PING_IDLE_SECONDS = float(os.getenv("DB_POOL_PING_IDLE_SECONDS", "30"))
+
+# 대기 시간 통계에 쓰는 최근 checkout 수
+WAIT_WINDOW = 1000
+
+
+class TimedQueuePool(QueuePool):
+    """checkout 대기 시간 / 타임아웃을 기록하는 QueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._waits = deque(maxlen=WAIT_WINDOW)
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def _do_get(self):
+        # 풀에 남은 커넥션이 없으면 여기서 기다림 (새 커넥션을 만드는 시간도 포함)
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+
+        with self._stats_lock:
+            self._waits.append((time.perf_counter() - started) * 1000)
+            self.checkouts += 1
+        return connection
+
+    def stats(self) -> dict:
+        """사용 중 / 대기 중 커넥션, overflow, checkout 대기 시간"""
+        with self._stats_lock:
+            waits = sorted(self._waits)
+            checkouts = self.checkouts
+            timeouts = self.timeouts
+
+        def percentile(q):
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(round(q / 100 * (len(waits) - 1))))], 3)
+
+        return {
+            "pid": os.getpid(),
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout": self._timeout,
+            "recycle": self._recycle,
+            "pre_ping": DB_POOL_PRE_PING,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            # overflow() 는 pool_size 만큼 만들기 전까지 음수
+            "overflow": max(0, self.overflow()),
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_ms": {
+                "mean": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "p50": percentile(50),
+                "p95": percentile(95),
+                "p99": percentile(99),
+                "max": round(waits[-1], 3) if waits else 0.0
+            }
+        }
+
+
+def pool_options(db_url: str) -> dict:
+    """create_engine 에 넘길 풀 설정"""
+    if db_url.startswith("sqlite") and ":memory:" in db_url:
+        # 메모리 DB는 커넥션마다 DB가 따로 생기므로 SQLAlchemy 기본 풀 사용
+        return {}
+
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_use_lifo": DB_POOL_USE_LIFO,
+        "pool_pre_ping": DB_POOL_PRE_PING == "always"
+    }
+
+
+def install_idle_ping(engine: Engine, idle_seconds: float = DB_POOL_PING_IDLE_SECONDS):
+    """오래 쉬던 커넥션만 checkout 시 ping (끊겼으면 풀이 새 커넥션으로 바꿔서 다시 시도)"""
+
+    @event.listens_for(engine, "checkin")
+    def _mark_idle(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception:
+            raise exc.DisconnectionError()
+
+
+def pool_stats(engine: Engine) -> dict:
+    """GET /metrics/db-pool 응답"""
+    pool = engine.pool
+    if isinstance(pool, TimedQueuePool):
+        return pool.stats()
+    return {"pid": os.getpid(), "pool": type(pool).__name__, "status": pool.status()}
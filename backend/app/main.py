@@ -7,23 +7,59 @@ FastAPI 애플리케이션 진입점
 3. 데이터베이스 테이블 생성
 4. CORS 설정 (Streamlit 연동용)
 5. 루트 엔드포인트
+6. 준비 상태 엔드포인트 (/ready, 모델 워밍업 완료 여부 + 공유 추론 프로세스 응답 여부)
 """
 
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.database import engine, Base
+from app.database import engine
 from app import models
-from app.routers import movies, reviews
+from app.migrations import run_migrations
+from app.routers import admin, metrics, movies, reviews
+from app.services.admission import ADMISSION_ENABLED
+from app.services.backfill import backfill_worker
+from app.services import inference_server
+from app.services.sentiment import (
+    ENGINE,
+    SENTIMENT_MODE,
+    WARMUP_ENABLED,
+    get_active_version,
+    model_ready,
+    warmup_model,
+    warmup_status
+)
+
+# ===== 데이터베이스 테이블 생성 + 스키마 보정 (PostgreSQL 은 워커끼리 advisory lock 으로 한 번에 하나씩) =====
+run_migrations(engine)
+
+# ===== 앱 시작/종료 훅 =====
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 지연 감성 분석 모드거나 입장 제어로 pending 이 생길 수 있으면 백필 워커 실행
+    if SENTIMENT_MODE == "deferred" or ADMISSION_ENABLED:
+        backfill_worker.start()
+
+    # 모델 워밍업 (켜져 있으면 끝날 때까지 /ready 가 503, 꺼져 있으면 기존처럼 첫 요청에서 로드)
+    if WARMUP_ENABLED:
+        threading.Thread(target=warmup_model, name="sentiment-warmup", daemon=True).start()
+    else:
+        model_ready.set()
+
+    yield
 
-# ===== 데이터베이스 테이블 생성 =====
-Base.metadata.create_all(bind=engine)
+    backfill_worker.stop()
 
 # ===== FastAPI 앱 생성 =====
 app = FastAPI(
     title="Movie Review API",
     description="영화 정보 및 리뷰 관리 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # ===== CORS(Cross-Origin Resource Sharing) 설정 =====
@@ -34,12 +70,15 @@ app.add_middleware(
     allow_origins=["*"],  # 모든 origin 허용 (개발용)
     allow_credentials=True,
     allow_methods=["*"],  # 모든 HTTP 메서드 허용
-    allow_headers=["*"]   # 모든 헤더 허용
+    allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=["X-Next-Cursor"]  # 목록 API 다음 페이지 커서
 )
 
 # ===== 라우터 등록 =====
 app.include_router(movies.router)
 app.include_router(reviews.router)
+app.include_router(metrics.router)
+app.include_router(admin.router)
 
 # ===== 루트 엔드포인트 =====
 @app.get("/")
@@ -49,4 +88,33 @@ def read_root():
         "message": "Movie Review API",
         "version": "1.0.0",
         "docs": "/docs"
-    }
\ No newline at end of file
+    }
+
+
+# ===== 준비 상태 엔드포인트 =====
+@app.get("/ready")
+def read_ready():
+    """트래픽을 받을 준비가 됐는지 확인 (로드 밸런서 / readiness probe 용)"""
+    if not model_ready.is_set():
+        return JSONResponse(
+            status_code=503,
+            content={"status": "failed" if warmup_status["error"] else "warming_up", **warmup_status}
+        )
+
+    ready = {
+        "status": "ready",
+        "model_version": get_active_version(),
+        "warmup_seconds": warmup_status["seconds"]
+    }
+
+    # 공유 추론 프로세스가 죽거나 멈추면 이 워커의 추론도 모두 실패하므로 준비 안 됨으로 응답
+    if ENGINE == "remote":
+        try:
+            ready["inference_server"] = inference_server.ping()
+        except Exception as e:
+            return JSONResponse(
+                status_code=503,
+                content={"status": "inference_server_unavailable", "error": str(e) or type(e).__name__}
+            )
+
+    return ready
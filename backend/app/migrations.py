@@ -0,0 +1,139 @@
+"""
+기존 테이블 스키마 보정
+
+Base.metadata.create_all 은 없는 테이블만 만들고 이미 있는 테이블에 컬럼/인덱스를
+추가하지 않는다. 여기서 빠진 컬럼과 인덱스만 확인해서 추가한다 (여러 번 실행해도 안전).
+
+PostgreSQL 에서는
+- 여러 워커가 동시에 시작해도 pg_advisory_lock 으로 한 프로세스씩 실행 (나머지는 기다렸다가 확인만 함)
+- 인덱스는 CREATE INDEX CONCURRENTLY IF NOT EXISTS 로 트랜잭션 밖에서 만들어
+  큰 reviews 테이블에 인덱스를 추가하는 동안에도 쓰기가 막히지 않음
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex
+
+from app.database import Base
+from app import models  # noqa: F401 - 테이블 / 인덱스 정의 등록
+
+# (테이블, 컬럼, DDL 타입, 컬럼을 새로 추가했을 때 기존 행을 채우는 SQL)
+COLUMNS = [
+    ("reviews", "model_version", "VARCHAR(100)", None),
+    (
+        "movies", "score_sum", "FLOAT NOT NULL DEFAULT 0",
+        "UPDATE movies SET score_sum = COALESCE("
+        "(SELECT SUM(sentiment_score) FROM reviews WHERE reviews.movie_id = movies.id), 0)"
+    ),
+    (
+        "movies", "scored_count", "INTEGER NOT NULL DEFAULT 0",
+        "UPDATE movies SET scored_count = "
+        "(SELECT COUNT(sentiment_score) FROM reviews WHERE reviews.movie_id = movies.id)"
+    ),
+    *[
+        (
+            "movies", f"{label}_count", "INTEGER NOT NULL DEFAULT 0",
+            f"UPDATE movies SET {label}_count = (SELECT COUNT(*) FROM reviews "
+            f"WHERE reviews.movie_id = movies.id AND reviews.sentiment_label = '{label}')"
+        )
+        for label in ("positive", "negative", "neutral")
+    ],
+    ("rescore_checkpoints", "owner", "VARCHAR(100)", None),
+    ("rescore_checkpoints", "heartbeat_at", "TIMESTAMP WITH TIME ZONE", None),
+    ("rescore_checkpoints", "stop_requested", "BOOLEAN NOT NULL DEFAULT FALSE", None),
+    ("rescore_checkpoints", "reviews_per_sec", "FLOAT NOT NULL DEFAULT 0", None),
+    ("rescore_checkpoints", "last_error", "VARCHAR(500)", None),
+]
+
+# (테이블, 인덱스 이름) - 인덱스 정의(컬럼, 부분 인덱스 조건)는 app/models.py 를 그대로 사용
+INDEXES = [
+    ("reviews", "ix_reviews_model_version"),
+    ("reviews", "ix_reviews_movie_id_created_at_id"),
+    ("reviews", "ix_reviews_created_at_id"),
+    ("reviews", "ix_reviews_pending"),
+    ("movies", "ix_movies_created_at_id"),
+    ("movies", "ix_movies_rating_reviewed"),
+]
+
+
+# 마이그레이션 advisory lock 키 (PostgreSQL, 이 앱 전용 임의의 고정값)
+MIGRATION_LOCK_ID = 7318204519
+
+
+def run_migrations(engine: Engine):
+    """빠진 테이블 / 컬럼 / 인덱스 추가 (PostgreSQL 은 advisory lock 을 잡고 한 프로세스씩)"""
+    if engine.dialect.name != "postgresql":
+        _migrate(engine)
+        return
+
+    # 세션 단위 lock 은 잡은 연결에서만 풀리므로 연결 하나로 잡고 풀고, 같은 연결(AUTOCOMMIT)로 인덱스 생성
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        try:
+            _migrate(engine, index_conn=conn)
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+
+def _migrate(engine: Engine, index_conn=None):
+    """
+    실제 마이그레이션 (lock 을 잡은 뒤에 스키마를 읽어야 먼저 끝난 워커의 변경이 보임)
+
+    index_conn: PostgreSQL AUTOCOMMIT 연결 (있으면 인덱스를 CONCURRENTLY 로 생성)
+    """
+    Base.metadata.create_all(bind=engine)
+
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+
+    # 컬럼 추가 + 기존 행 채우기는 한 트랜잭션으로
+    with engine.begin() as conn:
+        for table, column, ddl_type, backfill_sql in COLUMNS:
+            if table not in tables:
+                continue
+            existing = {col["name"] for col in inspector.get_columns(table)}
+            if column not in existing:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+                if backfill_sql:
+                    conn.execute(text(backfill_sql))
+                print(f"🛠️ 컬럼 추가: {table}.{column}")
+
+    for table, name in INDEXES:
+        if table not in tables:
+            continue
+        index = next(index for index in Base.metadata.tables[table].indexes if index.name == name)
+
+        if index_conn is not None:
+            if _create_index_concurrently(index_conn, index):
+                print(f"🛠️ 인덱스 추가: {name}")
+            continue
+
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            with engine.begin() as conn:
+                index.create(bind=conn)
+            print(f"🛠️ 인덱스 추가: {name}")
+
+
+def _create_index_concurrently(conn, index) -> bool:
+    """
+    PostgreSQL: CREATE INDEX CONCURRENTLY IF NOT EXISTS (트랜잭션 밖, AUTOCOMMIT 연결) → 새로 만들었으면 True
+
+    CONCURRENTLY 가 도중에 실패하면 INVALID 인덱스가 남고 IF NOT EXISTS 는 그걸 건너뛰므로 먼저 지우고 다시 만든다.
+    """
+    row = conn.execute(
+        text(
+            "SELECT i.indisvalid FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname = :name AND pg_table_is_visible(c.oid)"
+        ),
+        {"name": index.name}
+    ).first()
+    if row is not None and row.indisvalid:
+        return False
+    if row is not None:
+        conn.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS "{index.name}"')
+
+    ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=conn.dialect))
+    conn.exec_driver_sql(ddl.replace("INDEX", "INDEX CONCURRENTLY", 1))
+    return True
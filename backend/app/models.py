@@ -5,7 +5,7 @@ SQLAlchemy ORM 모델 정의
 Movie 클래스 → movies 테이블
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Float, Text, ForeignKey, Index, text
 # ForeignKey: 테이블 간의 관계를 정의하는데 사용
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -13,6 +13,17 @@ from app.database import Base
 
 class Movie(Base):
     __tablename__ = "movies"
+    __table_args__ = (
+        # 영화 목록: ORDER BY created_at DESC (id 는 같은 시각 정렬용)
+        Index("ix_movies_created_at_id", "created_at", "id"),
+        # 추천: review_count > 0 인 영화만 ORDER BY rating DESC
+        Index(
+            "ix_movies_rating_reviewed",
+            "rating",
+            postgresql_where=text("review_count > 0"),
+            sqlite_where=text("review_count > 0")
+        ),
+    )
 
     # 컬럼 정의
     id = Column(Integer, primary_key=True, index=True)
@@ -26,13 +37,40 @@ class Movie(Base):
     plot_summary = Column(Text)
     rating = Column(Float, default=0.0)
     review_count = Column(Integer, default=0)
+    # 평점 누적값 (리뷰 작성/삭제 시 SQL로 증감, rating = score_sum / scored_count)
+    score_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    scored_count = Column(Integer, nullable=False, default=0, server_default="0")  # 점수가 있는 리뷰 수 (pending 제외)
+    # 감성 라벨별 리뷰 수 (pending 은 review_count 에만 포함)
+    positive_count = Column(Integer, nullable=False, default=0, server_default="0")
+    negative_count = Column(Integer, nullable=False, default=0, server_default="0")
+    neutral_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # relationship
     reviews = relationship("Review", back_populates="movie", cascade="all, delete-orphan")
 
+    @property
+    def unscored_count(self):
+        """라벨만 있고 점수가 없어 평점에서 빠진 리뷰 수 (감성 사전이 답한 리뷰, pending 제외)"""
+        labeled = (self.positive_count or 0) + (self.negative_count or 0) + (self.neutral_count or 0)
+        return max(labeled - (self.scored_count or 0), 0)
+
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # 영화별 리뷰: WHERE movie_id = ? ORDER BY created_at DESC, 영화별 집계 (GROUP BY movie_id)
+        # 내림차순 정렬은 인덱스를 거꾸로 읽으므로 DESC 인덱스가 따로 필요 없음
+        Index("ix_reviews_movie_id_created_at_id", "movie_id", "created_at", "id"),
+        # 전체 리뷰 목록: ORDER BY created_at DESC
+        Index("ix_reviews_created_at_id", "created_at", "id"),
+        # 백필 워커: WHERE sentiment_label = 'pending' ORDER BY id (대기 중인 리뷰만 담김)
+        Index(
+            "ix_reviews_pending",
+            "id",
+            postgresql_where=text("sentiment_label = 'pending'"),
+            sqlite_where=text("sentiment_label = 'pending'")
+        ),
+    )
 
     # 컬럼 정의
     id = Column(Integer, primary_key=True, index=True)
@@ -45,9 +83,41 @@ class Review(Base):
     )
     author = Column(String(100), nullable=False)
     content = Column(Text, nullable=False)
-    sentiment_label = Column(String(20))  # 'positive', 'negative', 'neutral'
+    sentiment_label = Column(String(20))  # 'positive', 'negative', 'neutral', 'pending'
     sentiment_score = Column(Float)       # 0.0 ~ 1.0
+    model_version = Column(String(100), index=True)  # 점수를 매긴 모델 버전 (분석 안 했으면 NULL)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship (영화와의 관계 - 선택사항)
-    movie = relationship("Movie", back_populates="reviews")
\ No newline at end of file
+    movie = relationship("Movie", back_populates="reviews")
+
+class SentimentCacheEntry(Base):
+    __tablename__ = "sentiment_cache"
+
+    # 컬럼 정의
+    content_hash = Column(String(64), primary_key=True)  # sha256(모델 버전 + 정규화 텍스트)
+    model_version = Column(String(100), nullable=False)
+    sentiment_label = Column(String(20), nullable=False)
+    sentiment_score = Column(Float, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class RescoreCheckpoint(Base):
+    __tablename__ = "rescore_checkpoints"
+
+    # 컬럼 정의
+    job_name = Column(String(50), primary_key=True)
+    model_version = Column(String(100), nullable=False)   # 재채점 대상 모델 버전
+    last_review_id = Column(Integer, nullable=False, default=0)  # 여기까지 처리 완료 (keyset)
+    processed = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=False, default=0)    # 시작 시점의 대상 리뷰 수
+    status = Column(String(20), nullable=False, default="running")  # 'running', 'stats', 'done', 'failed'
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True))
+
+    # 실행 중인 프로세스 (여러 API 워커 / CLI 가 같은 체크포인트를 동시에 돌리지 않도록 DB 에서 잡음)
+    owner = Column(String(100))                           # 실행 중인 프로세스 (없으면 NULL)
+    heartbeat_at = Column(DateTime(timezone=True))        # 배치마다 갱신, 오래되면 다른 프로세스가 가져갈 수 있음
+    stop_requested = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    reviews_per_sec = Column(Float, nullable=False, default=0.0, server_default="0")
+    last_error = Column(String(500))
@@ -0,0 +1,75 @@
+"""
+목록 API 커서(keyset) 페이지네이션
+
+OFFSET 은 앞 페이지 행을 모두 읽고 버리므로 뒤 페이지일수록 느려진다.
+대신 마지막으로 보낸 행의 (created_at, id) 를 커서로 돌려주고,
+다음 요청은 WHERE (created_at, id) < (커서) ORDER BY created_at DESC, id DESC LIMIT n 으로
+인덱스(app/models.py 의 *_created_at_id)에서 바로 이어 읽는다. 몇 번째 페이지든 비용이 같다.
+
+응답 본문은 기존처럼 리스트이고, 다음 페이지 커서는 X-Next-Cursor 헤더로 보낸다.
+(마지막 페이지면 헤더 없음) 커서는 base64 문자열이며 내용에 의존하면 안 된다.
+"""
+
+import base64
+import json
+import os
+from datetime import datetime
+
+from fastapi import HTTPException, Response
+from sqlalchemy import String, literal, tuple_
+
+# 한 페이지 최대 행 수 (요청한 limit 이 더 커도 여기까지만)
+MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "100"))
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id) → 커서 문자열"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """커서 문자열 → (created_at, id), 잘못된 커서면 400"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def page_size(limit: int) -> int:
+    """요청한 limit 을 1 ~ MAX_PAGE_SIZE 로 제한"""
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def paginate(query, model, limit: int, cursor: str, response: Response, skip: int = 0):
+    """
+    최신순 (created_at DESC, id DESC) 한 페이지 조회 + 다음 페이지가 있으면 X-Next-Cursor 설정
+
+    skip 은 기존 클라이언트 호환용 (커서가 없을 때만 OFFSET 으로 적용)
+    """
+    limit = page_size(limit)
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        if query.session.get_bind().dialect.name == "sqlite":
+            # SQLite 는 created_at(CURRENT_TIMESTAMP)을 'YYYY-MM-DD HH:MM:SS' 문자열로 저장하므로 같은 형식으로 비교
+            # (DateTime 으로 바인딩하면 '.000000' 이 붙어 같은 시각의 행이 계속 커서보다 작게 비교됨)
+            created_at = literal(created_at.isoformat(sep=" "), String)
+        query = query.filter(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if not cursor and skip > 0:
+        query = query.offset(skip)
+
+    # 한 행 더 읽어서 다음 페이지가 있는지 확인
+    rows = query.limit(limit + 1).all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return rows
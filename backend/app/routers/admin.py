@@ -0,0 +1,113 @@
+"""
+운영자용 API 엔드포인트 (모델 버전 관리, 재채점)
+
+X-Admin-Token 헤더가 ADMIN_TOKEN 환경 변수와 같아야 한다.
+ADMIN_TOKEN 을 설정하지 않으면 모든 /admin 엔드포인트가 404 (토큰 없이 열리지 않음).
+"""
+
+import hmac
+import os
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+
+from app.services import model_registry
+from app.services.model_registry import model_activator
+from app.services.rescore import rescore_job
+from app.services.sentiment import get_active_version
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+def require_admin(x_admin_token: str = Header(None)):
+    """운영자 토큰 확인 (토큰이 설정되지 않았으면 운영자 API 자체를 닫음)"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(404, "Not Found")
+
+    # 비교 시간으로 토큰을 추측하지 못하도록 상수 시간 비교
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+        raise HTTPException(401, "Invalid admin token")
+
+
+# 라우터 생성
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)]
+)
+
+
+def _models_status():
+    registry = model_registry.load_registry()
+    active = get_active_version()
+
+    return {
+        "active": active,
+        "versions": [
+            {"version": version, "path": entry["path"], "active": version == active}
+            for version, entry in registry["versions"].items()
+        ],
+        **model_activator.status()
+    }
+
+
+@router.get("/models")
+def list_models():
+    """등록된 모델 버전과 활성 버전, 로드 진행 상태"""
+    return _models_status()
+
+
+@router.post("/models/{version}/activate", status_code=202)
+def activate_model(version: str, response: Response):
+    """
+    모델 버전 활성화
+
+    백그라운드에서 로드 + 워밍업한 뒤 활성 모델을 교체한다.
+    교체 전까지는 기존 모델이 요청을 처리한다. 진행 상태는 GET /admin/models 로 확인.
+    """
+    if model_registry.get_version(version) is None:
+        raise HTTPException(404, "Model version not found")
+
+    if version == get_active_version() and model_activator.loading is None:
+        response.status_code = 200
+        return _models_status()
+
+    if not model_activator.activate(version):
+        raise HTTPException(409, f"Model version {model_activator.loading} is already loading")
+
+    return _models_status()
+
+
+@router.get("/rescore")
+def get_rescore_status():
+    """재채점 진행 상태 (처리 개수, 처리량, 남은 시간)"""
+    return rescore_job.status()
+
+
+@router.post("/rescore", status_code=202)
+def start_rescore(restart: bool = False, rescore_all: bool = False):
+    """
+    활성 모델 버전으로 리뷰 재채점 시작
+
+    - 기본: 활성 버전으로 채점되지 않은 리뷰만, 체크포인트가 있으면 이어서 진행
+    - restart=true: 체크포인트를 버리고 처음부터
+    - rescore_all=true: 이미 활성 버전으로 채점된 리뷰도 다시
+    - 채점 대기(pending) 리뷰와 모델을 거치지 않은 짧은 중립 리뷰는 항상 제외 (백필 워커 담당)
+    """
+    if not rescore_job.start(restart=restart, rescore_all=rescore_all):
+        raise HTTPException(409, "Rescore job is already running")
+
+    return {"message": "Rescore job started"}
+
+
+@router.post("/rescore/stop", status_code=202)
+def stop_rescore():
+    """
+    재채점 중단 요청 (바로 반환)
+
+    다른 워커나 CLI 에서 실행 중이어도 체크포인트 행의 중단 요청을 보고
+    현재 배치까지 커밋하고 멈춘다 (다시 시작하면 이어서 진행).
+    멈췄는지는 GET /admin/rescore 의 running / stopping 으로 확인
+    """
+    if not rescore_job.stop():
+        raise HTTPException(409, "Rescore job is not running")
+    return rescore_job.status()
@@ -0,0 +1,41 @@
+"""
+운영 지표 API 엔드포인트
+"""
+
+from fastapi import APIRouter
+
+from app.database import engine
+from app.db_pool import pool_stats
+from app.services import lexicon
+from app.services.admission import admission_controller
+from app.services.sentiment_cache import sentiment_cache
+
+# 라우터 생성
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"]
+)
+
+
+@router.get("/sentiment-cache")
+def get_sentiment_cache_metrics():
+    """감성 분석 캐시 적중/미스 통계"""
+    return sentiment_cache.stats()
+
+
+@router.get("/sentiment-cascade")
+def get_sentiment_cascade_metrics():
+    """감성 사전 cascade 통계 (모델 없이 바로 답한 비율)"""
+    return lexicon.stats()
+
+
+@router.get("/sentiment-admission")
+def get_sentiment_admission_metrics():
+    """감성 분석 입장 제어 (동시 추론 수, 큐 길이, 대기 시간, 거부 수)"""
+    return admission_controller.stats()
+
+
+@router.get("/db-pool")
+def get_db_pool_metrics():
+    """DB 커넥션 풀 (사용 중 커넥션, overflow, checkout 대기 시간, 타임아웃 수 - 워커별)"""
+    return pool_stats(engine)
@@ -6,18 +6,22 @@ FastAPI 라우터 - 영화 관련 모든 API 엔드포인트 정의
 2. GET /movies/           - 전체 영화 목록 조회
 3. GET /movies/{movie_id} - 특정 영화 조회
 4. DELETE /movies/{movie_id} - 영화 삭제
+5. GET /movies/{movie_id}/sentiment-summary - 영화 감성 분포
+6. GET /movies/sentiment-summary?ids=1,2,3  - 여러 영화 감성 분포
+7. GET /movies/stats      - 전체 현황 (영화 / 리뷰 개수)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import requests
 import os
-from sqlalchemy import or_
+from sqlalchemy import case, func, or_
 from anthropic import Anthropic
 import json
 
 from app.database import get_db
+from app.pagination import MAX_PAGE_SIZE, paginate
 from .. import models, schemas
 from ..database import get_db
 from app.services.mcp_client import get_mcp_client
@@ -183,11 +187,99 @@ def create_movie_from_tmdb(tmdb_id: int, db: Session = Depends(get_db)):
 # 기존 영화 CRUD API
 # ========================================
 
+# 감성 분포 일괄 조회 시 한 번에 받는 최대 영화 수
+SUMMARY_MAX_IDS = 200
+
+
+def _summary_query(db: Session):
+    """감성 분포에 필요한 컬럼만 조회 (리뷰는 읽지 않음)"""
+    return db.query(
+        models.Movie.id,
+        models.Movie.review_count,
+        models.Movie.positive_count,
+        models.Movie.negative_count,
+        models.Movie.neutral_count,
+        models.Movie.scored_count,
+        models.Movie.rating
+    )
+
+
+def _to_summary(row) -> schemas.SentimentSummary:
+    review_count = row.review_count or 0
+    labeled = row.positive_count + row.negative_count + row.neutral_count
+    return schemas.SentimentSummary(
+        movie_id=row.id,
+        review_count=review_count,
+        positive_count=row.positive_count,
+        negative_count=row.negative_count,
+        neutral_count=row.neutral_count,
+        pending_count=max(review_count - labeled, 0),
+        scored_count=row.scored_count,
+        unscored_count=max(labeled - row.scored_count, 0),
+        rating=row.rating or 0.0
+    )
+
+
 @router.get("/", response_model=List[schemas.MovieResponse])
-def read_movies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """전체 영화 목록 조회"""
-    movies = db.query(models.Movie).order_by(models.Movie.created_at.desc()).offset(skip).limit(limit).all()
-    return movies
+def read_movies(
+    response: Response,
+    limit: int = Query(100, ge=1, description=f"페이지 크기 (최대 {MAX_PAGE_SIZE})"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    skip: int = Query(0, ge=0, deprecated=True, description="cursor 를 사용하세요"),
+    db: Session = Depends(get_db)
+):
+    """전체 영화 목록 조회 (최신순, 다음 페이지 커서는 X-Next-Cursor 헤더)"""
+    return paginate(db.query(models.Movie), models.Movie, limit, cursor, response, skip=skip)
+
+
+# /{movie_id} 보다 먼저 선언해야 "stats" / "sentiment-summary" 가 movie_id 로 잡히지 않음
+@router.get("/stats", response_model=schemas.CatalogStats)
+def read_catalog_stats(db: Session = Depends(get_db)):
+    """전체 현황 (목록을 끝까지 받아 세지 않도록 Movie 누적값을 한 번에 집계)"""
+    row = db.query(
+        func.count(models.Movie.id).label("movie_count"),
+        func.coalesce(func.sum(models.Movie.review_count), 0).label("review_count"),
+        func.coalesce(func.sum(case((models.Movie.review_count > 0, 1), else_=0)), 0).label("reviewed_movie_count"),
+        func.coalesce(func.sum(models.Movie.positive_count), 0).label("positive_count"),
+        func.coalesce(func.sum(models.Movie.negative_count), 0).label("negative_count"),
+        func.coalesce(func.sum(models.Movie.neutral_count), 0).label("neutral_count"),
+        func.coalesce(func.sum(models.Movie.scored_count), 0).label("scored_count"),
+        func.coalesce(func.avg(case((models.Movie.rating > 0, models.Movie.rating))), 0).label("average_rating")
+    ).one()
+
+    labeled = row.positive_count + row.negative_count + row.neutral_count
+    return schemas.CatalogStats(
+        movie_count=row.movie_count,
+        review_count=row.review_count,
+        reviewed_movie_count=row.reviewed_movie_count,
+        positive_count=row.positive_count,
+        negative_count=row.negative_count,
+        neutral_count=row.neutral_count,
+        pending_count=max(row.review_count - labeled, 0),
+        unscored_count=max(labeled - row.scored_count, 0),
+        average_rating=float(row.average_rating)
+    )
+
+
+@router.get("/sentiment-summary", response_model=List[schemas.SentimentSummary])
+def read_sentiment_summaries(
+    ids: str = Query(..., description="쉼표로 구분한 영화 ID (예: 1,2,3)"),
+    db: Session = Depends(get_db)
+):
+    """여러 영화의 감성 분포 (없는 영화 ID는 건너뜀)"""
+    try:
+        movie_ids = sorted({int(value) for value in ids.split(",") if value.strip()})
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+
+    if len(movie_ids) > SUMMARY_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"Too many ids (max {SUMMARY_MAX_IDS})")
+
+    if not movie_ids:
+        return []
+
+    rows = _summary_query(db).filter(models.Movie.id.in_(movie_ids)).order_by(models.Movie.id).all()
+    return [_to_summary(row) for row in rows]
 
 
 @router.get("/{movie_id}", response_model=schemas.MovieResponse)
@@ -199,6 +291,15 @@ def read_movie(movie_id: int, db: Session = Depends(get_db)):
     return movie
 
 
+@router.get("/{movie_id}/sentiment-summary", response_model=schemas.SentimentSummary)
+def read_sentiment_summary(movie_id: int, db: Session = Depends(get_db)):
+    """영화의 감성 분포 (긍정 / 부정 / 중립 / 분석 대기 개수)"""
+    row = _summary_query(db).filter(models.Movie.id == movie_id).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    return _to_summary(row)
+
+
 @router.post("/", response_model=schemas.MovieResponse, status_code=201)
 def create_movie(movie: schemas.MovieCreate, db: Session = Depends(get_db)):
     """영화 수동 추가"""
@@ -2,15 +2,38 @@
 리뷰 관련 API 엔드포인트
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+import json
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import SQLAlchemyError
+from typing import List, Optional
 
 from app.database import get_db
 from app.models import Review, Movie
-from app.schemas import ReviewCreate, ReviewResponse
-from app.services.sentiment import analyze_sentiment
+from app.pagination import MAX_PAGE_SIZE, paginate
+from app.schemas import ReviewCreate, ReviewResponse, BulkReviewError, BulkReviewResponse
+from app.services.admission import (
+    ADMISSION_ENABLED,
+    OVERLOAD_POLICY,
+    RETRY_AFTER,
+    AdmissionRejected,
+    admission_controller
+)
+from app.services.movie_stats import record_reviews
+from app.services.sentiment import (
+    PENDING_LABEL,
+    SENTIMENT_MODE,
+    analyze_sentiment_async,
+    analyze_sentiment_batch_async
+)
+
+# 대량 등록 시 한 번에 감성 분석 + INSERT + 커밋하는 리뷰 개수
+BULK_BATCH_SIZE = int(os.getenv("REVIEW_BULK_BATCH_SIZE", "500"))
 
 # 라우터 생성
 router = APIRouter(
@@ -19,154 +42,364 @@ router = APIRouter(
 )
 
 
-def update_movie_stats(movie_id: int, db: Session):
-    """영화의 평균 평점과 리뷰 개수 업데이트"""
-    # 해당 영화의 모든 리뷰 조회
-    reviews = db.query(Review).filter(Review.movie_id == movie_id).all()
-    
-    # 리뷰 개수
-    review_count = len(reviews)
-    
-    # 평균 감성 점수 계산
-    if review_count > 0:
-        valid_scores = [r.sentiment_score for r in reviews if r.sentiment_score is not None]
-        average_rating = sum(valid_scores) / len(valid_scores) if valid_scores else 0.0
-    else:
-        average_rating = 0.0
-    
-    # Movie 업데이트
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if movie:
-        movie.rating = round(average_rating, 4)
-        movie.review_count = review_count
+def _fail_batch(batch, error: SQLAlchemyError, db: Session, result: BulkReviewResponse):
+    """
+    DB 오류가 난 배치 롤백 + 배치의 모든 리뷰를 오류로 기록
+
+    앞 배치는 이미 커밋됐으므로 500 으로 끝내지 않고, 어느 리뷰가 빠졌는지 응답에 남긴 채 다음 배치를 계속한다.
+    (업로드 도중 영화가 삭제돼 FK 오류가 나는 경우 등)
+    """
+    db.rollback()
+    print(f"❌ 리뷰 대량 등록 배치 실패 ({len(batch)}개): {error}")
+    for index, _ in batch:
+        result.errors.append(BulkReviewError(index=index, detail=f"Database error: {error.__class__.__name__}"))
+
+
+def _validate_batch(batch, db: Session, result: BulkReviewResponse):
+    """영화가 없는 리뷰는 오류로 기록하고 저장할 (index, 리뷰) 만 반환"""
+    movie_ids = {review.movie_id for _, review in batch}
+    try:
+        existing = {
+            movie_id for (movie_id,) in
+            db.query(Movie.id).filter(Movie.id.in_(movie_ids)).all()
+        }
+    except SQLAlchemyError as e:
+        _fail_batch(batch, e, db, result)
+        return []
+
+    valid = []
+    for index, review in batch:
+        if review.movie_id in existing:
+            valid.append((index, review))
+        else:
+            result.errors.append(BulkReviewError(index=index, detail="Movie not found"))
+
+    return valid
+
+
+def _insert_batch(valid, sentiments, db: Session, result: BulkReviewResponse):
+    """분석된 리뷰 묶음을 일괄 INSERT → 영화 통계 1회 갱신 → 커밋 (DB 오류면 배치 전체를 오류로 기록)"""
+    # 영향받은 영화 누적값은 영화당 한 번씩 증감 (INSERT 와 같은 트랜잭션)
+    changes = {}
+    for (_, review), sentiment in zip(valid, sentiments):
+        changes.setdefault(review.movie_id, []).append((sentiment["label"], sentiment["score"]))
+    affected = sorted(changes)
+
+    try:
+        # 일괄 INSERT (executemany)
+        db.execute(
+            insert(Review),
+            [
+                {
+                    "movie_id": review.movie_id,
+                    "author": review.author,
+                    "content": review.content,
+                    "sentiment_label": sentiment["label"],
+                    "sentiment_score": sentiment["score"],
+                    "model_version": sentiment.get("model_version")
+                }
+                for (_, review), sentiment in zip(valid, sentiments)
+            ]
+        )
+
+        for movie_id in affected:
+            record_reviews(movie_id, changes[movie_id], db)
         db.commit()
+    except SQLAlchemyError as e:
+        _fail_batch(valid, e, db, result)
+        return
 
+    result.created += len(valid)
+    result.movie_ids = sorted(set(result.movie_ids) | set(affected))
 
-# API 1: 리뷰 작성
-@router.post("/", response_model=ReviewResponse, status_code=201)
-def create_review(review: ReviewCreate, db: Session = Depends(get_db)):
-    """새 리뷰 작성 (자동 감성 분석)"""
-    
-    # 1. 영화 존재 여부 확인
-    movie = db.query(Movie).filter(Movie.id == review.movie_id).first()
-    if movie is None:
-        raise HTTPException(404, "Movie not found")
-    
-    # 2. 감성 분석 수행
-    sentiment_result = analyze_sentiment(review.content)
-    
-    # 3. 리뷰 생성
+
+async def _score_batch(texts):
+    """배치 감성 분석 (지연 모드거나 추론 자리가 없으면 pending 으로 두고 백필 워커에 맡김)"""
+    pending = [{"label": PENDING_LABEL, "score": None} for _ in texts]
+    if SENTIMENT_MODE == "deferred":
+        return pending
+
+    if not ADMISSION_ENABLED:
+        return await analyze_sentiment_batch_async(texts)
+
+    try:
+        async with admission_controller.slot():
+            return await analyze_sentiment_batch_async(texts)
+    except AdmissionRejected:
+        # 스트림 도중이라 앞 배치는 이미 커밋됨 → 정책과 관계없이 지연 분석으로
+        return pending
+
+
+async def _ingest(batch, db: Session, result: BulkReviewResponse):
+    """
+    배치 등록
+
+    DB 작업(검증, INSERT + 통계)만 요청 스레드 풀에서 실행하고, 추론은 전용 스레드 풀에서 실행해
+    큰 업로드가 조회 API 가 쓰는 스레드를 오래 잡고 있지 않게 한다.
+    """
+    valid = await run_in_threadpool(_validate_batch, batch, db, result)
+    if not valid:
+        return
+
+    sentiments = await _score_batch([review.content for _, review in valid])
+    await run_in_threadpool(_insert_batch, valid, sentiments, db, result)
+
+
+async def _analyze(content: str):
+    """감성 분석 (입장 제어 사용 시 추론 자리를 얻은 뒤에만)"""
+    if not ADMISSION_ENABLED:
+        return await analyze_sentiment_async(content)
+
+    async with admission_controller.slot():
+        return await analyze_sentiment_async(content)
+
+
+async def _iter_ndjson(request: Request):
+    """NDJSON 요청 본문을 한 줄씩 스트리밍으로 읽기"""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+async def _iter_json_array(request: Request):
+    """JSON 배열 요청 본문을 항목 단위로 읽기"""
+    try:
+        payload = await request.json()
+    except json.JSONDecodeError:
+        raise HTTPException(400, "Invalid JSON body")
+
+    if not isinstance(payload, list):
+        raise HTTPException(400, "Request body must be a JSON array")
+
+    for item in payload:
+        yield item
+
+
+def _get_movie(movie_id: int, db: Session):
+    """영화 조회 (없으면 None)"""
+    return db.query(Movie).filter(Movie.id == movie_id).first()
+
+
+def _save_review(review: ReviewCreate, sentiment_result: dict, db: Session):
+    """리뷰 저장 + 영화 누적값 증감 (커밋 1회) 후 응답 스키마로 변환"""
     db_review = Review(
         movie_id=review.movie_id,
         author=review.author,
         content=review.content,
         sentiment_label=sentiment_result["label"],
-        sentiment_score=sentiment_result["score"]
+        sentiment_score=sentiment_result["score"],
+        model_version=sentiment_result.get("model_version")
     )
-    
-    # 4. DB 저장
+
     db.add(db_review)
+    record_reviews(review.movie_id, [(db_review.sentiment_label, db_review.sentiment_score)], db)
     db.commit()
     db.refresh(db_review)
-    
-    # 🔥 5. 영화 통계 업데이트
-    update_movie_stats(review.movie_id, db)
-    
-    return db_review
+
+    # 커밋으로 만료된 속성을 스레드 풀 안에서 미리 읽어둠
+    return ReviewResponse.model_validate(db_review)
+
+
+def _save_pending_review(review: ReviewCreate, db: Session):
+    """감성 분석 없이 'pending' 상태로 저장 (리뷰 개수만 +1, 커밋 1회)"""
+    db_review = Review(
+        movie_id=review.movie_id,
+        author=review.author,
+        content=review.content,
+        sentiment_label=PENDING_LABEL,
+        sentiment_score=None
+    )
+
+    db.add(db_review)
+    record_reviews(review.movie_id, [(PENDING_LABEL, None)], db)
+    db.commit()
+    db.refresh(db_review)
+
+    return ReviewResponse.model_validate(db_review)
+
+
+# API 1: 리뷰 작성
+@router.post("/", response_model=ReviewResponse, status_code=201)
+async def create_review(review: ReviewCreate, response: Response, db: Session = Depends(get_db)):
+    """
+    새 리뷰 작성 (자동 감성 분석)
+
+    DB 작업은 요청 스레드 풀에서, 감성 분석은 전용 스레드 풀에서 실행해
+    추론이 느려져도 다른 조회 API가 스레드를 기다리지 않게 한다.
+    SENTIMENT_MODE=deferred 이면 'pending'으로 저장하고 202를 반환한다.
+    추론 큐가 가득 차면 SENTIMENT_OVERLOAD_POLICY 에 따라
+    'pending'으로 저장하고 202(defer)를 반환하거나 503 + Retry-After(reject)를 반환한다.
+    """
+
+    # 1. 영화 존재 여부 확인
+    movie = await run_in_threadpool(_get_movie, review.movie_id, db)
+    if movie is None:
+        raise HTTPException(404, "Movie not found")
+
+    # 지연 모드: 저장만 하고 감성 분석은 백필 워커에 맡김
+    if SENTIMENT_MODE == "deferred":
+        response.status_code = 202
+        return await run_in_threadpool(_save_pending_review, review, db)
+
+    # 2. 감성 분석 수행 (전용 스레드 풀)
+    try:
+        sentiment_result = await _analyze(review.content)
+    except AdmissionRejected:
+        if OVERLOAD_POLICY == "defer":
+            response.status_code = 202
+            return await run_in_threadpool(_save_pending_review, review, db)
+        raise HTTPException(
+            503,
+            "Sentiment analysis is overloaded, retry later",
+            headers={"Retry-After": str(RETRY_AFTER)}
+        )
+
+    # 3. 리뷰 생성 + DB 저장 + 🔥 영화 통계 업데이트
+    return await run_in_threadpool(_save_review, review, sentiment_result, db)
+
+
+# API 1-1: 리뷰 대량 등록
+@router.post("/bulk", response_model=BulkReviewResponse, status_code=201)
+async def create_reviews_bulk(request: Request, db: Session = Depends(get_db)):
+    """
+    리뷰 대량 등록 (파트너 피드 등)
+
+    - Content-Type: application/json → 리뷰 객체의 JSON 배열
+    - Content-Type: application/x-ndjson → 한 줄에 리뷰 객체 하나 (스트리밍)
+    - REVIEW_BULK_BATCH_SIZE개 단위로 감성 분석 / INSERT / 통계 갱신 / 커밋
+    - 배치 저장 중 DB 오류가 나면 그 배치만 롤백하고 errors 에 기록한 뒤 다음 배치를 계속 (created 는 실제 저장된 개수)
+    """
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonl" in content_type:
+        items = _iter_ndjson(request)
+    else:
+        items = _iter_json_array(request)
+
+    result = BulkReviewResponse()
+    batch = []
+
+    index = 0
+    async for item in items:
+        try:
+            if isinstance(item, (bytes, str)):
+                item = json.loads(item)
+            batch.append((index, ReviewCreate.model_validate(item)))
+        except json.JSONDecodeError as e:
+            result.errors.append(BulkReviewError(index=index, detail=f"Invalid JSON: {e.msg}"))
+        except ValidationError as e:
+            detail = ", ".join(
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )
+            result.errors.append(BulkReviewError(index=index, detail=detail))
+        index += 1
+
+        if len(batch) >= BULK_BATCH_SIZE:
+            await _ingest(batch, db, result)
+            batch = []
+
+    if batch:
+        await _ingest(batch, db, result)
+
+    result.received = index
+    result.failed = len(result.errors)
+    result.errors.sort(key=lambda error: error.index)
+    return result
 
 
 # API 2: 전체 리뷰 조회 (최근 10개)
 @router.get("/", response_model=List[ReviewResponse])
 def get_reviews(
-    limit: int = 10,
-    skip: int = 0,
+    response: Response,
+    limit: int = Query(10, ge=1, description=f"페이지 크기 (최대 {MAX_PAGE_SIZE})"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    skip: int = Query(0, ge=0, deprecated=True, description="cursor 를 사용하세요"),
     db: Session = Depends(get_db)
 ):
-    """최근 리뷰 목록 조회"""
-    
-    reviews = db.query(Review)\
-                .order_by(Review.created_at.desc())\
-                .offset(skip)\
-                .limit(limit)\
-                .all()
-    
-    return reviews
+    """최근 리뷰 목록 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)"""
+    return paginate(db.query(Review), Review, limit, cursor, response, skip=skip)
 
 
 # API 3: 특정 영화 리뷰 조회
 @router.get("/movie/{movie_id}", response_model=List[ReviewResponse])
-def get_movie_reviews(movie_id: int, db: Session = Depends(get_db)):
-    """특정 영화의 모든 리뷰 조회"""
+def get_movie_reviews(
+    movie_id: int,
+    response: Response,
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, description=f"페이지 크기 (최대 {MAX_PAGE_SIZE})"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    db: Session = Depends(get_db)
+):
+    """특정 영화의 리뷰 조회 (최신순, 다음 페이지 커서는 X-Next-Cursor 헤더)"""
     
     # 영화 존재 확인
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
+    movie = db.query(Movie.id).filter(Movie.id == movie_id).first()
     if movie is None:
         raise HTTPException(404, "Movie not found")
     
-    # 리뷰 조회
-    reviews = db.query(Review)\
-                .filter(Review.movie_id == movie_id)\
-                .order_by(Review.created_at.desc())\
-                .all()
-    
-    return reviews
+    return paginate(db.query(Review).filter(Review.movie_id == movie_id), Review, limit, cursor, response)
 
 
 # API 4: 리뷰 삭제
 @router.delete("/{review_id}")
 def delete_review(review_id: int, db: Session = Depends(get_db)):
-    """리뷰 삭제"""
-    
-    # 리뷰 조회
-    review = db.query(Review).filter(Review.id == review_id).first()
-    
+    """리뷰 삭제 (삭제 + 영화 누적값 감소를 한 트랜잭션으로)"""
+
+    # 리뷰 조회 (PostgreSQL 은 행을 잠가 같은 리뷰를 동시에 지우는 요청을 줄 세움)
+    query = db.query(Review.movie_id, Review.sentiment_label, Review.sentiment_score).filter(Review.id == review_id)
+    if db.get_bind().dialect.name == "postgresql":
+        query = query.with_for_update()
+    review = query.first()
+
     if review is None:
         raise HTTPException(404, "Review not found")
-    
-    # 영화 ID 저장 (삭제 전에)
-    movie_id = review.movie_id
-    
-    # 삭제
-    db.delete(review)
+
+    # 다른 요청이 먼저 지웠으면 0행 → 누적값을 두 번 빼지 않음
+    deleted = db.execute(delete(Review).where(Review.id == review_id)).rowcount
+    if not deleted:
+        db.rollback()
+        raise HTTPException(404, "Review not found")
+
+    record_reviews(review.movie_id, [(review.sentiment_label, review.sentiment_score)], db, removed=True)
     db.commit()
     
-    # 🔥 영화 통계 업데이트
-    update_movie_stats(movie_id, db)
-    
     return {"message": "Review deleted successfully"}
 
 
 # API 5: 영화 평균 평점
 @router.get("/movie/{movie_id}/rating")
 def get_movie_rating(movie_id: int, db: Session = Depends(get_db)):
-    """영화의 평균 감성 점수 계산"""
-    
-    # 영화 존재 확인
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if movie is None:
+    """영화의 평균 감성 점수 (리뷰를 읽지 않고 영화의 누적값으로 계산)"""
+
+    # 영화 존재 확인 + 누적값 (행 하나만 읽으므로 리뷰 수와 무관)
+    stats = db.query(
+        Movie.review_count,
+        Movie.score_sum,
+        Movie.scored_count,
+        Movie.positive_count,
+        Movie.negative_count,
+        Movie.neutral_count
+    )\
+              .filter(Movie.id == movie_id)\
+              .first()
+    if stats is None:
         raise HTTPException(404, "Movie not found")
-    
-    # 리뷰 조회
-    reviews = db.query(Review)\
-                .filter(Review.movie_id == movie_id)\
-                .all()
-    
-    # 평균 계산
-    if len(reviews) == 0:
-        return {
-            "movie_id": movie_id,
-            "average_score": 0.0,
-            "review_count": 0
-        }
-    
-    valid_scores = [r.sentiment_score for r in reviews if r.sentiment_score is not None]
-    count = len(valid_scores)
-    total_score = sum(valid_scores)
-    
-    average = total_score / count if count > 0 else 0.0
-    
+
+    scored_count = stats.scored_count or 0
+    average = (stats.score_sum or 0.0) / scored_count if scored_count > 0 else 0.0
+
+    # 감성 사전이 답한 리뷰는 점수가 없어 평균에서 빠짐 → 몇 개가 빠졌는지 같이 알려줌
+    labeled = stats.positive_count + stats.negative_count + stats.neutral_count
+
     return {
         "movie_id": movie_id,
         "average_score": round(average, 2),
-        "review_count": len(reviews)
-    }
\ No newline at end of file
+        "review_count": stats.review_count or 0,
+        "scored_count": scored_count,
+        "unscored_count": max(labeled - scored_count, 0)
+    }
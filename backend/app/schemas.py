@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 class MovieBase(BaseModel):
@@ -23,14 +23,42 @@ class MovieCreate(MovieBase):  # 🔥 MovieBase 상속 추가!
 class MovieResponse(MovieBase):  # 🔥 MovieBase 상속 추가!
     """GET /movies/ 응답 시 사용. DB에서 조회한 데이터"""
     id: int
-    rating: float = Field(default=0.0, ge=0.0, le=1.0, description="평균 평점")
+    rating: float = Field(default=0.0, ge=0.0, le=1.0, description="평균 평점 (점수가 있는 리뷰만)")
     review_count: int = Field(default=0, ge=0, description="리뷰 개수")
+    scored_count: int = Field(default=0, ge=0, description="평점에 들어간 리뷰 개수")
+    unscored_count: int = Field(default=0, ge=0, description="점수가 없어 평점에서 빠진 리뷰 개수 (감성 사전 판정)")
     created_at: datetime
     
     class Config:
         from_attributes = True  # Pydantic v2
 
 
+class SentimentSummary(BaseModel):
+    """영화별 감성 분포 (Movie 에 누적된 값)"""
+    movie_id: int
+    review_count: int = Field(default=0, ge=0, description="리뷰 개수")
+    positive_count: int = Field(default=0, ge=0, description="긍정 리뷰 개수")
+    negative_count: int = Field(default=0, ge=0, description="부정 리뷰 개수")
+    neutral_count: int = Field(default=0, ge=0, description="중립 리뷰 개수")
+    pending_count: int = Field(default=0, ge=0, description="분석 대기 중인 리뷰 개수")
+    scored_count: int = Field(default=0, ge=0, description="평점에 들어간 리뷰 개수")
+    unscored_count: int = Field(default=0, ge=0, description="점수가 없어 평점에서 빠진 리뷰 개수 (감성 사전 판정)")
+    rating: float = Field(default=0.0, ge=0.0, le=1.0, description="평균 감성 점수 (점수가 있는 리뷰만)")
+
+
+class CatalogStats(BaseModel):
+    """전체 현황 (영화 / 리뷰 개수, Movie 누적값 합계)"""
+    movie_count: int = Field(default=0, ge=0, description="등록된 영화 수")
+    review_count: int = Field(default=0, ge=0, description="전체 리뷰 수")
+    reviewed_movie_count: int = Field(default=0, ge=0, description="리뷰가 있는 영화 수")
+    positive_count: int = Field(default=0, ge=0, description="긍정 리뷰 개수")
+    negative_count: int = Field(default=0, ge=0, description="부정 리뷰 개수")
+    neutral_count: int = Field(default=0, ge=0, description="중립 리뷰 개수")
+    pending_count: int = Field(default=0, ge=0, description="분석 대기 중인 리뷰 개수")
+    unscored_count: int = Field(default=0, ge=0, description="점수가 없어 평점에서 빠진 리뷰 개수 (감성 사전 판정)")
+    average_rating: float = Field(default=0.0, ge=0.0, le=1.0, description="평점 있는 영화의 평균 평점")
+
+
 class ReviewCreate(BaseModel):
     """리뷰 작성 요청 스키마"""
     movie_id: int = Field(..., gt=0, description="영화 ID")
@@ -44,14 +72,30 @@ class ReviewResponse(BaseModel):
     movie_id: int
     author: str
     content: str
-    sentiment_label: Optional[str] = Field(None, description="감성 라벨 (positive/negative/neutral)")
+    sentiment_label: Optional[str] = Field(None, description="감성 라벨 (positive/negative/neutral, 분석 대기 중이면 pending)")
     sentiment_score: Optional[float] = Field(None, ge=0.0, le=1.0, description="감성 점수")
+    model_version: Optional[str] = Field(None, description="점수를 매긴 모델 버전")
     created_at: datetime
     
     class Config:
         from_attributes = True
 
 
+class BulkReviewError(BaseModel):
+    """대량 등록 실패 항목"""
+    index: int = Field(..., description="입력에서의 위치 (0부터 시작)")
+    detail: str = Field(..., description="실패 사유")
+
+
+class BulkReviewResponse(BaseModel):
+    """리뷰 대량 등록 결과"""
+    received: int = Field(default=0, ge=0, description="받은 리뷰 개수")
+    created: int = Field(default=0, ge=0, description="저장된 리뷰 개수")
+    failed: int = Field(default=0, ge=0, description="실패한 리뷰 개수")
+    movie_ids: List[int] = Field(default_factory=list, description="통계가 갱신된 영화 ID")
+    errors: List[BulkReviewError] = Field(default_factory=list, description="실패 항목 목록")
+
+
 # ========================================
 # TMDB 전용 스키마
 # ========================================
@@ -0,0 +1,135 @@
+"""
+감성 분석 입장 제어 (admission control)
+
+동시에 추론하는 요청 수를 SENTIMENT_MAX_CONCURRENCY 로 제한하고,
+기다리는 요청도 SENTIMENT_MAX_QUEUE 개까지만 받는다.
+큐가 가득 차거나 SENTIMENT_QUEUE_TIMEOUT_MS 동안 자리가 나지 않으면 AdmissionRejected 를 올리고,
+호출하는 쪽이 정책(SENTIMENT_OVERLOAD_POLICY)에 따라 처리한다.
+- defer : 'pending' 으로 저장하고 백필 워커가 나중에 분석 (202)
+- reject: 503 + Retry-After
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+# 입장 제어 설정
+ADMISSION_ENABLED = os.getenv("SENTIMENT_ADMISSION", "false").lower() == "true"
+MAX_CONCURRENCY = int(os.getenv("SENTIMENT_MAX_CONCURRENCY", os.getenv("SENTIMENT_EXECUTOR_WORKERS", "16")))
+MAX_QUEUE = int(os.getenv("SENTIMENT_MAX_QUEUE", "64"))
+QUEUE_TIMEOUT_MS = float(os.getenv("SENTIMENT_QUEUE_TIMEOUT_MS", "2000"))  # 0 = 무제한 대기
+OVERLOAD_POLICY = os.getenv("SENTIMENT_OVERLOAD_POLICY", "defer").lower()
+RETRY_AFTER = int(os.getenv("SENTIMENT_RETRY_AFTER", "5"))
+
+# 대기 시간 통계에 쓰는 최근 요청 수
+WAIT_WINDOW = 1000
+
+
+class AdmissionRejected(Exception):
+    """추론 큐가 가득 차서 입장 거부 (reason: queue_full / timeout)"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionController:
+    """동시 추론 수 + 대기열 길이 제한 (이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY, max_queue: int = MAX_QUEUE, queue_timeout_ms: float = QUEUE_TIMEOUT_MS):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout_ms / 1000 if queue_timeout_ms > 0 else None
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.admitted = 0
+        self.rejected = {"queue_full": 0, "timeout": 0}
+
+        self._waits = deque(maxlen=WAIT_WINDOW)
+        self._semaphore = None
+        self._loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 만들어진 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def acquire(self):
+        """추론 자리 하나 확보 (못 하면 AdmissionRejected)"""
+        semaphore = self._get_semaphore()
+
+        if semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected["queue_full"] += 1
+            raise AdmissionRejected("queue_full")
+
+        started = time.perf_counter()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected["timeout"] += 1
+            raise AdmissionRejected("timeout")
+        finally:
+            self.waiting -= 1
+
+        self._waits.append((time.perf_counter() - started) * 1000)
+        self.in_flight += 1
+        self.admitted += 1
+
+    def release(self):
+        """추론 자리 반납"""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self):
+        """async with admission_controller.slot(): ..."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def busy(self) -> bool:
+        """요청이 자리를 기다리고 있거나 동시 추론 한도가 찼는지 (다른 스레드에서 읽기만 함)"""
+        return self.waiting > 0 or self.in_flight >= self.max_concurrency
+
+    def stats(self) -> dict:
+        """큐 길이 / 대기 시간 / 거부 통계"""
+        waits = sorted(self._waits)
+
+        def percentile(q):
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(round(q / 100 * (len(waits) - 1))))], 3)
+
+        return {
+            "enabled": ADMISSION_ENABLED,
+            "policy": OVERLOAD_POLICY,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "max_queue_depth": self.max_waiting,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "wait_ms": {
+                "mean": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "p50": percentile(50),
+                "p95": percentile(95),
+                "p99": percentile(99),
+                "max": round(waits[-1], 3) if waits else 0.0
+            }
+        }
+
+
+# 전역 입장 제어
+admission_controller = AdmissionController()
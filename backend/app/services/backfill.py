@@ -0,0 +1,144 @@
+"""
+지연 감성 분석 백필 워커
+
+SENTIMENT_MODE=deferred 일 때 리뷰는 'pending' 상태로 먼저 저장되고,
+이 워커가 백그라운드에서 pending 리뷰를 배치로 꺼내 점수를 매긴 뒤
+영향받은 영화의 누적 점수 / 라벨 분포를 배치당 한 번씩 증감한다.
+
+- 추론이 실패하면(모델 로드 실패 등) 배치를 롤백해서 리뷰를 pending 으로 남기고
+  SENTIMENT_BACKFILL_MAX_BACKOFF 까지 간격을 두 배씩 늘려 다시 시도한다.
+- 입장 제어(SENTIMENT_ADMISSION)를 켜면 요청이 추론 자리를 기다리는 동안은 쉰다.
+  (부하 때문에 pending 으로 미룬 작업이 곧바로 추론 스레드 풀을 다시 채우지 않도록)
+"""
+
+import os
+import threading
+
+from sqlalchemy.orm import Session
+
+from app.database import Session as SessionLocal
+from app.models import Review
+from app.services.admission import ADMISSION_ENABLED, admission_controller
+from app.services.movie_stats import record_reviews
+from app.services.sentiment import PENDING_LABEL, analyze_sentiment_batch
+
+# 백필 설정
+BACKFILL_BATCH_SIZE = int(os.getenv("SENTIMENT_BACKFILL_BATCH_SIZE", "64"))
+BACKFILL_INTERVAL = float(os.getenv("SENTIMENT_BACKFILL_INTERVAL", "1.0"))
+# 추론 실패 시 최대 재시도 간격 (초)
+BACKFILL_MAX_BACKOFF = float(os.getenv("SENTIMENT_BACKFILL_MAX_BACKOFF", "60"))
+
+
+def score_pending_reviews(db: Session, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """pending 리뷰 한 배치 점수 매기기 → 처리한 개수 반환"""
+    query = db.query(Review)\
+              .filter(Review.sentiment_label == PENDING_LABEL)\
+              .order_by(Review.id)\
+              .limit(batch_size)
+
+    # 여러 워커(프로세스)가 같은 행을 중복 처리하지 않도록 잠긴 행은 건너뜀
+    if db.get_bind().dialect.name == "postgresql":
+        query = query.with_for_update(skip_locked=True)
+
+    reviews = query.all()
+    if not reviews:
+        db.rollback()
+        return 0
+
+    # 실패를 중립으로 채우면 pending 리뷰가 영영 중립으로 굳으므로 예외를 그대로 올림 (호출자가 롤백)
+    results = analyze_sentiment_batch([review.content for review in reviews], strict=True)
+
+    changes = {}
+    for review, result in zip(reviews, results):
+        review.sentiment_label = result["label"]
+        review.sentiment_score = result["score"]
+        review.model_version = result.get("model_version")
+        changes.setdefault(review.movie_id, []).append((result["label"], result["score"]))
+
+    db.flush()
+
+    # pending 리뷰는 이미 review_count 에 들어있으므로 점수 / 라벨 몫만 증가
+    for movie_id in sorted(changes):
+        record_reviews(movie_id, changes[movie_id], db, count_reviews=False)
+    db.commit()
+
+    return len(reviews)
+
+
+class SentimentBackfillWorker:
+    """pending 리뷰를 주기적으로 처리하는 백그라운드 스레드"""
+
+    def __init__(self, batch_size: int = BACKFILL_BATCH_SIZE, interval: float = BACKFILL_INTERVAL):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.processed = 0
+        self.failures = 0
+        self.paused = 0
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """워커 시작"""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="sentiment-backfill",
+            daemon=True
+        )
+        self._thread.start()
+        print("🔄 감성 분석 백필 워커 시작")
+
+    def stop(self):
+        """워커 종료 (진행 중인 배치는 끝까지 처리)"""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        print("🛑 감성 분석 백필 워커 종료")
+
+    def run_once(self) -> int:
+        """한 배치 처리"""
+        db = SessionLocal()
+        try:
+            count = score_pending_reviews(db, self.batch_size)
+            self.processed += count
+            return count
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _run(self):
+        backoff = self.interval
+        while not self._stop.is_set():
+            # 요청이 추론 자리를 기다리는 중이면 요청 먼저
+            if ADMISSION_ENABLED and admission_controller.busy():
+                self.paused += 1
+                self._stop.wait(self.interval)
+                continue
+
+            try:
+                count = self.run_once()
+            except Exception as e:
+                # 리뷰는 pending 그대로 (run_once 에서 롤백), 간격을 늘려 재시도
+                self.failures += 1
+                print(f"❌ 감성 분석 백필 에러: {e} ({backoff:.1f}s 후 재시도)")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, BACKFILL_MAX_BACKOFF)
+                continue
+
+            backoff = self.interval
+            # 밀린 리뷰가 남아 있으면 바로 다음 배치, 아니면 잠시 대기
+            if count < self.batch_size:
+                self._stop.wait(self.interval)
+
+
+# 전역 워커
+backfill_worker = SentimentBackfillWorker()
@@ -0,0 +1,119 @@
+"""
+마이크로 배칭 스케줄러
+
+여러 요청 스레드에서 동시에 들어온 입력을 짧은 시간(max_wait_ms) 동안 모아서
+한 번의 배치 호출로 처리하고, 각 호출자에게 자기 결과만 돌려준다.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List
+
+
+class MicroBatcher:
+    """동시 요청을 모아 배치 단위로 처리하는 스케줄러"""
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        name: str = "micro-batcher"
+    ):
+        """
+        - process_batch: 입력 리스트를 받아 같은 순서의 결과 리스트를 반환하는 함수
+        - max_batch_size: 한 번에 처리할 최대 입력 개수
+        - max_wait_ms: 첫 입력 도착 후 배치를 채우기 위해 기다리는 최대 시간
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, item: Any) -> Future:
+        """입력 하나를 큐에 넣고 결과를 받을 Future 반환"""
+        if self._closed:
+            raise RuntimeError(f"{self.name} is closed")
+
+        self._ensure_started()
+
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def close(self):
+        """워커 스레드 종료 (남은 입력은 모두 처리한 뒤 종료)"""
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _ensure_started(self):
+        """워커 스레드 시작 (첫 요청 시 한 번만)"""
+        if self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=self.name,
+                    daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self, first) -> List[tuple]:
+        """첫 입력 이후 max_wait 동안 최대 max_batch_size개까지 모으기"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+            if entry is None:
+                # 종료 신호는 현재 배치를 처리한 뒤 반영
+                self._queue.put(None)
+                break
+
+            batch.append(entry)
+
+        return batch
+
+    def _run(self):
+        """워커 루프: 배치 수집 → 한 번에 처리 → 결과 분배"""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch = self._collect(first)
+            items = [item for item, _ in batch]
+
+            try:
+                results = self.process_batch(items)
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"batch result size mismatch: {len(results)} != {len(items)}"
+                    )
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
@@ -0,0 +1,284 @@
+"""
+공유 감성 분석 추론 프로세스
+
+uvicorn/gunicorn 워커가 여러 개일 때 워커마다 모델(+ 토크나이저)을 따로 올리면
+메모리가 워커 수만큼 늘어난다. SENTIMENT_ENGINE=remote 이면 워커는 모델을 올리지 않고
+이 프로세스 하나에 유닉스 소켓(multiprocessing.connection)으로 추론을 요청한다.
+
+- 서버: python -m app.services.inference_server
+- 워커: RemoteSentimentEngine (OnnxSentimentEngine 과 같은 predict / warmup 인터페이스)
+
+모델은 버전별로 서버에 한 번만 로드되고, 요청마다 버전을 함께 보내므로
+모델 교체(/admin/models) 중에도 워커마다 자기 활성 버전으로 추론한다.
+
+- 소켓 인증키(SENTIMENT_SOCKET_AUTHKEY)는 기본값이 없으며 서버와 워커 모두 필수
+- 컨테이너에서는 scripts/start.sh 가 서버와 uvicorn 을 함께 띄우고 둘 중 하나라도 죽으면 컨테이너를 종료
+- /ready 는 ping() 으로 서버 응답을 확인
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing.connection import Client, Listener
+
+# 소켓 설정
+SOCKET_PATH = os.getenv("SENTIMENT_SOCKET", "/tmp/movie_gpt_sentiment.sock")
+AUTHKEY = os.getenv("SENTIMENT_SOCKET_AUTHKEY", "").encode("utf-8")
+# 워커 시작 시 서버가 뜰 때까지 기다리는 최대 시간 (초)
+CONNECT_TIMEOUT = float(os.getenv("SENTIMENT_SOCKET_CONNECT_TIMEOUT", "60"))
+# 서버에 동시에 올려두는 모델 버전 수 (교체 중에는 이전 버전도 잠시 필요)
+MAX_LOADED_MODELS = int(os.getenv("SENTIMENT_SERVER_MAX_MODELS", "2"))
+# /ready 에서 서버 응답을 기다리는 최대 시간 (초)
+PING_TIMEOUT = float(os.getenv("SENTIMENT_SOCKET_PING_TIMEOUT", "2"))
+
+NOT_LOADED = "not_loaded"
+
+
+def _require_authkey(authkey: bytes = None) -> bytes:
+    """소켓 인증키 (설정하지 않았으면 에러, 코드에 박힌 기본 키는 쓰지 않음)"""
+    authkey = AUTHKEY if authkey is None else authkey
+    if not authkey:
+        raise RuntimeError("SENTIMENT_SOCKET_AUTHKEY is required for SENTIMENT_ENGINE=remote")
+    return authkey
+
+
+def ping(socket_path: str = SOCKET_PATH, authkey: bytes = None, timeout: float = PING_TIMEOUT) -> dict:
+    """추론 서버가 응답하는지 확인 → 서버 상태 (pid, 로드된 버전, RSS), 실패하면 예외"""
+    authkey = _require_authkey(authkey)
+    result = {}
+
+    def call():
+        try:
+            with Client(socket_path, family="AF_UNIX", authkey=authkey) as conn:
+                conn.send({"op": "stats"})
+                result["reply"] = conn.recv()
+        except Exception as e:
+            result["error"] = e
+
+    # 서버가 멈춰 있으면 인증 단계에서 블로킹되므로 별도 스레드에서 timeout 까지만 기다림
+    thread = threading.Thread(target=call, name="inference-ping", daemon=True)
+    thread.start()
+    thread.join(timeout)
+
+    if "error" in result:
+        raise result["error"]
+    if "reply" not in result:
+        raise TimeoutError(f"Inference server did not respond within {timeout}s")
+    return result["reply"]
+
+
+class RemoteSentimentEngine:
+    """추론 서버 클라이언트 (워커 프로세스용, 스레드 안전)"""
+
+    def __init__(
+        self,
+        version: str,
+        model_dir: str,
+        socket_path: str = SOCKET_PATH,
+        authkey: bytes = None,
+        connect_timeout: float = CONNECT_TIMEOUT
+    ):
+        self.version = version
+        self.model_dir = str(model_dir)
+        self.socket_path = socket_path
+        self.authkey = _require_authkey(authkey)
+        self.connect_timeout = connect_timeout
+
+        # Connection 은 스레드 안전하지 않으므로 스레드마다 하나씩 빌려 씀
+        self._idle = queue.LifoQueue()
+
+        self.load()
+
+    def _connect(self):
+        """서버 연결 (서버가 아직 안 떴으면 connect_timeout 까지 재시도)"""
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                return Client(self.socket_path, family="AF_UNIX", authkey=self.authkey)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.2)
+
+    def _call(self, message: dict) -> dict:
+        """요청 1건 왕복 (끊긴 연결이면 새로 연결해서 한 번 재시도)"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
+        try:
+            conn.send(message)
+            reply = conn.recv()
+        except (EOFError, OSError):
+            conn.close()
+            conn = self._connect()
+            conn.send(message)
+            reply = conn.recv()
+
+        self._idle.put(conn)
+        return reply
+
+    def _request(self, message: dict) -> dict:
+        reply = self._call({**message, "version": self.version})
+
+        # 서버가 재시작되어 모델이 없으면 다시 로드 요청 후 재시도
+        if reply.get("error") == NOT_LOADED:
+            self.load()
+            reply = self._call({**message, "version": self.version})
+
+        if "error" in reply:
+            raise RuntimeError(f"Inference server error: {reply['error']}")
+        return reply
+
+    def load(self):
+        """서버에 이 버전 모델 로드 요청 (이미 있으면 바로 반환)"""
+        reply = self._call({"op": "load", "version": self.version, "model_dir": self.model_dir})
+        if "error" in reply:
+            raise RuntimeError(f"Inference server error: {reply['error']}")
+
+    def predict(self, texts):
+        """텍스트 리스트 → [{"label": "LABEL_1", "score": 0.97}, ...]"""
+        if not texts:
+            return []
+        return self._request({"op": "predict", "texts": list(texts)})["outputs"]
+
+    def warmup(self, lengths=None, batch_sizes=(1,), text: str = None):
+        """서버 쪽 모델 워밍업"""
+        message = {"op": "warmup", "lengths": lengths, "batch_sizes": list(batch_sizes)}
+        if text:
+            message["text"] = text
+        self._request(message)
+
+    def stats(self) -> dict:
+        """서버 상태 (pid, 로드된 버전, RSS)"""
+        return self._call({"op": "stats"})
+
+    def __call__(self, texts):
+        return self.predict(texts)
+
+
+def _rss_mb() -> float:
+    """현재 프로세스 RSS (MB, Linux)"""
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+class InferenceServer:
+    """모델을 한 번만 로드하고 여러 워커의 추론 요청을 처리"""
+
+    def __init__(self, socket_path: str = SOCKET_PATH, authkey: bytes = None, max_models: int = MAX_LOADED_MODELS):
+        self.socket_path = socket_path
+        self.authkey = _require_authkey(authkey)
+        self.max_models = max(1, max_models)
+
+        self.models: "OrderedDict[str, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, version: str, model_dir: str):
+        """버전별 모델 로드 (없을 때만, 오래된 버전부터 내림)"""
+        from app.services.onnx_engine import ORT_INTRA_OP_THREADS, available_cpus, build_session_options
+        from app.services.sentiment import _load_onnx_engine
+
+        with self._lock:
+            if version in self.models:
+                self.models.move_to_end(version)
+                return
+
+            print(f"📦 [inference-server] 모델 로드 중: {version} ({model_dir})")
+            # 추론은 이 프로세스 하나에서만 하므로 코어를 워커 수로 나누지 않음
+            options = build_session_options(intra_op_threads=ORT_INTRA_OP_THREADS or available_cpus())
+            self.models[version] = _load_onnx_engine(model_dir, session_options=options)
+
+            while len(self.models) > self.max_models:
+                old_version, _ = self.models.popitem(last=False)
+                print(f"🗑️ [inference-server] 모델 내림: {old_version}")
+
+            print(f"✅ [inference-server] 모델 로드 완료: {version}")
+
+    def _dispatch(self, message: dict) -> dict:
+        op = message.get("op")
+
+        if op == "stats":
+            return {"pid": os.getpid(), "versions": list(self.models), "rss_mb": _rss_mb()}
+
+        if op == "load":
+            self.load(message["version"], message["model_dir"])
+            return {"version": message["version"]}
+
+        engine = self.models.get(message.get("version"))
+        if engine is None:
+            return {"error": NOT_LOADED}
+
+        if op == "predict":
+            return {"outputs": engine.predict(message["texts"])}
+
+        if op == "warmup":
+            kwargs = {"text": message["text"]} if "text" in message else {}
+            engine.warmup(message.get("lengths"), message.get("batch_sizes", (1,)), **kwargs)
+            return {}
+
+        return {"error": f"unknown op: {op}"}
+
+    def _handle(self, conn):
+        """연결 하나 처리 (워커 스레드 하나가 연결 하나를 계속 재사용)"""
+        with conn:
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+
+                try:
+                    reply = self._dispatch(message)
+                except Exception as e:
+                    reply = {"error": str(e)}
+
+                try:
+                    conn.send(reply)
+                except (EOFError, OSError):
+                    return
+
+    def serve_forever(self):
+        """소켓 열고 요청 대기"""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        with Listener(self.socket_path, family="AF_UNIX", authkey=self.authkey) as listener:
+            os.chmod(self.socket_path, 0o600)
+            print(f"🚀 [inference-server] 대기 중: {self.socket_path} (pid={os.getpid()})")
+
+            while True:
+                try:
+                    conn = listener.accept()
+                except Exception as e:
+                    # 인증 실패 등은 해당 연결만 버림
+                    print(f"⚠️ [inference-server] 연결 거부: {e}")
+                    continue
+
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+
+def main():
+    from app.services import model_registry
+
+    server = InferenceServer()
+
+    # 활성 버전은 첫 요청 전에 미리 로드
+    registry = model_registry.load_registry()
+    active = registry["active"]
+    server.load(active, registry["versions"][active]["path"])
+
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+한국어 감성 사전 기반 빠른 분류기 (cascade 1단계)
+
+"최고예요", "별로" 처럼 짧고 분명한 리뷰는 사전만으로 답하고,
+확신도가 기준(SENTIMENT_CASCADE_THRESHOLD)보다 낮으면 None 을 반환해 모델에 넘긴다.
+
+확신도 규칙:
+- 긍정/부정 표현 중 한쪽만 나와야 함 (둘 다 나오면 포기)
+- 부정어("안 ", "않", "못 ", ...)나 역접("지만", "는데", ...)이 있으면 포기
+- 짧을수록, 표현이 많이 나올수록 확신도가 높음
+
+사전 확신도는 모델 확률이 아니라 답할지 말지 정하는 기준일 뿐이므로 sentiment_score 로 저장하지 않는다.
+사전이 답한 리뷰는 라벨만 기록하고 점수는 None → 영화 평점(score_sum / scored_count)에 들어가지 않고
+라벨 분포(positive_count 등)에만 반영된다. cascade 를 켜도 평점이 사전 확신도 쪽으로 치우치지 않는다.
+대신 평점은 모델이 채점한 리뷰만으로 계산되므로, 빠진 리뷰 수를 API 가 unscored_count 로 함께 돌려준다
+(MovieResponse, /movies/{id}/sentiment-summary, /movies/stats, /reviews/movie/{id}/rating).
+"""
+
+import os
+import threading
+import unicodedata
+
+# cascade 설정
+CASCADE_ENABLED = os.getenv("SENTIMENT_CASCADE", "false").lower() == "true"
+CASCADE_THRESHOLD = float(os.getenv("SENTIMENT_CASCADE_THRESHOLD", "0.9"))
+# 이보다 긴 텍스트는 사전으로 판단하지 않음 (글자 수)
+CASCADE_MAX_LENGTH = int(os.getenv("SENTIMENT_CASCADE_MAX_LENGTH", "60"))
+
+# 사전 버전 (Review.model_version 에 기록, 사전을 고치면 올림)
+# v2: 사전 결과의 sentiment_score 를 비움 (v1 리뷰는 재채점 대상)
+LEXICON_VERSION = "lexicon-v2"
+
+POSITIVE_TERMS = (
+    "최고", "재밌", "재미있", "꿀잼", "추천", "강추", "감동", "명작", "대박", "인생영화",
+    "좋았", "좋아요", "좋네", "좋다", "좋은", "훌륭", "완벽", "멋지", "멋있", "볼만",
+    "만족", "행복", "짱", "웃겼", "몰입", "여운", "소름돋", "또 보고", "다시 보고"
+)
+
+NEGATIVE_TERMS = (
+    "별로", "최악", "노잼", "핵노잼", "지루", "재미없", "재미 없", "실망", "아깝", "낭비",
+    "졸작", "망작", "쓰레기", "비추", "짜증", "후회", "유치", "억지", "어이없", "엉망",
+    "지겹", "졸렸", "잤다", "불쾌", "답답", "구리"
+)
+
+# 의미를 뒤집거나 섞는 표현 (있으면 모델에 넘김)
+NEGATORS = ("안 ", "안좋", "않", "못 ", "못했", "없지", "아니", "말고")
+CONTRASTS = ("지만", "는데", "그런데", "근데", "하지만", "그러나", "반면", "빼고", "?")
+
+# 통계
+_stats_lock = threading.Lock()
+_stats = {"checked": 0, "short_circuited": 0}
+
+
+def _normalize(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def score_text(text: str):
+    """사전 점수 → (label, confidence) 또는 판단 불가 시 None"""
+    text = _normalize(text)
+    if not text or len(text) > CASCADE_MAX_LENGTH:
+        return None
+
+    if any(token in text for token in NEGATORS + CONTRASTS):
+        return None
+
+    positive = sum(text.count(term) for term in POSITIVE_TERMS)
+    negative = sum(text.count(term) for term in NEGATIVE_TERMS)
+
+    if (positive > 0) == (negative > 0):
+        return None
+
+    hits = positive or negative
+    # 기본 0.9, 표현이 더 나올수록 +0.03, 20자를 넘으면 길이에 따라 깎음
+    confidence = min(0.99, 0.9 + 0.03 * (hits - 1))
+    if len(text) > 20:
+        confidence *= max(0.7, 1 - (len(text) - 20) / 200)
+
+    return ("positive" if positive else "negative"), round(confidence, 4)
+
+
+def classify(text: str, threshold: float = CASCADE_THRESHOLD):
+    """확신도가 threshold 이상이면 감성 결과, 아니면 None (모델로 넘김)"""
+    scored = score_text(text)
+    answered = scored is not None and scored[1] >= threshold
+
+    with _stats_lock:
+        _stats["checked"] += 1
+        if answered:
+            _stats["short_circuited"] += 1
+
+    if not answered:
+        return None
+
+    # 점수 없음 = 평점 집계 제외 (모듈 설명 참고)
+    return {
+        "label": scored[0],
+        "score": None,
+        "model_version": LEXICON_VERSION
+    }
+
+
+def stats():
+    """cascade 통계 (사전으로 바로 답한 비율)"""
+    with _stats_lock:
+        checked = _stats["checked"]
+        short_circuited = _stats["short_circuited"]
+
+    return {
+        "enabled": CASCADE_ENABLED,
+        "threshold": CASCADE_THRESHOLD,
+        "lexicon_version": LEXICON_VERSION,
+        "checked": checked,
+        "short_circuited": short_circuited,
+        "short_circuit_rate": round(short_circuited / checked, 4) if checked else 0.0
+    }
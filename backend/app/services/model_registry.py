@@ -0,0 +1,146 @@
+"""
+감성 분석 모델 레지스트리
+
+이름 붙은 모델 버전(버전 → 모델 디렉토리)을 관리하고,
+새 버전을 백그라운드에서 로드 + 워밍업한 뒤 활성 모델을 원자적으로 교체한다.
+교체 전까지는 기존 모델이 계속 요청을 처리하므로 요청이 끊기지 않는다.
+
+레지스트리 파일 (SENTIMENT_MODEL_REGISTRY, 기본 app/models/registry.json):
+{
+    "active": "korean_sentiment-int8",
+    "versions": {
+        "korean_sentiment-int8": {"path": "app/models/sentiment"},
+        "korean_sentiment-static": {"path": "app/models/variants/static-int8"}
+    }
+}
+
+파일이 없으면 SENTIMENT_MODEL_VERSION → app/models/sentiment 하나만 등록된 것으로 본다.
+활성화 요청을 받은 워커가 교체를 끝내면 레지스트리 파일의 active 값을 바꾸고,
+나머지 워커는 추론할 때 파일 수정 시각(mtime)을 SENTIMENT_REGISTRY_SYNC_SECONDS 간격으로 확인해서
+active 가 바뀌었으면 같은 방식(백그라운드 로드 → 교체)으로 따라간다. (sentiment.sync_active_version)
+워커끼리 같은 레지스트리 파일을 봐야 하므로 컨테이너가 여러 개면 파일을 공유 볼륨에 둔다.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# 레지스트리 설정
+REGISTRY_PATH = Path(os.getenv("SENTIMENT_MODEL_REGISTRY", "app/models/registry.json"))
+DEFAULT_MODEL_DIR = "app/models/sentiment"
+
+# 모델 버전 (캐시 키와 Review.model_version 에 기록)
+DEFAULT_VERSION = os.getenv("SENTIMENT_MODEL_VERSION", "korean_sentiment-int8")
+
+# 다른 워커의 활성화를 확인하는 간격 (초)
+SYNC_INTERVAL = float(os.getenv("SENTIMENT_REGISTRY_SYNC_SECONDS", "5"))
+
+_registry_lock = threading.Lock()
+
+
+def load_registry() -> dict:
+    """레지스트리 파일 읽기 (없으면 기본 버전 하나)"""
+    registry = {
+        "active": DEFAULT_VERSION,
+        "versions": {DEFAULT_VERSION: {"path": DEFAULT_MODEL_DIR}}
+    }
+
+    if REGISTRY_PATH.exists():
+        with open(REGISTRY_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        registry["versions"].update(data.get("versions", {}))
+        registry["active"] = data.get("active", registry["active"])
+
+    return registry
+
+
+def registry_mtime():
+    """레지스트리 파일 수정 시각 (ns, 파일이 없으면 None)"""
+    try:
+        return REGISTRY_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def get_version(version: str):
+    """버전 정보 조회 (없으면 None)"""
+    return load_registry()["versions"].get(version)
+
+
+def save_active(version: str):
+    """활성 버전을 레지스트리 파일에 기록 (재시작 후에도 유지)"""
+    with _registry_lock:
+        registry = load_registry()
+        registry["active"] = version
+
+        tmp_path = REGISTRY_PATH.with_suffix(f".{os.getpid()}.tmp")
+        REGISTRY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(registry, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, REGISTRY_PATH)
+
+
+class ModelActivator:
+    """새 모델 버전을 백그라운드에서 로드 / 워밍업 / 교체"""
+
+    def __init__(self):
+        self.loading = None
+        self.last_error = None
+        self.last_activated_at = None
+
+        self._lock = threading.Lock()
+
+    def activate(self, version: str, persist: bool = True) -> bool:
+        """
+        버전 활성화 시작 (이미 로드 중이면 False)
+
+        persist=False: 다른 워커가 이미 레지스트리에 기록한 버전을 따라가는 경우 (파일은 그대로)
+        """
+        with self._lock:
+            if self.loading is not None:
+                return False
+            self.loading = version
+            self.last_error = None
+
+        threading.Thread(
+            target=self._run,
+            args=(version, persist),
+            name="sentiment-model-activator",
+            daemon=True
+        ).start()
+        return True
+
+    def _run(self, version: str, persist: bool):
+        from app.services.sentiment import load_model, set_active_model, warmup_analyzer
+
+        try:
+            print(f"📦 모델 버전 로드 중: {version}")
+            model = load_model(version)
+            warmup_analyzer(model.analyzer)
+
+            # 참조 교체 한 번으로 전환 (진행 중인 배치는 기존 모델로 끝까지 처리)
+            set_active_model(model)
+            if persist:
+                save_active(version)
+
+            self.last_activated_at = time.time()
+            print(f"✅ 모델 버전 전환 완료: {version}")
+        except Exception as e:
+            self.last_error = f"{version}: {e}"
+            print(f"❌ 모델 버전 전환 실패: {version} ({e})")
+        finally:
+            with self._lock:
+                self.loading = None
+
+    def status(self) -> dict:
+        """로드 진행 상태"""
+        return {
+            "loading": self.loading,
+            "last_error": self.last_error,
+            "last_activated_at": self.last_activated_at
+        }
+
+
+# 전역 활성화 관리자
+model_activator = ModelActivator()
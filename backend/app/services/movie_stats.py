@@ -0,0 +1,209 @@
+"""
+영화 통계 (평균 감성 점수, 리뷰 개수, 감성 라벨 분포) 갱신
+
+리뷰를 쓰거나 지울 때는 Movie 의 누적값(review_count, score_sum, scored_count, 라벨별 개수)을
+UPDATE ... SET x = x + ? 한 번으로 증감하고 rating 도 같은 문장에서 다시 계산한다.
+rating 은 어느 경로(증감 / refresh / reconcile)든 같은 SQL 식(rating_expression, 소수 4자리)으로
+계산하므로 같은 누적값이면 같은 값이 저장된다.
+리뷰를 전부 다시 읽지 않으므로 리뷰 수와 상관없이 O(1)이고, 리뷰 INSERT/DELETE 와
+같은 트랜잭션에서 실행되므로 둘 중 하나만 반영되는 일이 없다.
+
+여러 영화를 한 트랜잭션에서 고칠 때는 항상 id 순서로 UPDATE 해서 (호출자가 정렬)
+동시에 실행되는 요청끼리 교착 상태에 빠지지 않게 한다.
+
+누적값이 어긋났을 때(수동 SQL 수정, 이전 버전 데이터 등)는 reconcile_movie_stats 로
+실제 리뷰 집계와 비교해 고친다. (scripts/reconcile_movie_stats.py)
+"""
+
+from collections import Counter
+
+from sqlalchemy import Numeric, case, cast, func, update
+from sqlalchemy.orm import Session
+
+from app.models import Review, Movie
+
+# 누적 점수 합 비교 허용 오차 (부동소수점 누적 오차)
+SCORE_TOLERANCE = 1e-6
+
+# 평점 소수 자릿수 / 비교 허용 오차 (누적 오차로 마지막 자리가 반올림 경계를 넘는 경우)
+RATING_DECIMALS = 4
+RATING_TOLERANCE = 10 ** -RATING_DECIMALS
+
+# 감성 라벨 → Movie 개수 컬럼 (pending 등 다른 라벨은 세지 않음)
+LABEL_COLUMNS = {
+    "positive": "positive_count",
+    "negative": "negative_count",
+    "neutral": "neutral_count"
+}
+
+# 집계 / 비교 대상 컬럼
+STAT_FIELDS = ("review_count", "score_sum", "scored_count", *LABEL_COLUMNS.values())
+
+
+def rating_expression(score_sum, scored_count):
+    """평점 SQL 식 (PostgreSQL 의 round 는 numeric 만 받으므로 cast)"""
+    return case(
+        (scored_count > 0, func.round(cast(score_sum / scored_count, Numeric), RATING_DECIMALS)),
+        else_=0.0
+    )
+
+
+def expected_rating(score_sum: float, scored_count: int) -> float:
+    """집계값으로 계산한 평점 (reconcile 비교용, rating_expression 과 같은 반올림)"""
+    return round(score_sum / scored_count, RATING_DECIMALS) if scored_count else 0.0
+
+
+def adjust_movie_stats(
+    movie_id: int,
+    db: Session,
+    review_delta: int = 0,
+    score_delta: float = 0.0,
+    scored_delta: int = 0,
+    label_deltas: dict = None
+):
+    """영화 누적값을 원자적으로 증감하고 평점 재계산 (커밋은 호출자가)"""
+    values = {}
+    for label, delta in (label_deltas or {}).items():
+        column = LABEL_COLUMNS.get(label)
+        if column and delta:
+            values[column] = getattr(Movie, column) + delta
+
+    if not (review_delta or score_delta or scored_delta or values):
+        return
+
+    # SET 절의 컬럼 참조는 UPDATE 전 값이므로 새 평점도 같은 문장에서 계산
+    score_sum = Movie.score_sum + score_delta
+    scored_count = Movie.scored_count + scored_delta
+
+    db.execute(
+        update(Movie)
+        .where(Movie.id == movie_id)
+        .values(
+            review_count=Movie.review_count + review_delta,
+            score_sum=score_sum,
+            scored_count=scored_count,
+            rating=rating_expression(score_sum, scored_count),
+            **values
+        )
+    )
+
+
+def record_reviews(movie_id: int, sentiments, db: Session, removed: bool = False, count_reviews: bool = True):
+    """
+    리뷰 추가(removed=True 면 삭제)분 반영
+
+    sentiments: 리뷰별 (sentiment_label, sentiment_score) - pending 은 (PENDING_LABEL, None)
+    count_reviews=False: 이미 review_count 에 들어있는 pending 리뷰를 채점한 경우 (점수 / 라벨만 반영)
+    """
+    sign = -1 if removed else 1
+    scored = [score for _, score in sentiments if score is not None]
+    labels = Counter(label for label, _ in sentiments)
+
+    adjust_movie_stats(
+        movie_id,
+        db,
+        review_delta=sign * len(sentiments) if count_reviews else 0,
+        score_delta=sign * sum(scored),
+        scored_delta=sign * len(scored),
+        label_deltas={label: sign * count for label, count in labels.items()}
+    )
+
+
+def lock_movies(movie_ids, db: Session):
+    """영화 행을 id 순서로 잠금 (PostgreSQL, 트랜잭션 끝까지 다른 증감이 기다림)"""
+    if movie_ids and db.get_bind().dialect.name == "postgresql":
+        db.query(Movie.id)\
+          .filter(Movie.id.in_(movie_ids))\
+          .order_by(Movie.id)\
+          .with_for_update()\
+          .all()
+
+
+def _aggregate(movie_ids, db: Session) -> dict:
+    """실제 리뷰 집계 → {movie_id: {STAT_FIELDS 컬럼: 값}}"""
+    rows = db.query(
+        Review.movie_id,
+        func.count(Review.id),
+        func.sum(Review.sentiment_score),
+        func.count(Review.sentiment_score),
+        *[
+            func.sum(case((Review.sentiment_label == label, 1), else_=0))
+            for label in LABEL_COLUMNS
+        ]
+    ).filter(Review.movie_id.in_(movie_ids))\
+     .group_by(Review.movie_id)\
+     .all()
+
+    stats = {movie_id: {**dict.fromkeys(STAT_FIELDS, 0), "score_sum": 0.0} for movie_id in movie_ids}
+    for movie_id, *values in rows:
+        stats[movie_id] = {field: int(value or 0) for field, value in zip(STAT_FIELDS, values)}
+        stats[movie_id]["score_sum"] = float(values[1] or 0.0)
+    return stats
+
+
+def refresh_movie_stats(movie_ids, db: Session):
+    """여러 영화의 누적값과 평점을 집계 쿼리 한 번으로 다시 계산 (커밋은 호출자가)"""
+    if not movie_ids:
+        return
+
+    # 집계한 뒤 덮어쓰는 사이에 들어온 증감이 사라지지 않도록 먼저 잠금
+    movie_ids = sorted(movie_ids)
+    lock_movies(movie_ids, db)
+    stats = _aggregate(movie_ids, db)
+
+    db.execute(
+        update(Movie),
+        [{"id": movie_id, **values} for movie_id, values in stats.items()]
+    )
+    # 평점은 증감 경로와 같은 SQL 식으로 (파이썬 round 와 DB round 결과가 다를 수 있음)
+    db.execute(
+        update(Movie)
+        .where(Movie.id.in_(movie_ids))
+        .values(rating=rating_expression(Movie.score_sum, Movie.scored_count))
+    )
+
+
+def reconcile_movie_stats(db: Session, batch_size: int = 500, fix: bool = True, progress=None):
+    """저장된 누적값을 실제 리뷰 집계와 비교해 어긋난 영화 목록 반환 (fix=True 면 고침)"""
+    drifted = []
+    last_id = 0
+    checked = 0
+
+    while True:
+        movies = db.query(Movie.id, Movie.rating, *[getattr(Movie, field) for field in STAT_FIELDS])\
+            .filter(Movie.id > last_id)\
+            .order_by(Movie.id)\
+            .limit(batch_size)\
+            .all()
+        if not movies:
+            break
+
+        actual = _aggregate([movie.id for movie in movies], db)
+        chunk = []
+        for movie in movies:
+            stored = {field: getattr(movie, field) for field in STAT_FIELDS}
+            expected = actual[movie.id]
+            rating = expected_rating(expected["score_sum"], expected["scored_count"])
+            if any(
+                abs((stored[field] or 0) - expected[field]) > (SCORE_TOLERANCE if field == "score_sum" else 0)
+                for field in STAT_FIELDS
+            ) or abs((movie.rating or 0.0) - rating) > RATING_TOLERANCE + SCORE_TOLERANCE:
+                chunk.append(movie.id)
+                drifted.append({
+                    "movie_id": movie.id,
+                    "stored": {**stored, "rating": movie.rating},
+                    "actual": {**expected, "rating": rating}
+                })
+
+        if fix and chunk:
+            refresh_movie_stats(chunk, db)
+            db.commit()
+        else:
+            db.rollback()
+
+        checked += len(movies)
+        last_id = movies[-1].id
+        if progress:
+            progress(f"🔎 {checked}개 영화 확인, 불일치 {len(drifted)}개")
+
+    return drifted
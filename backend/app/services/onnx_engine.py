@@ -0,0 +1,437 @@
+"""
+경량 감성 분석 추론 엔진
+
+transformers pipeline 없이
+- tokenizers (Rust) 로 tokenizer.json 로드
+- onnxruntime.InferenceSession 으로 직접 추론
+- NumPy 로 softmax 후처리
+
+pipeline("sentiment-analysis") 와 같은 라벨/점수를 반환한다.
+(DB, FastAPI 의존성이 없어 scripts/ 에서도 그대로 사용 가능)
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import platform
+import threading
+from pathlib import Path
+
+import numpy as np
+import onnxruntime as ort
+from tokenizers import Tokenizer
+
+# 우선순위대로 찾는 모델 파일 이름
+MODEL_FILE_CANDIDATES = ["model_quantized.onnx", "model.onnx"]
+
+# 토큰 길이 버킷 경계 (같은 버킷끼리만 묶어서 그 안의 최대 길이까지만 패딩)
+DEFAULT_LENGTH_BUCKETS = (16, 32, 64, 128, 256, 512)
+
+# 긴 리뷰 윈도우 결과 합치는 방법
+# - weighted_mean: 윈도우 토큰 수로 가중 평균한 확률
+# - max_confidence: 가장 확신이 큰 윈도우의 확률
+CHUNK_STRATEGIES = ("weighted_mean", "max_confidence")
+
+# ONNX Runtime 세션 설정
+# intra-op 스레드 0 = 자동 (사용 가능한 코어 수 / 워커 프로세스 수)
+ORT_INTRA_OP_THREADS = int(os.getenv("ORT_INTRA_OP_THREADS", "0"))
+ORT_INTER_OP_THREADS = int(os.getenv("ORT_INTER_OP_THREADS", "1"))
+ORT_GRAPH_OPTIMIZATION = os.getenv("ORT_GRAPH_OPTIMIZATION", "all").lower()
+ORT_EXECUTION_MODE = os.getenv("ORT_EXECUTION_MODE", "sequential").lower()
+ORT_ENABLE_MEM_ARENA = os.getenv("ORT_ENABLE_MEM_ARENA", "true").lower() == "true"
+ORT_ENABLE_MEM_PATTERN = os.getenv("ORT_ENABLE_MEM_PATTERN", "true").lower() == "true"
+ORT_ALLOW_SPINNING = os.getenv("ORT_ALLOW_SPINNING", "true").lower() == "true"
+
+# 최적화된 그래프 캐시 (첫 로드 시 저장 → 이후 시작 시 그래프 최적화 생략)
+ORT_OPTIMIZED_MODEL_CACHE = os.getenv("ORT_OPTIMIZED_MODEL_CACHE", "true").lower() == "true"
+ORT_CACHE_DIR = os.getenv("ORT_CACHE_DIR", "")
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+}
+
+EXECUTION_MODES = {
+    "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": ort.ExecutionMode.ORT_PARALLEL
+}
+
+
+def find_model_file(model_dir: Path) -> Path:
+    """모델 디렉토리에서 ONNX 파일 찾기"""
+    for name in MODEL_FILE_CANDIDATES:
+        path = model_dir / name
+        if path.exists():
+            return path
+
+    candidates = sorted(model_dir.glob("*.onnx"))
+    if candidates:
+        return candidates[0]
+
+    raise FileNotFoundError(f"ONNX model not found in {model_dir}")
+
+
+def available_cpus() -> int:
+    """이 프로세스가 쓸 수 있는 CPU 개수 (컨테이너 CPU 제한 반영)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def default_intra_op_threads() -> int:
+    """워커 프로세스끼리 코어를 나눠 쓰도록 스레드 수 계산"""
+    workers = int(os.getenv("WEB_CONCURRENCY", "1") or 1)
+    return max(1, available_cpus() // max(1, workers))
+
+
+def build_session_options(
+    intra_op_threads: int = None,
+    inter_op_threads: int = None,
+    graph_optimization: str = None,
+    execution_mode: str = None
+) -> ort.SessionOptions:
+    """환경 변수 기반 SessionOptions (인자로 개별 값 덮어쓰기 가능)"""
+    intra = ORT_INTRA_OP_THREADS if intra_op_threads is None else intra_op_threads
+    inter = ORT_INTER_OP_THREADS if inter_op_threads is None else inter_op_threads
+    level = (graph_optimization or ORT_GRAPH_OPTIMIZATION).lower()
+    mode = (execution_mode or ORT_EXECUTION_MODE).lower()
+
+    if level not in GRAPH_OPTIMIZATION_LEVELS:
+        raise ValueError(f"Unknown ORT_GRAPH_OPTIMIZATION: {level}")
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"Unknown ORT_EXECUTION_MODE: {mode}")
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = intra or default_intra_op_threads()
+    options.inter_op_num_threads = inter
+    options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVELS[level]
+    options.execution_mode = EXECUTION_MODES[mode]
+    options.enable_cpu_mem_arena = ORT_ENABLE_MEM_ARENA
+    options.enable_mem_pattern = ORT_ENABLE_MEM_PATTERN
+    options.add_session_config_entry(
+        "session.intra_op.allow_spinning", "1" if ORT_ALLOW_SPINNING else "0"
+    )
+
+    return options
+
+
+def _optimized_model_path(model_path: Path, options: ort.SessionOptions, cache_dir: Path) -> Path:
+    """최적화 그래프 캐시 파일 경로 (원본 모델/최적화 수준/ORT 버전/CPU 가 바뀌면 새 파일)"""
+    stat = model_path.stat()
+    fingerprint = "|".join([
+        model_path.name,
+        str(stat.st_size),
+        str(int(stat.st_mtime)),
+        str(int(options.graph_optimization_level)),
+        ort.__version__,
+        platform.machine()
+    ])
+    digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{model_path.stem}.{digest}.optimized.onnx"
+
+
+def create_session(
+    model_path,
+    options: ort.SessionOptions = None,
+    cache_dir=None,
+    use_cache: bool = None
+) -> ort.InferenceSession:
+    """
+    InferenceSession 생성
+
+    캐시 사용 시 첫 로드에서 최적화된 그래프를 저장해두고,
+    다음 시작부터는 저장된 그래프를 최적화 없이 바로 로드한다.
+    """
+    model_path = Path(model_path)
+    options = options or build_session_options()
+    providers = ["CPUExecutionProvider"]
+
+    use_cache = ORT_OPTIMIZED_MODEL_CACHE if use_cache is None else use_cache
+    if not use_cache or options.graph_optimization_level == ort.GraphOptimizationLevel.ORT_DISABLE_ALL:
+        return ort.InferenceSession(str(model_path), options, providers=providers)
+
+    cache_dir = Path(cache_dir or ORT_CACHE_DIR or model_path.parent / ".ort_cache")
+    cached = _optimized_model_path(model_path, options, cache_dir)
+
+    if cached.exists():
+        level = options.graph_optimization_level
+        try:
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            return ort.InferenceSession(str(cached), options, providers=providers)
+        except Exception as e:
+            print(f"⚠️ 최적화 그래프 캐시 로드 실패, 원본으로 다시 로드: {e}")
+            options.graph_optimization_level = level
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"⚠️ 최적화 그래프 캐시 디렉토리 생성 실패: {e}")
+        return ort.InferenceSession(str(model_path), options, providers=providers)
+
+    # 여러 워커가 동시에 저장해도 깨지지 않도록 임시 파일에 쓰고 교체
+    temp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+    try:
+        # 읽기 전용 디렉토리(컨테이너 이미지 등)면 세션을 만들기 전에 여기서 걸러냄
+        temp.touch()
+    except OSError as e:
+        print(f"⚠️ 최적화 그래프 캐시에 쓸 수 없음, 캐시 없이 로드: {e}")
+        return ort.InferenceSession(str(model_path), options, providers=providers)
+
+    options.optimized_model_filepath = str(temp)
+    try:
+        session = ort.InferenceSession(str(model_path), options, providers=providers)
+    except Exception as e:
+        # 그래프 저장 실패로 세션 생성이 실패해도 캐시 없이 다시 로드
+        print(f"⚠️ 최적화 그래프 저장 실패, 캐시 없이 다시 로드: {e}")
+        options.optimized_model_filepath = ""
+        _remove_quietly(temp)
+        return ort.InferenceSession(str(model_path), options, providers=providers)
+    finally:
+        options.optimized_model_filepath = ""
+
+    try:
+        os.replace(temp, cached)
+        print(f"💾 최적화 그래프 저장: {cached}")
+    except OSError as e:
+        print(f"⚠️ 최적화 그래프 저장 실패: {e}")
+        _remove_quietly(temp)
+
+    return session
+
+
+def _remove_quietly(path: Path):
+    """임시 파일 정리 (없거나 지울 수 없어도 무시)"""
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """수치적으로 안정된 softmax (마지막 축)"""
+    maxes = np.max(logits, axis=-1, keepdims=True)
+    shifted = np.exp(logits - maxes)
+    return shifted / shifted.sum(axis=-1, keepdims=True)
+
+
+class OnnxSentimentEngine:
+    """tokenizers + onnxruntime 직접 호출 감성 분석 엔진"""
+
+    def __init__(
+        self,
+        model_dir,
+        model_file: str = None,
+        max_length: int = 512,
+        session_options: ort.SessionOptions = None,
+        cache_dir=None,
+        use_graph_cache: bool = None,
+        length_buckets=DEFAULT_LENGTH_BUCKETS,
+        max_batch_size: int = 64,
+        chunking: bool = False,
+        chunk_overlap: int = 64,
+        max_chunks: int = 16,
+        chunk_strategy: str = "weighted_mean"
+    ):
+        self.model_dir = Path(model_dir)
+        self.model_path = self.model_dir / model_file if model_file else find_model_file(self.model_dir)
+        self.max_length = max_length
+        self.length_buckets = sorted({min(int(b), max_length) for b in length_buckets} | {max_length})
+        self.max_batch_size = max(1, max_batch_size)
+
+        # 긴 리뷰 토큰 윈도우 분할 설정 ([CLS], [SEP] 자리를 뺀 윈도우 크기)
+        if chunk_strategy not in CHUNK_STRATEGIES:
+            raise ValueError(f"Unknown chunk strategy: {chunk_strategy}")
+        self.chunking = chunking
+        self.window_size = max_length - 2
+        self.window_step = max(1, self.window_size - max(0, chunk_overlap))
+        self.max_chunks = max(1, max_chunks)
+        self.chunk_strategy = chunk_strategy
+
+        # 실제 토큰 수 / 패딩 포함 토큰 수 (버킷 효율 확인용, 추론 스레드 여러 개가 갱신하므로 lock)
+        self.token_stats = {"real": 0, "padded": 0}
+        self._token_stats_lock = threading.Lock()
+
+        config = self._load_json("config.json")
+        self.pad_id = config.get("pad_token_id", 0)
+
+        # id2label 이 없으면 transformers 기본값(LABEL_0, LABEL_1, ...)과 동일하게
+        num_labels = len(config.get("id2label", {})) or 2
+        self.id2label = {
+            int(index): label
+            for index, label in config.get(
+                "id2label",
+                {str(i): f"LABEL_{i}" for i in range(num_labels)}
+            ).items()
+        }
+
+        # 토크나이저 (Rust)
+        # 특수 토큰/자르기/패딩은 윈도우·버킷 단위로 직접 처리
+        self.tokenizer = Tokenizer.from_file(str(self.model_dir / "tokenizer.json"))
+        self.tokenizer.no_truncation()
+        self.tokenizer.no_padding()
+
+        special_tokens = self._load_json("special_tokens_map.json")
+        self.cls_id = self._special_token_id(special_tokens, "cls_token", "[CLS]")
+        self.sep_id = self._special_token_id(special_tokens, "sep_token", "[SEP]")
+
+        # ONNX Runtime 세션 (스레드/최적화 설정 + 최적화 그래프 캐시)
+        self.session = create_session(self.model_path, session_options, cache_dir, use_graph_cache)
+        self.input_names = {node.name for node in self.session.get_inputs()}
+
+    def _load_json(self, name: str) -> dict:
+        path = self.model_dir / name
+        if not path.exists():
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _special_token_id(self, special_tokens: dict, name: str, default: str) -> int:
+        token = special_tokens.get(name, default)
+        token = token["content"] if isinstance(token, dict) else token
+        return self.tokenizer.token_to_id(token)
+
+    def _windows(self, ids):
+        """
+        토큰 id → 모델 입력 시퀀스 목록
+
+        짧은 텍스트는 [CLS] ids [SEP] 하나 (기존과 동일),
+        긴 텍스트는 chunking 시 겹치는 윈도우 여러 개, 아니면 앞부분만 자름
+        """
+        size = self.window_size
+
+        if len(ids) <= size or not self.chunking:
+            starts = [0]
+        else:
+            last = len(ids) - size
+            starts = list(range(0, last, self.window_step)) + [last]
+            if len(starts) > self.max_chunks:
+                # 너무 길면 전체 구간에 고르게 분포하도록 골라냄
+                picks = np.linspace(0, len(starts) - 1, self.max_chunks).round().astype(int)
+                starts = [starts[i] for i in sorted(set(picks))]
+
+        return [[self.cls_id] + ids[start:start + size] + [self.sep_id] for start in starts]
+
+    def _bucket_of(self, length: int) -> int:
+        """토큰 길이가 속하는 버킷 경계"""
+        for bound in self.length_buckets:
+            if length <= bound:
+                return bound
+        return self.max_length
+
+    def _batches(self, lengths):
+        """길이순 정렬 → 버킷별 그룹 → max_batch_size 단위로 나눈 인덱스 묶음"""
+        order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+
+        for _, group in itertools.groupby(order, key=lambda i: self._bucket_of(lengths[i])):
+            indices = list(group)
+            for start in range(0, len(indices), self.max_batch_size):
+                yield indices[start:start + self.max_batch_size]
+
+    def _feeds(self, sequences, record: bool = True) -> dict:
+        """토큰 시퀀스 → ONNX 입력 텐서 (묶음 안의 최대 길이까지만 패딩, record=False 면 통계 제외)"""
+        batch_size = len(sequences)
+        seq_len = max(len(sequence) for sequence in sequences)
+
+        input_ids = np.full((batch_size, seq_len), self.pad_id, dtype=np.int64)
+        attention_mask = np.zeros((batch_size, seq_len), dtype=np.int64)
+        token_type_ids = np.zeros((batch_size, seq_len), dtype=np.int64)
+
+        for row, sequence in enumerate(sequences):
+            input_ids[row, :len(sequence)] = sequence
+            attention_mask[row, :len(sequence)] = 1
+
+        if record:
+            real = int(attention_mask.sum())
+            with self._token_stats_lock:
+                self.token_stats["real"] += real
+                self.token_stats["padded"] += batch_size * seq_len
+
+        feeds = {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "token_type_ids": token_type_ids
+        }
+        return {name: value for name, value in feeds.items() if name in self.input_names}
+
+    def _run(self, sequences) -> np.ndarray:
+        """시퀀스 목록 → 확률 (길이 버킷별로 나눠 추론 후 원래 순서로 복원)"""
+        lengths = [len(sequence) for sequence in sequences]
+
+        probs = None
+        for indices in self._batches(lengths):
+            logits = self.session.run(None, self._feeds([sequences[i] for i in indices]))[0]
+            if probs is None:
+                probs = np.empty((len(sequences), logits.shape[-1]), dtype=np.float32)
+            probs[indices] = softmax(logits.astype(np.float32))
+
+        return probs
+
+    def _combine(self, window_probs: np.ndarray, window_lengths) -> np.ndarray:
+        """한 리뷰의 윈도우별 확률 → 리뷰 확률"""
+        if len(window_probs) == 1:
+            return window_probs[0]
+
+        if self.chunk_strategy == "max_confidence":
+            return window_probs[window_probs.max(axis=-1).argmax()]
+
+        weights = np.asarray(window_lengths, dtype=np.float32)
+        return (window_probs * weights[:, None]).sum(axis=0) / weights.sum()
+
+    def predict_probs(self, texts) -> np.ndarray:
+        """텍스트 리스트 → 클래스 확률 (긴 리뷰는 모든 윈도우를 한 번의 배치로 추론)"""
+        encodings = self.tokenizer.encode_batch(list(texts), add_special_tokens=False)
+
+        sequences = []
+        owners = []
+        for index, encoding in enumerate(encodings):
+            windows = self._windows(encoding.ids)
+            sequences.extend(windows)
+            owners.append((len(sequences) - len(windows), len(sequences)))
+
+        window_probs = self._run(sequences)
+
+        return np.stack([
+            self._combine(
+                window_probs[start:end],
+                [len(sequence) for sequence in sequences[start:end]]
+            )
+            for start, end in owners
+        ])
+
+    def predict(self, texts):
+        """텍스트 리스트 → [{"label": "LABEL_1", "score": 0.97}, ...]"""
+        if not texts:
+            return []
+
+        probs = self.predict_probs(texts)
+        best = probs.argmax(axis=-1)
+
+        return [
+            {
+                "label": self.id2label.get(int(index), f"LABEL_{int(index)}"),
+                "score": float(prob[index])
+            }
+            for index, prob in zip(best, probs)
+        ]
+
+    def warmup(self, lengths=None, batch_sizes=(1,), text: str = "이 영화 정말 재미있어요"):
+        """
+        길이 버킷별 더미 시퀀스로 첫 추론 비용(메모리 할당, 커널 선택)을 미리 치름
+
+        lengths 는 [CLS]/[SEP] 를 포함한 토큰 수 (기본: 모든 길이 버킷)
+        """
+        ids = self.tokenizer.encode(text, add_special_tokens=False).ids or [self.sep_id]
+
+        for length in sorted({min(int(l), self.max_length) for l in (lengths or self.length_buckets)}):
+            body = list(itertools.islice(itertools.cycle(ids), max(0, length - 2)))
+            sequence = [self.cls_id] + body + [self.sep_id]
+            for batch_size in batch_sizes:
+                # 워밍업은 패딩 효율 통계에서 제외 (동시에 도는 실제 추론 통계를 되돌리지 않도록 기록만 안 함)
+                self.session.run(None, self._feeds([sequence] * max(1, int(batch_size)), record=False))
+
+    def __call__(self, texts):
+        return self.predict(texts)
@@ -0,0 +1,403 @@
+"""
+모델 교체 후 전체 리뷰 재채점
+
+- 리뷰를 id 순서로 keyset 페이지네이션 (WHERE id > 마지막 id ORDER BY id LIMIT n)
+- 배치마다 감성 분석 → 기본키 기준 일괄 UPDATE → 체크포인트 갱신을 한 트랜잭션으로 커밋
+- 중간에 멈춰도 체크포인트(rescore_checkpoints)의 마지막 id 다음부터 이어서 진행
+- 모든 리뷰를 처리한 뒤 영화 평점을 영화당 한 번씩 다시 계산
+- 실행 중 표시(owner / heartbeat_at), 중단 요청, 상태는 체크포인트 행에 기록
+  → API 워커 여러 개와 CLI 중 한 프로세스만 실행하고, 중단 / 상태 조회는 어느 워커에서든 가능
+
+CLI(scripts/rescore_reviews.py)와 운영자 API(/admin/rescore)가 같은 작업을 사용한다.
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, func, not_, or_, update
+from sqlalchemy.exc import IntegrityError
+
+from app.database import Session as SessionLocal
+from app.models import Movie, RescoreCheckpoint, Review
+from app.services import lexicon, model_registry
+from app.services.movie_stats import refresh_movie_stats
+from app.services.sentiment import MIN_TEXT_LENGTH, PENDING_LABEL, analyze_sentiment_batch, get_active_model
+
+# 재채점 설정
+RESCORE_BATCH_SIZE = int(os.getenv("SENTIMENT_RESCORE_BATCH_SIZE", "256"))
+STATS_BATCH_SIZE = 500
+PROGRESS_INTERVAL = 5.0  # 진행 상황 출력 간격 (초)
+JOB_NAME = "rescore"
+# heartbeat 가 이보다 오래 갱신되지 않으면 실행하던 프로세스가 죽은 것으로 보고 다른 프로세스가 가져감 (초)
+HEARTBEAT_TIMEOUT = float(os.getenv("SENTIMENT_RESCORE_HEARTBEAT_TIMEOUT", "120"))
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def _alive_filter():
+    """체크포인트를 잡은 프로세스가 살아 있음 (owner 가 있고 heartbeat 가 최근)"""
+    return and_(
+        RescoreCheckpoint.owner.isnot(None),
+        RescoreCheckpoint.heartbeat_at >= _now() - timedelta(seconds=HEARTBEAT_TIMEOUT)
+    )
+
+
+def _target_filter(version: str, rescore_all: bool):
+    """
+    재채점 대상 (기본: 활성 버전으로 채점되지 않은 리뷰)
+
+    항상 제외:
+    - 채점 대기(pending) 리뷰: 백필 워커가 채점하므로 같이 채점하면 통계에 두 번 반영됨
+    - 너무 짧아 모델을 거치지 않은 중립 리뷰: 다시 채점해도 같은 결과
+    """
+    eligible = and_(
+        or_(Review.sentiment_label.is_(None), Review.sentiment_label != PENDING_LABEL),
+        not_(and_(
+            Review.model_version.is_(None),
+            Review.sentiment_label == "neutral",
+            func.length(func.trim(Review.content)) < MIN_TEXT_LENGTH
+        ))
+    )
+    if rescore_all:
+        return eligible
+
+    # cascade 사용 중이면 사전으로 답한 리뷰도 최신으로 봄
+    current = [version, lexicon.LEXICON_VERSION] if lexicon.CASCADE_ENABLED else [version]
+    return and_(eligible, or_(Review.model_version.is_(None), Review.model_version.notin_(current)))
+
+
+class RescoreJob:
+    """
+    체크포인트 기반 재채점 작업
+
+    실행 여부는 프로세스 안의 플래그가 아니라 체크포인트 행으로 판단한다.
+    _claim() 이 조건부 UPDATE 로 owner 를 기록한 프로세스만 실행하고, 배치마다 heartbeat 를 갱신한다.
+    """
+
+    def __init__(self, batch_size: int = RESCORE_BATCH_SIZE, job_name: str = JOB_NAME):
+        self.batch_size = batch_size
+        self.job_name = job_name
+
+        self._owner = None
+        self._thread = None
+
+    def _claim(self) -> bool:
+        """
+        체크포인트 행 잡기 (다른 프로세스가 실행 중이면 False)
+
+        owner 가 비었거나 heartbeat 가 HEARTBEAT_TIMEOUT 보다 오래된 경우에만 UPDATE 되므로
+        확인과 표시가 한 문장이다 (동시에 UPDATE 하면 행 잠금으로 한쪽만 성공).
+        """
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        db = SessionLocal()
+        try:
+            if db.get(RescoreCheckpoint, self.job_name) is None:
+                # 첫 실행: 빈 체크포인트 행 (동시에 만들면 한쪽은 IntegrityError → 이미 있으니 무시)
+                try:
+                    db.add(RescoreCheckpoint(job_name=self.job_name, model_version="", status="done"))
+                    db.commit()
+                except IntegrityError:
+                    db.rollback()
+
+            now = _now()
+            result = db.execute(
+                update(RescoreCheckpoint)
+                .where(
+                    RescoreCheckpoint.job_name == self.job_name,
+                    or_(
+                        RescoreCheckpoint.owner.is_(None),
+                        RescoreCheckpoint.heartbeat_at.is_(None),
+                        RescoreCheckpoint.heartbeat_at < now - timedelta(seconds=HEARTBEAT_TIMEOUT)
+                    )
+                )
+                .values(owner=owner, heartbeat_at=now, stop_requested=False, reviews_per_sec=0.0, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+        if result.rowcount != 1:
+            return False
+        self._owner = owner
+        return True
+
+    def _release(self, error: str = None):
+        """체크포인트 행 놓기 (아직 이 프로세스가 잡고 있을 때만)"""
+        values = {"owner": None, "heartbeat_at": None, "stop_requested": False}
+        if error:
+            values["last_error"] = error[:500]
+
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(RescoreCheckpoint)
+                .where(RescoreCheckpoint.job_name == self.job_name, RescoreCheckpoint.owner == self._owner)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        finally:
+            db.close()
+            self._owner = None
+
+    def _update(self, db, **values):
+        """
+        체크포인트 갱신 + heartbeat (커밋은 호출한 쪽에서)
+
+        owner 가 이 프로세스일 때만 UPDATE 된다. 0행이면 heartbeat 가 끊긴 사이 다른 프로세스가
+        작업을 가져간 것이므로 이번 배치를 롤백하고 멈춘다 (같은 배치를 두 번 반영하지 않도록).
+        """
+        result = db.execute(
+            update(RescoreCheckpoint)
+            .where(RescoreCheckpoint.job_name == self.job_name, RescoreCheckpoint.owner == self._owner)
+            .values(heartbeat_at=_now(), **values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            db.rollback()
+            raise RuntimeError("Rescore job was taken over by another process")
+
+    def run(self, restart: bool = False, rescore_all: bool = False, progress=print) -> dict:
+        """재채점 실행 (끝나거나 stop() 될 때까지 블로킹) → 최종 상태"""
+        if not self._claim():
+            raise RuntimeError("Rescore job is already running")
+        return self._execute(restart, rescore_all, progress)
+
+    def _execute(self, restart: bool, rescore_all: bool, progress) -> dict:
+        """_claim() 한 뒤 실제 실행 (끝나면 체크포인트 행을 놓음)"""
+        error = None
+        try:
+            self._run(restart, rescore_all, progress)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self._release(error)
+
+        return self.status()
+
+    def start(self, restart: bool = False, rescore_all: bool = False) -> bool:
+        """백그라운드 스레드로 실행 (어느 프로세스에서든 이미 실행 중이면 False)"""
+        if not self._claim():
+            return False
+
+        def target():
+            try:
+                self._execute(restart, rescore_all, print)
+            except Exception as e:
+                print(f"❌ 재채점 실패: {e}")
+
+        self._thread = threading.Thread(target=target, name="sentiment-rescore", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> bool:
+        """
+        중단 요청만 하고 바로 반환 (실행 중인 작업이 없으면 False)
+
+        체크포인트 행에 stop_requested 를 기록하므로 어느 워커 / CLI 에서 실행 중이든
+        현재 배치까지 커밋하고 멈춘다 (다음 실행 시 이어서 진행).
+        실제로 멈췄는지는 status() 의 running / stopping 으로 확인.
+        """
+        db = SessionLocal()
+        try:
+            result = db.execute(
+                update(RescoreCheckpoint)
+                .where(RescoreCheckpoint.job_name == self.job_name, _alive_filter())
+                .values(stop_requested=True)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return result.rowcount == 1
+        finally:
+            db.close()
+
+    def status(self) -> dict:
+        """체크포인트 행 기준 실행 상태 (어느 프로세스가 실행 중이든 같은 값)"""
+        db = SessionLocal()
+        try:
+            row = db.query(RescoreCheckpoint, _alive_filter().label("alive"))\
+                    .filter(RescoreCheckpoint.job_name == self.job_name)\
+                    .first()
+            if row is None:
+                return self._snapshot(None, False)
+            return self._snapshot(row[0], bool(row[1]))
+        finally:
+            db.close()
+
+    def _snapshot(self, checkpoint, alive: bool) -> dict:
+        if checkpoint is None:
+            return {
+                "job_name": self.job_name,
+                "running": False,
+                "stopping": False,
+                "owner": None,
+                "reviews_per_sec": 0.0,
+                "last_error": None,
+                "status": None
+            }
+
+        reviews_per_sec = checkpoint.reviews_per_sec or 0.0
+        remaining = max(0, checkpoint.total - checkpoint.processed)
+        return {
+            "job_name": self.job_name,
+            "running": alive,
+            "stopping": alive and checkpoint.stop_requested,
+            "owner": checkpoint.owner if alive else None,
+            "heartbeat_at": checkpoint.heartbeat_at,
+            "reviews_per_sec": round(reviews_per_sec, 1),
+            "last_error": checkpoint.last_error,
+            "status": checkpoint.status,
+            "model_version": checkpoint.model_version,
+            "last_review_id": checkpoint.last_review_id,
+            "processed": checkpoint.processed,
+            "total": checkpoint.total,
+            "eta_seconds": round(remaining / reviews_per_sec) if alive and reviews_per_sec else None,
+            "started_at": checkpoint.started_at,
+            "finished_at": checkpoint.finished_at
+        }
+
+    def _run(self, restart: bool, rescore_all: bool, progress):
+        # 레지스트리의 활성 버전 기준 (이 워커가 아직 따라가는 중이면 이전 버전으로 채점하지 않도록 중단)
+        version = model_registry.load_registry()["active"]
+        current = get_active_model().version
+        if current != version:
+            raise RuntimeError(f"Model version {version} is not active in this worker yet (current: {current}), retry shortly")
+        target = _target_filter(version, rescore_all)
+
+        db = SessionLocal()
+        try:
+            # _claim() 이 체크포인트 행을 만들어 둠 (커밋하면 만료돼서 다음 접근 때 다시 읽음)
+            checkpoint = db.get(RescoreCheckpoint, self.job_name)
+
+            # 새 버전이거나 이전 작업이 끝났으면 처음부터, 아니면 체크포인트부터 이어서
+            if restart or checkpoint.status == "done" or checkpoint.model_version != version:
+                self._update(
+                    db,
+                    model_version=version,
+                    last_review_id=0,
+                    processed=0,
+                    total=db.query(func.count(Review.id)).filter(target).scalar(),
+                    status="running",
+                    started_at=func.now(),
+                    finished_at=None
+                )
+                db.commit()
+            elif checkpoint.status == "failed":
+                self._update(db, status="running")
+                db.commit()
+
+            progress(
+                f"🔄 재채점 시작: version={version}, 대상 {checkpoint.total}개 "
+                f"(id > {checkpoint.last_review_id} 부터, 처리 완료 {checkpoint.processed}개)"
+            )
+
+            started = time.perf_counter()
+            last_report = started
+            scored = 0
+
+            # 중단 요청은 다른 워커에서 올 수 있으므로 배치마다 체크포인트 행에서 확인
+            while checkpoint.status == "running" and not checkpoint.stop_requested:
+                rows = db.query(Review.id, Review.content)\
+                         .filter(Review.id > checkpoint.last_review_id, target)\
+                         .order_by(Review.id)\
+                         .limit(self.batch_size)\
+                         .all()
+
+                if not rows:
+                    self._update(db, status="stats")
+                    db.commit()
+                    break
+
+                results = analyze_sentiment_batch([content for _, content in rows], strict=True)
+
+                # 기본키 기준 일괄 UPDATE + 체크포인트를 같은 트랜잭션으로 커밋
+                db.execute(
+                    update(Review),
+                    [
+                        {
+                            "id": review_id,
+                            "sentiment_label": result["label"],
+                            "sentiment_score": result["score"],
+                            "model_version": result["model_version"]
+                        }
+                        for (review_id, _), result in zip(rows, results)
+                    ]
+                )
+                scored += len(rows)
+                now = time.perf_counter()
+                reviews_per_sec = scored / (now - started)
+
+                self._update(
+                    db,
+                    last_review_id=rows[-1][0],
+                    processed=RescoreCheckpoint.processed + len(rows),
+                    reviews_per_sec=reviews_per_sec
+                )
+                db.commit()
+
+                if now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    progress(
+                        f"  {checkpoint.processed}/{checkpoint.total} "
+                        f"({reviews_per_sec:.1f} reviews/s, last id={checkpoint.last_review_id})"
+                    )
+
+            if checkpoint.status == "running" and checkpoint.stop_requested:
+                progress(f"⏸️ 재채점 중단: last id={checkpoint.last_review_id} (다시 실행하면 이어서 진행)")
+                return
+
+            # 영화 평점은 영화당 한 번만 다시 계산
+            if checkpoint.status == "stats":
+                progress("📊 영화 통계 갱신 중...")
+                self._refresh_all_movies(db)
+                self._update(db, status="done", finished_at=func.now())
+                db.commit()
+
+            elapsed = time.perf_counter() - started
+            progress(f"✅ 재채점 완료: 이번 실행 {scored}개, {elapsed:.1f}s ({scored / elapsed if elapsed else 0:.1f} reviews/s)")
+
+        except Exception:
+            db.rollback()
+            # 아직 이 프로세스가 잡고 있을 때만 실패로 표시 (다른 프로세스가 가져갔으면 그대로 둠)
+            db.execute(
+                update(RescoreCheckpoint)
+                .where(RescoreCheckpoint.job_name == self.job_name, RescoreCheckpoint.owner == self._owner)
+                .values(status="failed")
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            raise
+        finally:
+            db.close()
+
+    def _refresh_all_movies(self, db):
+        """모든 영화 통계를 STATS_BATCH_SIZE 단위로 갱신"""
+        last_id = 0
+        while True:
+            movie_ids = [
+                movie_id for (movie_id,) in
+                db.query(Movie.id)
+                  .filter(Movie.id > last_id)
+                  .order_by(Movie.id)
+                  .limit(STATS_BATCH_SIZE)
+                  .all()
+            ]
+            if not movie_ids:
+                return
+
+            refresh_movie_stats(movie_ids, db)
+            self._update(db)  # heartbeat (통계 갱신이 길어도 다른 프로세스가 가져가지 않도록)
+            db.commit()
+            last_id = movie_ids[-1]
+
+
+# 전역 작업
+rescore_job = RescoreJob()
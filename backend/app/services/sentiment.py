@@ -1,92 +1,459 @@
-from optimum.onnxruntime import ORTModelForSequenceClassification
-from transformers import AutoTokenizer, pipeline
+import asyncio
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
-# 모델 경로
-MODEL_DIR = "app/models/sentiment"
+from app.services import lexicon, model_registry
+from app.services.batching import MicroBatcher
+from app.services.sentiment_cache import CACHE_ENABLED, make_cache_key, sentiment_cache
+
+# 기본 모델 경로 (레지스트리에 버전이 없을 때)
+MODEL_DIR = model_registry.DEFAULT_MODEL_DIR
+
+# 추론 엔진
+# - onnx: tokenizers + onnxruntime 직접 호출 (기본값, 가벼움)
+# - pipeline: optimum + transformers pipeline (기존 방식)
+# - remote: 공유 추론 프로세스에 유닉스 소켓으로 요청 (워커 여러 개일 때 모델을 한 번만 로드)
+ENGINE = os.getenv("SENTIMENT_ENGINE", "onnx").lower()
+
+# 기본 모델 버전 (캐시 키에 포함 → 모델이 바뀌면 이전 결과를 쓰지 않음)
+MODEL_VERSION = model_registry.DEFAULT_VERSION
+
+# 감성 분석 시점
+# - sync: 리뷰 작성 요청 안에서 바로 분석 (기본값)
+# - deferred: 'pending'으로 먼저 저장하고 백필 워커가 나중에 분석
+SENTIMENT_MODE = os.getenv("SENTIMENT_MODE", "sync").lower()
+PENDING_LABEL = "pending"
+
+# 마이크로 배칭 설정 (동시 요청을 모아서 한 번에 추론)
+BATCHING_ENABLED = os.getenv("SENTIMENT_BATCHING", "true").lower() == "true"
+MAX_BATCH_SIZE = int(os.getenv("SENTIMENT_MAX_BATCH_SIZE", "16"))
+MAX_WAIT_MS = float(os.getenv("SENTIMENT_MAX_WAIT_MS", "5"))
+
+# 길이 버킷 (토큰 수 기준, 같은 버킷끼리 묶어 버킷 안의 최대 길이까지만 패딩)
+LENGTH_BUCKETS = [
+    int(bound) for bound in
+    os.getenv("SENTIMENT_LENGTH_BUCKETS", "16,32,64,128,256,512").split(",")
+    if bound.strip()
+]
+# 대량(bulk/백필) 분석 시 한 번의 forward pass에 넣는 최대 문장 수
+ENGINE_BATCH_SIZE = int(os.getenv("SENTIMENT_ENGINE_BATCH_SIZE", "64"))
+
+# 추론 전용 스레드 풀 크기 (Starlette 요청 스레드 풀과 분리)
+# 배칭 사용 시 스레드는 배치 결과를 기다리기만 하므로 배치 크기 이상으로 잡는다
+EXECUTOR_WORKERS = int(os.getenv("SENTIMENT_EXECUTOR_WORKERS", str(MAX_BATCH_SIZE)))
+
+# 중립 처리 기준 (이보다 짧은 텍스트는 분석하지 않음)
+MIN_TEXT_LENGTH = 5
+MAX_TEXT_LENGTH = 512
+
+# 모델 최대 입력 길이 (토큰)
+MAX_SEQUENCE_LENGTH = 512
+
+# 긴 리뷰 토큰 윈도우 분할 (onnx 엔진 전용)
+# 512 토큰을 넘는 리뷰를 겹치는 윈도우로 나눠 한 번의 배치로 점수를 매기고 합침
+CHUNKING_ENABLED = os.getenv("SENTIMENT_CHUNKING", "true").lower() == "true"
+CHUNK_OVERLAP = int(os.getenv("SENTIMENT_CHUNK_OVERLAP", "64"))
+MAX_CHUNKS = int(os.getenv("SENTIMENT_MAX_CHUNKS", "8"))
+CHUNK_STRATEGY = os.getenv("SENTIMENT_CHUNK_STRATEGY", "weighted_mean").lower()
+# 윈도우 분할 시 받아들이는 최대 글자 수 (비용 상한)
+MAX_CHUNKED_TEXT_LENGTH = int(os.getenv("SENTIMENT_MAX_TEXT_CHARS", "8000"))
+
+NEUTRAL_RESULT = {
+    "label": "neutral",
+    "score": 0.5,
+    "model_version": None
+}
+
+# 시작 시 워밍업 (모델 로드 + 길이별 첫 추론을 끝낸 뒤 /ready 가 200 을 반환)
+WARMUP_ENABLED = os.getenv("SENTIMENT_WARMUP", "false").lower() == "true"
+# 워밍업 시퀀스 길이 (토큰) / 배치 크기
+WARMUP_LENGTHS = [
+    int(length) for length in
+    os.getenv("SENTIMENT_WARMUP_LENGTHS", ",".join(str(b) for b in LENGTH_BUCKETS)).split(",")
+    if length.strip()
+]
+WARMUP_BATCH_SIZES = [
+    int(size) for size in
+    os.getenv("SENTIMENT_WARMUP_BATCH_SIZES", f"1,{MAX_BATCH_SIZE}").split(",")
+    if size.strip()
+]
+WARMUP_TEXT = "이 영화 정말 재미있어요! 강력 추천합니다. 너무 지루하고 별로였어요."
+
+# 다른 워커의 모델 활성화 확인 상태 (레지스트리 파일 mtime)
+_registry_sync = {"checked_at": 0.0, "mtime": None}
+
+# 로드된 모델 (버전 + 경로 + 분석기를 한 객체로 묶어 참조 교체 한 번으로 전환)
+LoadedModel = namedtuple("LoadedModel", ["version", "path", "analyzer"])
+
+# 준비 상태 (워밍업을 끝낸 모델이 있는지)
+model_ready = threading.Event()
+warmup_status = {"seconds": None, "error": None}
 
 # 전역 변수 (Lazy Loading)
-sentiment_pipeline = None
+active_model = None
+sentiment_batcher = None
+inference_executor = None
+_model_lock = threading.Lock()
+_batcher_lock = threading.Lock()
+_executor_lock = threading.Lock()
+
+def _load_pipeline(model_dir: str = MODEL_DIR):
+    """optimum ORT 모델 + transformers pipeline 로드"""
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer, pipeline
+
+    from app.services.onnx_engine import build_session_options
+
+    # ONNX 모델 로드 (세션 설정은 onnx 엔진과 동일하게)
+    model = ORTModelForSequenceClassification.from_pretrained(
+        model_dir,
+        session_options=build_session_options()
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+
+    # Pipeline 생성
+    return pipeline(
+        "sentiment-analysis",
+        model=model,
+        tokenizer=tokenizer
+    )
+
+def _load_onnx_engine(model_dir: str = MODEL_DIR, session_options=None):
+    """tokenizers + onnxruntime 경량 엔진 로드"""
+    from app.services.onnx_engine import OnnxSentimentEngine
+
+    return OnnxSentimentEngine(
+        model_dir,
+        session_options=session_options,
+        max_length=MAX_SEQUENCE_LENGTH,
+        length_buckets=LENGTH_BUCKETS,
+        max_batch_size=ENGINE_BATCH_SIZE,
+        chunking=CHUNKING_ENABLED,
+        chunk_overlap=CHUNK_OVERLAP,
+        max_chunks=MAX_CHUNKS,
+        chunk_strategy=CHUNK_STRATEGY
+    )
+
+def load_model(version: str) -> LoadedModel:
+    """레지스트리의 모델 버전 로드 (활성 모델은 바꾸지 않음)"""
+    entry = model_registry.get_version(version)
+    if entry is None:
+        raise ValueError(f"Unknown model version: {version}")
+
+    path = entry["path"]
+    if ENGINE == "pipeline":
+        analyzer = _load_pipeline(path)
+    elif ENGINE == "remote":
+        from app.services.inference_server import RemoteSentimentEngine
+
+        analyzer = RemoteSentimentEngine(version, path)
+    else:
+        analyzer = _load_onnx_engine(path)
+
+    return LoadedModel(version, path, analyzer)
+
+def warmup_analyzer(analyzer):
+    """시퀀스 길이 × 배치 크기별로 첫 추론 비용을 미리 치름"""
+    if ENGINE == "pipeline":
+        # 한국어는 대략 글자당 토큰 하나 → 글자 수로 길이를 맞추고 잘라냄
+        for length in WARMUP_LENGTHS:
+            text = (WARMUP_TEXT * (length // len(WARMUP_TEXT) + 1))[:length]
+            for batch_size in WARMUP_BATCH_SIZES:
+                analyzer([text] * batch_size, batch_size=batch_size, truncation=True)
+    else:
+        analyzer.warmup(WARMUP_LENGTHS, WARMUP_BATCH_SIZES, WARMUP_TEXT)
+
+def warmup_model():
+    """활성 모델 로드 + 워밍업 후 준비 완료 표시 (앱 시작 시 백그라운드에서)"""
+    started = time.perf_counter()
+    try:
+        print(f"🔥 감성 분석 모델 워밍업 중... (lengths={WARMUP_LENGTHS}, batch_sizes={WARMUP_BATCH_SIZES})")
+        warmup_analyzer(get_sentiment_analyzer())
+
+        warmup_status["seconds"] = round(time.perf_counter() - started, 2)
+        model_ready.set()
+        print(f"✅ 워밍업 완료 ({warmup_status['seconds']}s)")
+    except Exception as e:
+        warmup_status["error"] = str(e)
+        print(f"❌ 워밍업 실패: {e}")
+
+def set_active_model(model: LoadedModel):
+    """활성 모델 교체 (이후 배치부터 새 모델 사용)"""
+    global active_model
+
+    with _model_lock:
+        active_model = model
+
+def get_active_model() -> LoadedModel:
+    """활성 모델 로드 (한 번만 실행)"""
+    global active_model
+
+    if active_model is None:
+        with _model_lock:
+            if active_model is None:
+                _registry_sync["mtime"] = model_registry.registry_mtime()
+                version = model_registry.load_registry()["active"]
+                print(f"📦 감성 분석 모델 로드 중... (engine={ENGINE}, version={version})")
+
+                try:
+                    active_model = load_model(version)
+                    print("✅ 감성 분석 모델 로드 완료!")
+
+                except Exception as e:
+                    print(f"❌ 모델 로드 실패: {e}")
+                    raise e
+    else:
+        sync_active_version()
+
+    return active_model
+
+def sync_active_version():
+    """
+    다른 워커가 활성화한 버전(레지스트리 파일의 active)을 이 워커에도 적용
+
+    SYNC_INTERVAL 마다 파일 mtime 만 확인하고, 바뀌었을 때만 파일을 읽는다.
+    버전이 다르면 백그라운드에서 로드 + 워밍업 후 교체 (그 전까지는 기존 모델로 처리)
+    """
+    now = time.monotonic()
+    if now - _registry_sync["checked_at"] < model_registry.SYNC_INTERVAL:
+        return
+    _registry_sync["checked_at"] = now
+
+    mtime = model_registry.registry_mtime()
+    if mtime == _registry_sync["mtime"]:
+        return
+
+    activator = model_registry.model_activator
+    if activator.loading is not None:
+        # 이 워커에서 교체 중 (끝나면 다시 확인)
+        return
+    _registry_sync["mtime"] = mtime
+
+    version = model_registry.load_registry()["active"]
+    if active_model is not None and version != active_model.version:
+        print(f"🔄 다른 워커가 활성화한 모델 버전 적용: {active_model.version} → {version}")
+        activator.activate(version, persist=False)
 
 def get_sentiment_analyzer():
-    """감성 분석 파이프라인 로드 (한 번만 실행)"""
-    global sentiment_pipeline
-    
-    if sentiment_pipeline is None:
-        print("📦 감성 분석 모델 로드 중...")
-        
-        try:
-            # ONNX 모델 로드
-            model = ORTModelForSequenceClassification.from_pretrained(MODEL_DIR)
-            tokenizer = AutoTokenizer.from_pretrained(MODEL_DIR)
-            
-            # Pipeline 생성
-            sentiment_pipeline = pipeline(
-                "sentiment-analysis",
-                model=model,
-                tokenizer=tokenizer
-            )
-            
-            print("✅ 감성 분석 모델 로드 완료!")
-            
-        except Exception as e:
-            print(f"❌ 모델 로드 실패: {e}")
-            raise e
-    
-    return sentiment_pipeline
+    """감성 분석기 로드 (한 번만 실행)"""
+    return get_active_model().analyzer
+
+def get_active_version() -> str:
+    """현재 활성 모델 버전 (로드 전이면 레지스트리의 active 값)"""
+    model = active_model
+    if model is not None:
+        return model.version
+    return model_registry.load_registry()["active"]
+
+def get_sentiment_batcher():
+    """마이크로 배칭 스케줄러 (한 번만 생성)"""
+    global sentiment_batcher
+
+    if sentiment_batcher is None:
+        with _batcher_lock:
+            if sentiment_batcher is None:
+                sentiment_batcher = MicroBatcher(
+                    _predict_batch,
+                    max_batch_size=MAX_BATCH_SIZE,
+                    max_wait_ms=MAX_WAIT_MS,
+                    name="sentiment-batcher"
+                )
+
+    return sentiment_batcher
+
+def get_inference_executor():
+    """감성 분석 전용 스레드 풀 (한 번만 생성)"""
+    global inference_executor
+
+    if inference_executor is None:
+        with _executor_lock:
+            if inference_executor is None:
+                inference_executor = ThreadPoolExecutor(
+                    max_workers=EXECUTOR_WORKERS,
+                    thread_name_prefix="sentiment"
+                )
+
+    return inference_executor
+
+def _text_limit() -> int:
+    """모델에 넘기는 최대 글자 수 (윈도우 분할이 없으면 기존처럼 512자)"""
+    if ENGINE != "pipeline" and CHUNKING_ENABLED:
+        return MAX_CHUNKED_TEXT_LENGTH
+    return MAX_TEXT_LENGTH
+
+def _is_analyzable(text: str) -> bool:
+    """분석할 만한 길이의 텍스트인지 확인"""
+    return bool(text) and len(text.strip()) >= MIN_TEXT_LENGTH
+
+def _predict_batch(texts):
+    """텍스트 리스트를 한 번의 패딩된 forward pass로 분석"""
+    # 배치 하나는 한 모델로만 처리 (도중에 교체되어도 결과와 버전이 일치)
+    model = get_active_model()
+    analyzer = model.analyzer
+
+    # 텍스트 길이 제한 (윈도우 분할 시 토큰 단위로 나누고, 아니면 512자)
+    limit = _text_limit()
+    texts = [text[:limit] for text in texts]
+
+    if ENGINE == "pipeline":
+        # 길이순으로 정렬해 묶어야 묶음별 패딩이 줄어듦 → 결과는 원래 순서로
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_outputs = analyzer(
+            [texts[i] for i in order],
+            batch_size=min(len(texts), ENGINE_BATCH_SIZE),
+            truncation=True
+        )
+        outputs = [None] * len(texts)
+        for i, output in zip(order, sorted_outputs):
+            outputs[i] = output
+    else:
+        # 토큰 길이 버킷별로 나눠 버킷 안의 최대 길이까지만 패딩
+        outputs = analyzer(texts)
+
+    return [
+        {
+            # 라벨 정규화 (모델에 따라 다를 수 있음)
+            "label": normalize_label(output["label"]),
+            "score": float(output["score"]),
+            "model_version": model.version
+        }
+        for output in outputs
+    ]
+
+def _cache_key(text: str, version: str = None):
+    """감성 캐시 키 (모델 버전 + 모델이 실제로 보는 길이까지만 반영)"""
+    return make_cache_key(text, version or get_active_version(), _text_limit())
 
 def analyze_sentiment(text: str):
     """텍스트 감성 분석"""
-    
+
     try:
         # 입력 검증
-        if not text or len(text.strip()) < 5:
-            return {
-                "label": "neutral",
-                "score": 0.5
-            }
-        
-        # 분석기 로드
-        analyzer = get_sentiment_analyzer()
-        
-        # 텍스트 길이 제한 (512자)
-        text = text[:512]
-        
-        # 감성 분석 수행
-        result = analyzer(text)[0]
-        
-        # 결과 처리
-        raw_label = result["label"]
-        score = result["score"]
-        
-        # 라벨 정규화 (모델에 따라 다를 수 있음)
-        label = normalize_label(raw_label)
-        
-        return {
-            "label": label,
-            "score": float(score)
-        }
-    
+        if not _is_analyzable(text):
+            return dict(NEUTRAL_RESULT)
+
+        # 짧고 분명한 리뷰는 감성 사전으로 바로 답함 (cascade)
+        if lexicon.CASCADE_ENABLED:
+            result = lexicon.classify(text)
+            if result is not None:
+                return result
+
+        # 캐시 확인 (같은 텍스트는 추론 생략)
+        if CACHE_ENABLED:
+            key = _cache_key(text)
+            cached = sentiment_cache.get(key)
+            if cached is not None:
+                return cached
+
+        # 배칭 활성화 시 다른 요청과 묶어서 추론
+        if BATCHING_ENABLED:
+            result = get_sentiment_batcher().submit(text).result()
+        else:
+            result = _predict_batch([text])[0]
+
+        # 추론 도중 모델이 교체됐을 수 있으므로 실제로 쓴 버전으로 저장
+        if CACHE_ENABLED:
+            version = result["model_version"]
+            sentiment_cache.put(_cache_key(text, version), result, version)
+
+        return result
+
     except Exception as e:
         print(f"❌ 감성 분석 에러: {e}")
         # 에러 시 중립 반환
-        return {
-            "label": "neutral",
-            "score": 0.5
-        }
-    
+        return dict(NEUTRAL_RESULT)
+
+async def analyze_sentiment_async(text: str):
+    """텍스트 감성 분석 (전용 스레드 풀에서 실행, async 핸들러용)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_inference_executor(), analyze_sentiment, text)
+
+async def analyze_sentiment_batch_async(texts):
+    """여러 텍스트 감성 분석 (전용 스레드 풀에서 실행, async 핸들러용)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_inference_executor(), analyze_sentiment_batch, texts)
+
+def analyze_sentiment_batch(texts, strict: bool = False):
+    """여러 텍스트를 한 번에 감성 분석 (입력 순서대로 결과 반환)
+
+    strict=True 이면 추론 실패 시 중립으로 채우지 않고 예외를 그대로 올린다 (재채점용).
+    """
+
+    results = [dict(NEUTRAL_RESULT) for _ in texts]
+
+    # 분석 가능한 텍스트만 모아서 추론
+    targets = [i for i, text in enumerate(texts) if _is_analyzable(text)]
+
+    # 짧고 분명한 리뷰는 감성 사전으로 바로 답함 (cascade)
+    if lexicon.CASCADE_ENABLED:
+        remaining = []
+        for i in targets:
+            result = lexicon.classify(texts[i])
+            if result is None:
+                remaining.append(i)
+            else:
+                results[i] = result
+        targets = remaining
+
+    if not targets:
+        return results
+
+    try:
+        # 캐시 조회 후 남은 텍스트만 추론 (배치 안의 중복 텍스트도 한 번만)
+        pending = {}
+        if CACHE_ENABLED:
+            keys = {i: _cache_key(texts[i]) for i in targets}
+            cached = sentiment_cache.get_many(list(dict.fromkeys(keys.values())))
+            for i in targets:
+                if keys[i] in cached:
+                    results[i] = dict(cached[keys[i]])
+                else:
+                    pending.setdefault(keys[i], []).append(i)
+        else:
+            pending = {i: [i] for i in targets}
+
+        # 남은 텍스트 전체를 한 번에 넘겨 엔진이 길이 버킷별로 묶도록 함
+        misses = list(pending.items())
+        if misses:
+            outputs = _predict_batch([texts[indices[0]] for _, indices in misses])
+
+            for (key, indices), output in zip(misses, outputs):
+                for i in indices:
+                    results[i] = dict(output)
+
+            if CACHE_ENABLED:
+                version = outputs[0]["model_version"]
+                sentiment_cache.put_many(
+                    {
+                        _cache_key(texts[indices[0]], version): output
+                        for (_, indices), output in zip(misses, outputs)
+                    },
+                    version
+                )
+
+    except Exception as e:
+        if strict:
+            raise
+        print(f"❌ 배치 감성 분석 에러: {e}")
+
+    return results
+
 def normalize_label(raw_label: str):
     """모델 출력 라벨을 정규화"""
-    
+
     label_lower = raw_label.lower()
-    
+
     # 긍정 패턴
     if label_lower in ["positive", "pos", "1", "긍정", "label_1"]:  # ← label_1 추가됨
         return "positive"
-    
+
     # 부정 패턴
     elif label_lower in ["negative", "neg", "0", "부정", "label_0"]:  # ← label_0 추가됨
         return "negative"
-    
+
     # 기타
     else:
-        return "neutral"
\ No newline at end of file
+        return "neutral"
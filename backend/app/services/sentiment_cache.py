@@ -0,0 +1,181 @@
+"""
+감성 분석 결과 캐시
+
+- 키: 정규화 + 길이 제한한 텍스트와 모델 버전의 SHA-256 해시
+- 1차: 프로세스 메모리 LRU (크기 제한)
+- 2차: DB 테이블 (sentiment_cache, 선택)
+"""
+
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+# 캐시 설정
+CACHE_ENABLED = os.getenv("SENTIMENT_CACHE", "true").lower() == "true"
+CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "10000"))
+CACHE_DB_ENABLED = os.getenv("SENTIMENT_CACHE_DB", "false").lower() == "true"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str, max_length: int) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFKC, 공백 정리, 길이 제한)"""
+    text = unicodedata.normalize("NFKC", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    return text[:max_length]
+
+
+def make_cache_key(text: str, model_version: str, max_length: int) -> str:
+    """모델 버전 + 정규화된 텍스트의 해시"""
+    normalized = normalize_text(text, max_length)
+    payload = f"{model_version}\0{normalized}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class SentimentCache:
+    """메모리 LRU + (선택) DB 2단 캐시"""
+
+    def __init__(self, max_size: int = 10000, use_db: bool = False):
+        self.max_size = max(1, max_size)
+        self.use_db = use_db
+
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 카운터
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, keys):
+        """키 목록 조회 → {key: result} (없는 키는 제외)"""
+        found = {}
+        missing = []
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = dict(entry)
+                self.hits += 1
+
+        if missing and self.use_db:
+            db_found = self._load_from_db(missing)
+            if db_found:
+                self._store(db_found)
+                found.update(db_found)
+            with self._lock:
+                self.db_hits += len(db_found)
+            missing = [key for key in missing if key not in db_found]
+
+        with self._lock:
+            self.misses += len(missing)
+
+        return found
+
+    def get(self, key: str):
+        """단일 키 조회 (없으면 None)"""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, results: dict, model_version: str):
+        """새로 계산한 결과 저장 {key: result}"""
+        if not results:
+            return
+
+        self._store(results)
+
+        if self.use_db:
+            self._save_to_db(results, model_version)
+
+    def put(self, key: str, result: dict, model_version: str):
+        """단일 결과 저장"""
+        self.put_many({key: result}, model_version)
+
+    def clear(self):
+        """메모리 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.db_hits + self.misses
+            return {
+                "enabled": CACHE_ENABLED,
+                "db_enabled": self.use_db,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round((self.hits + self.db_hits) / lookups, 4) if lookups else 0.0
+            }
+
+    def _store(self, results: dict):
+        """메모리 LRU에 저장하고 초과분 제거"""
+        with self._lock:
+            for key, result in results.items():
+                self._entries[key] = dict(result)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _load_from_db(self, keys):
+        """DB 캐시 테이블에서 조회"""
+        from app.database import Session
+        from app.models import SentimentCacheEntry
+
+        db = Session()
+        try:
+            rows = db.query(SentimentCacheEntry)\
+                     .filter(SentimentCacheEntry.content_hash.in_(keys))\
+                     .all()
+            return {
+                row.content_hash: {
+                    "label": row.sentiment_label,
+                    "score": row.sentiment_score,
+                    "model_version": row.model_version
+                }
+                for row in rows
+            }
+        except Exception as e:
+            print(f"⚠️ 감성 캐시 DB 조회 실패: {e}")
+            return {}
+        finally:
+            db.close()
+
+    def _save_to_db(self, results: dict, model_version: str):
+        """DB 캐시 테이블에 저장 (이미 있는 키는 덮어쓰기)"""
+        from app.database import Session
+        from app.models import SentimentCacheEntry
+
+        db = Session()
+        try:
+            for key, result in results.items():
+                db.merge(SentimentCacheEntry(
+                    content_hash=key,
+                    model_version=model_version,
+                    sentiment_label=result["label"],
+                    sentiment_score=result["score"]
+                ))
+            db.commit()
+        except Exception as e:
+            # 동시 저장 충돌 등은 무시 (캐시는 다음 요청에서 다시 채워짐)
+            db.rollback()
+            print(f"⚠️ 감성 캐시 DB 저장 실패: {e}")
+        finally:
+            db.close()
+
+
+# 전역 캐시
+sentiment_cache = SentimentCache(max_size=CACHE_SIZE, use_db=CACHE_DB_ENABLED)
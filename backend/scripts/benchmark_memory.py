@@ -0,0 +1,161 @@
+"""
+워커 수에 따른 감성 분석 메모리 벤치마크 (local vs remote)
+
+- local : 워커 프로세스마다 OnnxSentimentEngine 을 따로 로드 (SENTIMENT_ENGINE=onnx)
+- remote: 추론 서버 하나만 모델을 로드하고 워커는 유닉스 소켓으로 요청 (SENTIMENT_ENGINE=remote)
+
+워커 N개를 동시에 띄워 코퍼스를 추론시킨 뒤 각 프로세스의 RSS 를 재고,
+워커당 / 전체(워커 + 서버) 메모리를 JSON으로 출력한다. (Linux /proc 기준)
+
+실행: python scripts/benchmark_memory.py --workers 1,2,4 [--modes local,remote] [--output mem.json]
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+# 설정
+MODEL_DIR = Path("./app/models/sentiment")
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "data" / "sample_reviews.jsonl"
+AUTHKEY = b"benchmark-memory"
+
+
+def load_corpus(path: Path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["text"] for line in f if line.strip()]
+
+
+def parse_ints(value: str):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def memory_mb(pid: int = None) -> dict:
+    """RSS / 최대 RSS (MB)"""
+    path = f"/proc/{pid or 'self'}/status"
+    values = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                key, amount = line.split()[:2]
+                values[key.rstrip(":")] = round(int(amount) / 1024, 1)
+    return {"rss_mb": values.get("VmRSS"), "peak_rss_mb": values.get("VmHWM")}
+
+
+def run_server(socket_path: str):
+    """추론 서버 프로세스"""
+    sys.path.insert(0, str(BACKEND_ROOT))
+    from app.services.inference_server import InferenceServer
+
+    InferenceServer(socket_path, authkey=AUTHKEY).serve_forever()
+
+
+def run_worker(mode: str, model_dir: str, socket_path: str, texts, results, done):
+    """워커 프로세스: 엔진 준비 → 추론 → RSS 보고 → 모두 잴 때까지 대기"""
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+    if mode == "remote":
+        from app.services.inference_server import RemoteSentimentEngine
+
+        engine = RemoteSentimentEngine("benchmark", model_dir, socket_path=socket_path, authkey=AUTHKEY)
+    else:
+        from app.services.onnx_engine import OnnxSentimentEngine
+
+        engine = OnnxSentimentEngine(model_dir)
+
+    for _ in range(3):
+        engine.predict(texts)
+
+    results.put({"pid": os.getpid(), **memory_mb()})
+    done.wait()
+
+
+def measure(mode: str, workers: int, model_dir: Path, texts) -> dict:
+    ctx = mp.get_context("spawn")
+    socket_path = os.path.join(tempfile.mkdtemp(), "sentiment.sock")
+
+    server = None
+    if mode == "remote":
+        server = ctx.Process(target=run_server, args=(socket_path,), daemon=True)
+        server.start()
+
+    results = ctx.Queue()
+    done = ctx.Event()
+    processes = [
+        ctx.Process(target=run_worker, args=(mode, str(model_dir), socket_path, texts, results, done))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    reports = [results.get(timeout=300) for _ in processes]
+    server_memory = memory_mb(server.pid) if server else None
+
+    done.set()
+    for process in processes:
+        process.join()
+    if server:
+        server.terminate()
+        server.join()
+
+    worker_rss = [report["rss_mb"] for report in reports]
+    total = sum(worker_rss) + (server_memory["rss_mb"] if server_memory else 0)
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "worker_rss_mb": worker_rss,
+        "worker_rss_mean_mb": round(sum(worker_rss) / len(worker_rss), 1),
+        "server_rss_mb": server_memory["rss_mb"] if server_memory else None,
+        "total_rss_mb": round(total, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 수에 따른 감성 분석 메모리 벤치마크")
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR, help="모델 디렉토리")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="리뷰 코퍼스 (.jsonl)")
+    parser.add_argument("--workers", type=parse_ints, default=[1, 2, 4], help="워커 수 목록")
+    parser.add_argument("--modes", default="local,remote", help="비교할 방식 (local, remote)")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    texts = load_corpus(args.corpus)
+    model_dir = args.model_dir.resolve()
+
+    print("=" * 60, file=sys.stderr)
+    print("감성 분석 메모리 벤치마크", file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
+
+    runs = []
+    for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+        for workers in args.workers:
+            started = time.perf_counter()
+            result = measure(mode, workers, model_dir, texts)
+            runs.append(result)
+
+            print(
+                f"  {mode:<6} workers={workers:>2}  "
+                f"worker={result['worker_rss_mean_mb']:>7.1f}MB  "
+                f"server={result['server_rss_mb'] or 0:>7.1f}MB  "
+                f"total={result['total_rss_mb']:>8.1f}MB  ({time.perf_counter() - started:.1f}s)",
+                file=sys.stderr
+            )
+
+    output = json.dumps({"model_dir": str(model_dir), "runs": runs}, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+        print(f"\n✅ 결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
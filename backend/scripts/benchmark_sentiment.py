@@ -0,0 +1,235 @@
+"""
+감성 분석 추론 벤치마크
+
+배포용 모델(app/models/sentiment)을 로드해서 한국어 리뷰 코퍼스를
+배치 크기 × 스레드 수 조합으로 반복 추론하고 결과를 JSON으로 출력한다.
+
+측정 항목:
+- 모델 로드 시간
+- 배치 호출 지연 시간 p50 / p95 / p99 (ms)
+- 처리량 (reviews/sec)
+- 최대 RSS (MB)
+- 패딩 효율 (실제 토큰 / 패딩 포함 토큰)
+
+실행: python scripts/benchmark_sentiment.py --batch-sizes 1,8,32 --threads 1,2 --output bench.json
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import onnxruntime as ort
+
+from app.services.onnx_engine import (
+    DEFAULT_LENGTH_BUCKETS,
+    OnnxSentimentEngine,
+    available_cpus,
+    build_session_options
+)
+
+# 설정
+MODEL_DIR = Path("./app/models/sentiment")
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "data" / "sample_reviews.jsonl"
+
+
+def load_corpus(path: Path):
+    """JSONL(text 필드) 또는 한 줄에 리뷰 하나인 텍스트 파일 읽기"""
+    texts = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if path.suffix == ".jsonl":
+                texts.append(json.loads(line)["text"])
+            else:
+                texts.append(line)
+    return texts
+
+
+def parse_ints(value: str):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def percentile(values, q):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (Linux: KB, macOS: bytes)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if platform.system() == "Darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def model_metadata(engine: OnnxSentimentEngine) -> dict:
+    """커밋 / 양자화 설정 간 비교용 모델 정보"""
+    ort_config_path = engine.model_dir / "ort_config.json"
+    quantization = {}
+    if ort_config_path.exists():
+        with open(ort_config_path, encoding="utf-8") as f:
+            quantization = json.load(f).get("quantization", {})
+
+    return {
+        "model_file": engine.model_path.name,
+        "model_sha256": file_sha256(engine.model_path),
+        "model_size_mb": round(engine.model_path.stat().st_size / (1024 * 1024), 2),
+        "quantization": {
+            key: quantization.get(key)
+            for key in ("is_static", "format", "mode", "per_channel", "weights_dtype", "activations_dtype")
+            if key in quantization
+        }
+    }
+
+
+def run_batch_size(engine, texts, batch_size: int, min_reviews: int, warmup: int):
+    """코퍼스를 순환하며 batch_size 단위로 추론"""
+    def batch_at(step):
+        start = (step * batch_size) % len(texts)
+        return [texts[(start + i) % len(texts)] for i in range(batch_size)]
+
+    for step in range(warmup):
+        engine.predict(batch_at(step))
+
+    engine.token_stats = {"real": 0, "padded": 0}
+
+    steps = max(1, -(-min_reviews // batch_size))
+    latencies = []
+    started = time.perf_counter()
+    for step in range(steps):
+        batch = batch_at(step)
+        start = time.perf_counter()
+        engine.predict(batch)
+        latencies.append((time.perf_counter() - start) * 1000)
+    elapsed = time.perf_counter() - started
+
+    stats = engine.token_stats
+    return {
+        "batch_size": batch_size,
+        "calls": steps,
+        "reviews": steps * batch_size,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "reviews_per_sec": round(steps * batch_size / elapsed, 2),
+        "padding_efficiency": round(stats["real"] / stats["padded"], 4) if stats["padded"] else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감성 분석 추론 벤치마크")
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR, help="모델 디렉토리")
+    parser.add_argument("--model-file", default=None, help="ONNX 파일 이름 (기본: 자동 탐색)")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="리뷰 코퍼스 (.jsonl 또는 .txt)")
+    parser.add_argument("--batch-sizes", type=parse_ints, default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--threads", type=parse_ints, default=[1, 2, 4], help="intra-op 스레드 수 목록")
+    parser.add_argument("--min-reviews", type=int, default=256, help="배치 크기별 최소 추론 리뷰 수")
+    parser.add_argument("--warmup", type=int, default=3, help="측정 전 워밍업 호출 수")
+    parser.add_argument("--chunking", action="store_true", help="긴 리뷰 토큰 윈도우 분할 사용")
+    parser.add_argument("--no-graph-cache", action="store_true", help="최적화 그래프 캐시 사용 안 함")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    texts = load_corpus(args.corpus)
+
+    print("=" * 60, file=sys.stderr)
+    print("감성 분석 추론 벤치마크", file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
+    print(f"모델: {args.model_dir}", file=sys.stderr)
+    print(f"코퍼스: {args.corpus} ({len(texts)}개)", file=sys.stderr)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "onnxruntime": ort.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": available_cpus()
+        },
+        "corpus": {
+            "path": str(args.corpus),
+            "size": len(texts),
+            "sha256": file_sha256(args.corpus)
+        },
+        "settings": {
+            "length_buckets": list(DEFAULT_LENGTH_BUCKETS),
+            "chunking": args.chunking,
+            "graph_cache": not args.no_graph_cache
+        },
+        "runs": []
+    }
+
+    for threads in args.threads:
+        print(f"\n[threads={threads}] 모델 로드 중...", file=sys.stderr)
+
+        started = time.perf_counter()
+        engine = OnnxSentimentEngine(
+            args.model_dir,
+            model_file=args.model_file,
+            session_options=build_session_options(intra_op_threads=threads),
+            use_graph_cache=not args.no_graph_cache,
+            max_batch_size=max(args.batch_sizes),
+            chunking=args.chunking
+        )
+        load_ms = (time.perf_counter() - started) * 1000
+
+        report.setdefault("model", model_metadata(engine))
+
+        for batch_size in args.batch_sizes:
+            result = run_batch_size(engine, texts, batch_size, args.min_reviews, args.warmup)
+            result.update({"threads": threads, "load_ms": round(load_ms, 1)})
+            report["runs"].append(result)
+
+            print(
+                f"  batch={batch_size:>3}  p50={result['p50_ms']:>8.2f}ms  "
+                f"p99={result['p99_ms']:>8.2f}ms  {result['reviews_per_sec']:>8.1f} reviews/s",
+                file=sys.stderr
+            )
+
+        del engine
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+        print(f"\n✅ 결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+감성 분석 엔진 비교 (pipeline vs onnx)
+
+1. 두 엔진의 라벨/점수가 같은지 확인 (parity)
+2. 로드 시간과 단건/배치 추론 지연 시간 비교
+
+실행: python scripts/compare_engines.py [--texts scripts/data/sample_reviews.jsonl]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.onnx_engine import OnnxSentimentEngine
+
+# 설정
+MODEL_DIR = Path("./app/models/sentiment")
+DEFAULT_TEXTS = Path(__file__).resolve().parent / "data" / "sample_reviews.jsonl"
+
+
+def load_texts(path: Path):
+    """JSONL 파일에서 text 필드 읽기"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["text"] for line in f if line.strip()]
+
+
+def load_pipeline():
+    """기존 optimum + transformers pipeline"""
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer, pipeline
+
+    model = ORTModelForSequenceClassification.from_pretrained(MODEL_DIR)
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_DIR)
+    classifier = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
+    return lambda texts: classifier(texts, batch_size=len(texts), truncation=True)
+
+
+def load_onnx():
+    """tokenizers + onnxruntime 경량 엔진"""
+    return OnnxSentimentEngine(MODEL_DIR)
+
+
+def timed_load(loader):
+    start = time.perf_counter()
+    engine = loader()
+    return engine, (time.perf_counter() - start) * 1000
+
+
+def measure(engine, texts, repeat: int):
+    """단건 지연 시간(ms) 목록과 전체 배치 1회 지연 시간(ms)"""
+    engine(texts[:1])  # 첫 호출 워밍업
+
+    single = []
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            engine([text])
+            single.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    engine(texts)
+    batch = (time.perf_counter() - start) * 1000
+
+    return single, batch
+
+
+def percentile(values, q):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pipeline / onnx 엔진 비교")
+    parser.add_argument("--texts", type=Path, default=DEFAULT_TEXTS, help="비교용 JSONL 파일")
+    parser.add_argument("--repeat", type=int, default=3, help="단건 지연 측정 반복 횟수")
+    parser.add_argument("--tolerance", type=float, default=1e-3, help="허용 점수 차이")
+    args = parser.parse_args()
+
+    texts = load_texts(args.texts)
+
+    print("=" * 60)
+    print("감성 분석 엔진 비교 (pipeline vs onnx)")
+    print("=" * 60)
+    print(f"모델: {MODEL_DIR}")
+    print(f"문장 수: {len(texts)}")
+
+    pipeline_engine, pipeline_load = timed_load(load_pipeline)
+    onnx_engine, onnx_load = timed_load(load_onnx)
+
+    # Step 1: parity
+    print("\n[1/2] 결과 일치 여부 확인 중...")
+
+    expected = [pipeline_engine([text])[0] for text in texts]
+    actual_single = [onnx_engine([text])[0] for text in texts]
+    actual_batch = onnx_engine(texts)
+
+    mismatches = 0
+    for text, exp, single, batch in zip(texts, expected, actual_single, actual_batch):
+        for actual in (single, batch):
+            if actual["label"] != exp["label"] or abs(actual["score"] - exp["score"]) > args.tolerance:
+                mismatches += 1
+                print(f"❌ 불일치: {text[:30]}... pipeline={exp} onnx={actual}")
+                break
+
+    if mismatches:
+        print(f"❌ {mismatches}/{len(texts)}개 문장 불일치")
+    else:
+        print(f"✅ {len(texts)}개 문장 모두 일치 (tolerance={args.tolerance})")
+
+    # Step 2: latency
+    print("\n[2/2] 지연 시간 측정 중...")
+
+    report = {}
+    for name, engine, load_ms in (
+        ("pipeline", pipeline_engine, pipeline_load),
+        ("onnx", onnx_engine, onnx_load)
+    ):
+        single, batch = measure(engine, texts, args.repeat)
+        report[name] = {
+            "load_ms": round(load_ms, 1),
+            "single_mean_ms": round(statistics.mean(single), 2),
+            "single_p50_ms": round(percentile(single, 50), 2),
+            "single_p95_ms": round(percentile(single, 95), 2),
+            "batch_ms": round(batch, 2)
+        }
+
+    print("\n" + "=" * 60)
+    print("결과")
+    print("=" * 60)
+    print(f"{'':>16}{'pipeline':>12}{'onnx':>12}")
+    for key in report["onnx"]:
+        print(f"{key:>16}{report['pipeline'][key]:>12}{report['onnx'][key]:>12}")
+
+    print("\n" + json.dumps({"mismatches": mismatches, **report}, ensure_ascii=False))
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
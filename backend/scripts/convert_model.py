@@ -1,139 +1,597 @@
 """
 Optimum을 사용한 감성 분석 모델 ONNX 변환 및 양자화
 
-실행: python scripts/convert_model.py
+여러 변환 결과(variant)를 만들고, 라벨이 달린 평가 세트로 정확도와 속도를 측정한 뒤
+fp32 대비 정확도 허용 범위 안에서 가장 빠른 모델을 배포 경로에 복사한다.
+
+Variant:
+- fp32               : ONNX 변환 원본
+- o2 / o3            : ORT 그래프 최적화 (attention fusion 포함, o3는 GELU 근사 추가)
+- dynamic-avx2       : 동적 int8 양자화 (AVX2)
+- dynamic-avx512     : 동적 int8 양자화 (AVX-512)
+- dynamic-avx512vnni : 동적 int8 양자화 (AVX-512 VNNI, 기존 기본값)
+- static-int8        : 정적 int8 양자화 (캘리브레이션 데이터로 activation 범위 고정)
+
+정적 양자화 캘리브레이션 데이터:
+- --calibration-source file : 로컬 JSONL(text 필드) 또는 한 줄에 리뷰 하나인 텍스트 파일 (--calibration-file 필수)
+- --calibration-source db   : reviews 테이블의 content (DATABASE_URL 필요)
+캘리브레이션 데이터로 평가하면 static-int8 만 유리해지므로 평가 파일과 같은 파일은 쓸 수 없다.
+두 경우 모두 --seed 로 고정된 표본을 뽑고, 사용한 문장을 calibration.jsonl 로 남긴다.
+네트워크 없이 재현하려면 --reuse-export 로 저장된 fp32 모델을 재사용한다.
+
+배포:
+- 자동 선택 배포는 --eval-file 로 라벨 달린 held-out 세트(MIN_EVAL_ROWS 행 이상)를 지정해야 한다.
+  (40행이면 예측 하나가 정확도를 0.025 바꾸므로 --tolerance 비교가 의미 없음)
+- 동봉된 scripts/data/sample_reviews.jsonl 은 동작 확인(smoke test)용이다.
+  --eval-file 없이 실행하면 이 파일로 평가만 하고, --deploy-variant 로 지정한 variant 만 배포한다.
+
+실행: python scripts/convert_model.py --eval-file heldout.jsonl [--variants fp32,o2,dynamic-avx512vnni] [--tolerance 0.01]
+      python scripts/convert_model.py --variants dynamic-avx512vnni --deploy-variant dynamic-avx512vnni
+      python scripts/convert_model.py --variants fp32,static-int8 --calibration-file calib.txt --calibrator percentile
+      python scripts/convert_model.py --variants fp32,static-int8 --calibration-source db
 """
 
-import os
-from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
-from optimum.onnxruntime.configuration import AutoQuantizationConfig
-from transformers import AutoTokenizer
+import argparse
+import hashlib
+import json
+import random
+import shutil
+import statistics
+import sys
+import time
 from pathlib import Path
 
+from optimum.onnxruntime import ORTModelForSequenceClassification, ORTOptimizer, ORTQuantizer
+from optimum.onnxruntime.configuration import (
+    AutoCalibrationConfig,
+    AutoOptimizationConfig,
+    AutoQuantizationConfig
+)
+from transformers import AutoTokenizer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.onnx_engine import OnnxSentimentEngine
+
 # 설정
 MODEL_NAME = "matthewburke/korean_sentiment"  # 또는 다른 감성 분석 모델
 OUTPUT_DIR = Path("./app/models/sentiment")
+WORK_DIR = Path("./app/models/variants")
+SMOKE_EVAL_FILE = Path(__file__).resolve().parent / "data" / "sample_reviews.jsonl"
+
+# 자동 선택 배포에 필요한 최소 평가 행 수 (1/N 이 --tolerance 보다 충분히 작도록)
+MIN_EVAL_ROWS = 200
+
+# 모델 라벨 → 평가 세트 라벨
+LABEL_MAP = {"LABEL_0": "negative", "LABEL_1": "positive"}
+
+ALL_VARIANTS = [
+    "fp32",
+    "o2",
+    "o3",
+    "dynamic-avx2",
+    "dynamic-avx512",
+    "dynamic-avx512vnni",
+    "static-int8"
+]
+
+DYNAMIC_CONFIGS = {
+    "dynamic-avx2": AutoQuantizationConfig.avx2,
+    "dynamic-avx512": AutoQuantizationConfig.avx512,
+    "dynamic-avx512vnni": AutoQuantizationConfig.avx512_vnni
+}
+
+CALIBRATORS = ("minmax", "entropy", "percentile")
+
+# DB 캘리브레이션 표본 추출용 곱셈 해시 상수 (Knuth, 2^32 황금비)
+SAMPLE_HASH_MULTIPLIER = 2654435761
+
+# 추론 엔진이 우선 찾는 파일 이름 (app/services/onnx_engine.py)
+DEPLOY_FILE_NAMES = ("model_quantized.onnx", "model.onnx")
+
+
+def load_labelled(path: Path):
+    """{"text": ..., "label": "positive"|"negative"} JSONL 읽기"""
+    with open(path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    return [row["text"] for row in rows], [row["label"] for row in rows]
+
+
+def load_texts(path: Path):
+    """JSONL(text 필드) 또는 한 줄에 리뷰 하나인 텍스트 파일 읽기"""
+    texts = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            texts.append(json.loads(line)["text"] if path.suffix == ".jsonl" else line)
+    return texts
+
+
+def load_db_texts(min_length: int, samples: int, seed: int):
+    """
+    reviews 테이블에서 seed 고정 표본을 SQL 로 추출 → (표본 문장 목록, 조건에 맞는 전체 행 수)
+
+    테이블 전체를 읽지 않도록 길이 조건과 표본 추출을 쿼리에서 처리한다.
+    id 를 seed 로 섞은 값 ((id * seed 별 홀수 곱셈 상수) mod 2^32) 순서로 samples 개만 가져오므로
+    같은 데이터 + seed 면 같은 표본이 나온다. (PostgreSQL / SQLite 공통)
+    """
+    from sqlalchemy import func
+
+    from app.database import Session as SessionLocal
+    from app.models import Review
+
+    condition = func.length(func.trim(Review.content)) >= min_length
+
+    db = SessionLocal()
+    try:
+        population = db.query(func.count(Review.id)).filter(condition).scalar()
+
+        query = db.query(Review.id, Review.content).filter(condition)
+        if samples > 0:
+            # 홀수 * 홀수 = 홀수 → mod 2^32 에서 seed 마다 다른 순열
+            multiplier = SAMPLE_HASH_MULTIPLIER * (2 * seed + 1) % 4294967296
+            query = query.order_by((Review.id * multiplier) % 4294967296, Review.id).limit(samples)
+        rows = query.all()
+    finally:
+        db.close()
+
+    # 표본은 id 순서로 기록 (calibration.jsonl sha256 고정)
+    return [content for _, content in sorted(rows)], population
+
+
+def sample_calibration_texts(texts, samples: int, seed: int):
+    """seed 고정 표본 추출 (같은 입력 + seed → 같은 표본)"""
+    if samples <= 0 or len(texts) <= samples:
+        return list(texts)
+    indices = sorted(random.Random(seed).sample(range(len(texts)), samples))
+    return [texts[i] for i in indices]
+
+
+def export_fp32(work_dir: Path, reuse: bool = False) -> Path:
+    """Hugging Face → ONNX (fp32)"""
+    fp32_dir = work_dir / "fp32"
+
+    if reuse and (fp32_dir / "model.onnx").exists():
+        print(f"  저장된 fp32 모델 재사용: {fp32_dir}")
+        return fp32_dir
 
-def main():
-    """메인 실행"""
-    
-    print("=" * 60)
-    print("감성 분석 모델 변환 및 양자화")
-    print("=" * 60)
-    print(f"모델: {MODEL_NAME}")
-    print(f"출력 경로: {OUTPUT_DIR}")
-    
-    # 출력 디렉토리 생성
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Step 1: ONNX 변환
-    print("\n[1/3] ONNX 변환 중...")
-    
     model = ORTModelForSequenceClassification.from_pretrained(
         MODEL_NAME,
         export=True  # Hugging Face → ONNX 자동 변환
     )
-    
     tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-    
-    # 임시 저장
-    temp_dir = OUTPUT_DIR / "temp"
-    model.save_pretrained(temp_dir)
-    tokenizer.save_pretrained(temp_dir)
-    
-    print("✅ ONNX 변환 완료!")
-    
-    # Step 2: 양자화
-    print("\n[2/3] Dynamic Quantization 적용 중...")
-    
-    quantizer = ORTQuantizer.from_pretrained(temp_dir)
-    
-    # Dynamic Quantization 설정
-    dqconfig = AutoQuantizationConfig.avx512_vnni(
-        is_static=False,  # Dynamic Quantization
-        per_channel=False
+
+    model.save_pretrained(fp32_dir)
+    tokenizer.save_pretrained(fp32_dir)
+
+    return fp32_dir
+
+
+def build_optimized(fp32_dir: Path, work_dir: Path, name: str) -> Path:
+    """ORT 그래프 최적화 (O2: attention fusion, O3: + GELU 근사)"""
+    save_dir = work_dir / name
+    config = AutoOptimizationConfig.O2() if name == "o2" else AutoOptimizationConfig.O3()
+
+    optimizer = ORTOptimizer.from_pretrained(fp32_dir)
+    optimizer.optimize(save_dir=save_dir, optimization_config=config)
+
+    return save_dir
+
+
+def build_dynamic(fp32_dir: Path, work_dir: Path, name: str) -> Path:
+    """동적 int8 양자화 (activation 범위는 추론 시 계산)"""
+    save_dir = work_dir / name
+    qconfig = DYNAMIC_CONFIGS[name](is_static=False, per_channel=False)
+
+    quantizer = ORTQuantizer.from_pretrained(fp32_dir, file_name="model.onnx")
+    quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+
+    return save_dir
+
+
+def build_calibration_dataset(tokenizer, texts, max_length: int):
+    """캘리브레이션용 Dataset (모델 입력 컬럼만)"""
+    from datasets import Dataset
+
+    encoded = tokenizer(
+        texts,
+        padding="max_length",
+        truncation=True,
+        max_length=max_length
+    )
+    return Dataset.from_dict({key: encoded[key] for key in encoded.keys()})
+
+
+def build_calibration_config(calibrator: str, dataset, percentile: float):
+    """MinMax / Entropy / Percentile 캘리브레이터 설정"""
+    if calibrator == "entropy":
+        return AutoCalibrationConfig.entropy(dataset)
+    if calibrator == "percentile":
+        return AutoCalibrationConfig.percentiles(dataset, percentile=percentile)
+    return AutoCalibrationConfig.minmax(dataset)
+
+
+def build_static(
+    fp32_dir: Path,
+    work_dir: Path,
+    calibration_texts,
+    calibrator: str = "minmax",
+    percentile: float = 99.999,
+    max_length: int = 128
+) -> Path:
+    """정적 int8 양자화 (캘리브레이션으로 activation 범위를 미리 고정)"""
+    save_dir = work_dir / "static-int8"
+    save_dir.mkdir(parents=True, exist_ok=True)
+
+    # 토크나이저는 로컬 fp32 디렉토리에서만 읽음 (네트워크 불필요)
+    tokenizer = AutoTokenizer.from_pretrained(fp32_dir, local_files_only=True)
+    dataset = build_calibration_dataset(tokenizer, calibration_texts, max_length)
+
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=True, per_channel=False)
+    calibration_config = build_calibration_config(calibrator, dataset, percentile)
+
+    quantizer = ORTQuantizer.from_pretrained(fp32_dir, file_name="model.onnx")
+    ranges = quantizer.fit(
+        dataset=dataset,
+        calibration_config=calibration_config,
+        operators_to_quantize=qconfig.operators_to_quantize,
+        onnx_augmented_model_name=save_dir / "augmented_model.onnx"
     )
-    
-    # 양자화 수행
     quantizer.quantize(
-        save_dir=OUTPUT_DIR,
-        quantization_config=dqconfig
+        save_dir=save_dir,
+        quantization_config=qconfig,
+        calibration_tensors_range=ranges
     )
-    
-    # 토크나이저 복사
-    tokenizer.save_pretrained(OUTPUT_DIR)
-    
-    print("✅ 양자화 완료!")
-    
-    # Step 3: 임시 파일 정리
-    print("\n[3/3] 임시 파일 정리 중...")
-    
-    import shutil
-    shutil.rmtree(temp_dir)
-    
-    print("✅ 정리 완료!")
-    
-    # Step 4: 파일 크기 확인
+    (save_dir / "augmented_model.onnx").unlink(missing_ok=True)
+
+    return save_dir
+
+
+def variant_model_file(variant_dir: Path) -> Path:
+    """variant 디렉토리의 최종 ONNX 파일"""
+    for pattern in ("*_quantized.onnx", "*_optimized.onnx", "model.onnx"):
+        files = sorted(variant_dir.glob(pattern))
+        if files:
+            return files[0]
+    raise FileNotFoundError(f"ONNX model not found in {variant_dir}")
+
+
+def copy_tokenizer_files(src: Path, dst: Path):
+    """토크나이저/설정 파일 복사 (ONNX 파일은 제외)"""
+    for path in src.iterdir():
+        if path.is_file() and path.suffix in (".json", ".txt"):
+            shutil.copy2(path, dst / path.name)
+
+
+def evaluate(variant_dir: Path, texts, labels, repeat: int = 3) -> dict:
+    """정확도 + 단건 지연 시간 + 배치 처리량"""
+    model_file = variant_model_file(variant_dir)
+
+    started = time.perf_counter()
+    engine = OnnxSentimentEngine(variant_dir, model_file=model_file.name, use_graph_cache=False)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    predictions = [LABEL_MAP.get(output["label"], output["label"]) for output in engine.predict(texts)]
+    accuracy = sum(p == l for p, l in zip(predictions, labels)) / len(labels)
+
+    engine.predict(texts[:1])  # 워밍업
+    latencies = []
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            engine.predict([text])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        engine.predict(texts)
+    batch_elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "model_file": str(model_file),
+        "size_mb": round(model_file.stat().st_size / (1024 * 1024), 2),
+        "load_ms": round(load_ms, 1),
+        "accuracy": round(accuracy, 4),
+        "latency_mean_ms": round(statistics.mean(latencies), 3),
+        "latency_p50_ms": round(latencies[len(latencies) // 2], 3),
+        "latency_p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+        "batch_reviews_per_sec": round(len(texts) * repeat / batch_elapsed, 1)
+    }
+
+
+def select_best(results: dict, tolerance: float):
+    """fp32 대비 정확도 하락이 tolerance 이내인 variant 중 단건 지연이 가장 짧은 것"""
+    baseline = results.get("fp32", {}).get("accuracy")
+    if baseline is None:
+        baseline = max(result["accuracy"] for result in results.values())
+
+    eligible = {
+        name: result for name, result in results.items()
+        if result["accuracy"] >= baseline - tolerance
+    }
+    best = min(eligible, key=lambda name: eligible[name]["latency_mean_ms"])
+    return best, baseline
+
+
+def write_report(
+    results: dict,
+    best: str,
+    baseline: float,
+    tolerance: float,
+    path: Path,
+    calibration: dict = None,
+    evaluation: dict = None
+):
+    """JSON + Markdown 리포트"""
+    report = {
+        "model_name": MODEL_NAME,
+        "evaluation": evaluation,
+        "baseline_accuracy": baseline,
+        "tolerance": tolerance,
+        "selected": best,
+        "calibration": calibration,
+        "variants": results
+    }
+    path.with_suffix(".json").write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    lines = [
+        f"# 양자화/최적화 비교 ({MODEL_NAME})",
+        "",
+        f"- 기준 정확도 (fp32): {baseline:.4f}, 허용 하락폭: {tolerance}",
+        f"- 선택: **{best}**",
+    ]
+    if evaluation:
+        smoke = " (smoke test, 선택 결과 신뢰 불가)" if evaluation["smoke"] else ""
+        lines.append(f"- 평가 세트: {evaluation['file']} {evaluation['rows']}행{smoke}")
+    if calibration:
+        lines.append(
+            f"- 캘리브레이션: {calibration['source']} {calibration['samples']}개 "
+            f"(seed={calibration['seed']}, {calibration['calibrator']}, sha256={calibration['sha256'][:12]})"
+        )
+    lines += [
+        "",
+        "| variant | size (MB) | accuracy | mean (ms) | p50 (ms) | p95 (ms) | batch (reviews/s) |",
+        "|---|---|---|---|---|---|---|"
+    ]
+    for name, r in results.items():
+        marker = " ✅" if name == best else ""
+        lines.append(
+            f"| {name}{marker} | {r['size_mb']} | {r['accuracy']} | {r['latency_mean_ms']} | "
+            f"{r['latency_p50_ms']} | {r['latency_p95_ms']} | {r['batch_reviews_per_sec']} |"
+        )
+    path.with_suffix(".md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def deploy(variant_dir: Path, name: str):
+    """선택된 variant를 배포 경로로 복사 (엔진이 찾는 이름으로)"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    # 이전 배포의 모델 / 양자화 설정이 남지 않도록 정리
+    for file_name in (*DEPLOY_FILE_NAMES, "ort_config.json"):
+        (OUTPUT_DIR / file_name).unlink(missing_ok=True)
+
+    model_file = variant_model_file(variant_dir)
+    target = "model_quantized.onnx" if name.startswith(("dynamic", "static")) else "model.onnx"
+    shutil.copy2(model_file, OUTPUT_DIR / target)
+    copy_tokenizer_files(variant_dir, OUTPUT_DIR)
+
+    return OUTPUT_DIR / target
+
+
+def prepare_calibration(args) -> list:
+    """캘리브레이션 문장 표본 추출 + 재현용 기록 (calibration.jsonl / calibration_meta.json)"""
+    if args.calibration_source == "db":
+        from app.services.sentiment import MIN_TEXT_LENGTH
+
+        sample, population = load_db_texts(MIN_TEXT_LENGTH, args.calibration_samples, args.seed)
+        source = "db:reviews.content"
+    else:
+        texts = load_texts(args.calibration_file)
+        source = str(args.calibration_file)
+        sample = sample_calibration_texts(texts, args.calibration_samples, args.seed)
+        population = len(texts)
+
+    if not sample:
+        raise ValueError(f"캘리브레이션 데이터가 없습니다 ({source})")
+
+    lines = [json.dumps({"text": text}, ensure_ascii=False) for text in sample]
+    body = "\n".join(lines) + "\n"
+    (args.work_dir / "calibration.jsonl").write_text(body, encoding="utf-8")
+
+    meta = {
+        "source": source,
+        "population": population,
+        "samples": len(sample),
+        "seed": args.seed,
+        "calibrator": args.calibrator,
+        "percentile": args.percentile if args.calibrator == "percentile" else None,
+        "max_length": args.calibration_max_length,
+        "sha256": hashlib.sha256(body.encode("utf-8")).hexdigest()
+    }
+    (args.work_dir / "calibration_meta.json").write_text(
+        json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+    print(f"    캘리브레이션: {source} {len(sample)}/{population}개 (seed={args.seed}, {args.calibrator})")
+    return sample
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description="감성 분석 모델 변환 / 양자화 / 선택")
+    parser.add_argument("--variants", default=None, help="만들 variant 목록 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--eval-file", type=Path, default=None, help=f"라벨이 달린 held-out 평가 JSONL (자동 선택 배포 시 필수, {MIN_EVAL_ROWS}행 이상)")
+    parser.add_argument("--min-eval-rows", type=int, default=MIN_EVAL_ROWS, help="자동 선택 배포에 필요한 최소 평가 행 수")
+    parser.add_argument("--calibration-source", choices=("file", "db"), default="file", help="캘리브레이션 데이터 출처")
+    parser.add_argument("--calibration-file", type=Path, default=None, help="캘리브레이션 파일 (.jsonl 또는 .txt, 평가 파일과 달라야 함)")
+    parser.add_argument("--calibrator", choices=CALIBRATORS, default="minmax", help="activation 범위 계산 방식")
+    parser.add_argument("--percentile", type=float, default=99.999, help="percentile 캘리브레이터 기준")
+    parser.add_argument("--calibration-samples", type=int, default=512, help="캘리브레이션 문장 수 (0 = 전체)")
+    parser.add_argument("--calibration-max-length", type=int, default=128, help="캘리브레이션 입력 토큰 길이")
+    parser.add_argument("--seed", type=int, default=42, help="캘리브레이션 표본 seed")
+    parser.add_argument("--reuse-export", action="store_true", help="work-dir 의 fp32 모델이 있으면 재사용")
+    parser.add_argument("--tolerance", type=float, default=0.01, help="fp32 대비 허용 정확도 하락폭")
+    parser.add_argument("--work-dir", type=Path, default=WORK_DIR, help="variant 저장 경로")
+    parser.add_argument("--no-deploy", action="store_true", help="선택만 하고 배포 경로에 복사하지 않음")
+    parser.add_argument("--deploy-variant", choices=ALL_VARIANTS, default=None, help="정확도 비교 없이 이 variant 를 배포")
+    args = parser.parse_args()
+
+    if args.variants is None:
+        variants = list(ALL_VARIANTS)
+        if args.calibration_source == "file" and args.calibration_file is None:
+            # 캘리브레이션 데이터를 따로 주지 않으면 static-int8 은 만들지 않음
+            variants.remove("static-int8")
+            print("ℹ️ --calibration-file 이 없어 static-int8 은 생략합니다")
+    else:
+        variants = [v.strip() for v in args.variants.split(",") if v.strip()]
+    unknown = set(variants) - set(ALL_VARIANTS)
+    if unknown:
+        parser.error(f"알 수 없는 variant: {', '.join(sorted(unknown))}")
+    if args.deploy_variant and args.deploy_variant not in variants:
+        variants.append(args.deploy_variant)
+
+    # held-out 세트가 없으면 동봉된 샘플로 동작 확인만
+    smoke = args.eval_file is None
+    if smoke:
+        args.eval_file = SMOKE_EVAL_FILE
+    texts, labels = load_labelled(args.eval_file)
+
+    if not args.no_deploy and not args.deploy_variant:
+        if smoke:
+            parser.error(
+                f"자동 선택 배포에는 --eval-file (held-out, {args.min_eval_rows}행 이상)이 필요합니다 "
+                f"({SMOKE_EVAL_FILE.name} 는 smoke test 용, --no-deploy 또는 --deploy-variant 사용)"
+            )
+        if len(texts) < args.min_eval_rows:
+            parser.error(
+                f"평가 세트가 {len(texts)}행뿐입니다 (자동 선택 배포는 {args.min_eval_rows}행 이상 필요, "
+                f"예측 하나가 정확도를 {1 / len(texts):.4f} 바꿈)"
+            )
+
+    if "static-int8" in variants and args.calibration_source == "file":
+        if args.calibration_file is None:
+            parser.error("static-int8 은 --calibration-file 또는 --calibration-source db 가 필요합니다")
+        if args.calibration_file.resolve() == args.eval_file.resolve():
+            parser.error("캘리브레이션 파일과 평가 파일이 같습니다 (평가에 쓰지 않는 파일을 지정하세요)")
+
+    print("=" * 60)
+    print("감성 분석 모델 변환 및 양자화")
+    print("=" * 60)
+    print(f"모델: {MODEL_NAME}")
+    print(f"Variant: {', '.join(variants)}")
+    print(f"출력 경로: {OUTPUT_DIR}")
+
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+
+    # Step 1: ONNX 변환 (fp32 원본은 variants/fp32 에 보존)
+    print("\n[1/4] ONNX 변환 중...")
+    fp32_dir = export_fp32(args.work_dir, reuse=args.reuse_export)
+    print("✅ ONNX 변환 완료!")
+
+    # Step 2: variant 생성
+    print("\n[2/4] Variant 생성 중...")
+    variant_dirs = {}
+    for name in variants:
+        print(f"  - {name}")
+        try:
+            if name == "fp32":
+                variant_dirs[name] = fp32_dir
+            elif name in ("o2", "o3"):
+                variant_dirs[name] = build_optimized(fp32_dir, args.work_dir, name)
+            elif name in DYNAMIC_CONFIGS:
+                variant_dirs[name] = build_dynamic(fp32_dir, args.work_dir, name)
+            elif name == "static-int8":
+                calibration_texts = prepare_calibration(args)
+                variant_dirs[name] = build_static(
+                    fp32_dir,
+                    args.work_dir,
+                    calibration_texts,
+                    calibrator=args.calibrator,
+                    percentile=args.percentile,
+                    max_length=args.calibration_max_length
+                )
+
+            if variant_dirs.get(name) and variant_dirs[name] != fp32_dir:
+                copy_tokenizer_files(fp32_dir, variant_dirs[name])
+        except Exception as e:
+            print(f"    ❌ {name} 생성 실패: {e}")
+    print("✅ Variant 생성 완료!")
+
+    # Step 3: 정확도 / 속도 측정
+    print("\n[3/4] 평가 중...")
+    if smoke:
+        print(f"  ⚠️ {SMOKE_EVAL_FILE.name} ({len(texts)}행) 로 동작 확인만 합니다 (선택 결과로 배포하지 않음)")
+    results = {}
+    for name, variant_dir in variant_dirs.items():
+        results[name] = evaluate(variant_dir, texts, labels)
+        r = results[name]
+        print(f"  - {name:<20} acc={r['accuracy']:.4f}  mean={r['latency_mean_ms']:.2f}ms  size={r['size_mb']}MB")
+
+    if not results:
+        print("❌ 평가할 variant가 없습니다")
+        sys.exit(1)
+
+    # Step 4: 선택 + 리포트 + 배포
+    print("\n[4/4] 선택 중...")
+    best, baseline = select_best(results, args.tolerance)
+    report_path = args.work_dir / "quantization_report"
+    calibration = None
+    calibration_meta = args.work_dir / "calibration_meta.json"
+    if "static-int8" in results and calibration_meta.exists():
+        calibration = json.loads(calibration_meta.read_text(encoding="utf-8"))
+    evaluation = {"file": str(args.eval_file), "rows": len(texts), "smoke": smoke}
+    write_report(results, best, baseline, args.tolerance, report_path, calibration, evaluation)
+    print(f"✅ 선택: {best} (리포트: {report_path}.md)")
+
     print("\n" + "=" * 60)
     print("결과")
     print("=" * 60)
-    
-    onnx_file = OUTPUT_DIR / "model.onnx"
-    quantized_file = OUTPUT_DIR / "model_quantized.onnx"
-    
-    if onnx_file.exists():
-        original_size = onnx_file.stat().st_size / (1024 * 1024)
-        print(f"원본 ONNX: {original_size:.2f} MB")
-    
-    if quantized_file.exists():
-        quantized_size = quantized_file.stat().st_size / (1024 * 1024)
-        print(f"양자화 모델: {quantized_size:.2f} MB")
-        
-        if onnx_file.exists():
-            reduction = (1 - quantized_size / original_size) * 100
-            print(f"크기 감소: {reduction:.1f}%")
-    
+
+    if args.no_deploy:
+        print("배포 생략 (--no-deploy)")
+        return
+
+    if args.deploy_variant:
+        if args.deploy_variant not in variant_dirs:
+            print(f"❌ {args.deploy_variant} 생성에 실패해서 배포할 수 없습니다")
+            sys.exit(1)
+        best = args.deploy_variant
+        print(f"지정한 variant 배포 (--deploy-variant): {best}")
+
+    deployed = deploy(variant_dirs[best], best)
+    print(f"배포 모델: {deployed} ({deployed.stat().st_size / (1024 * 1024):.2f} MB)")
     print(f"\n✅ 모든 파일이 저장되었습니다: {OUTPUT_DIR}")
-    
+
     # Step 5: 간단한 테스트
     print("\n" + "=" * 60)
     print("테스트")
     print("=" * 60)
-    
+
     test_inference()
 
 def test_inference():
-    """양자화 모델 테스트"""
-    
-    from transformers import pipeline
-    
+    """배포 모델 테스트"""
+
     print("\n테스트 문장으로 추론 중...")
-    
-    # 양자화 모델 로드
-    model = ORTModelForSequenceClassification.from_pretrained(OUTPUT_DIR)
-    tokenizer = AutoTokenizer.from_pretrained(OUTPUT_DIR)
-    
-    # Pipeline 생성
-    classifier = pipeline(
-        "sentiment-analysis",
-        model=model,
-        tokenizer=tokenizer
-    )
-    
+
+    engine = OnnxSentimentEngine(OUTPUT_DIR)
+
     # 테스트
     test_cases = [
         "이 영화 정말 재미있어요! 강력 추천합니다.",
         "너무 지루하고 별로였어요. 시간 낭비.",
         "그냥 그래요. 나쁘지는 않지만 특별하지도 않아요."
     ]
-    
-    for text in test_cases:
-        result = classifier(text)[0]
+
+    for text, result in zip(test_cases, engine.predict(test_cases)):
         label = result["label"]
         score = result["score"]
-        
+
         print(f"\n문장: {text}")
         print(f"결과: {label} ({score:.2%})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
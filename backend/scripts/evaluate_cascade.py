@@ -0,0 +1,132 @@
+"""
+감성 사전 cascade 오프라인 평가
+
+코퍼스 전체를 모델로 채점한 뒤, 확신도 기준(threshold)별로
+- 사전이 바로 답한 비율 (coverage)
+- 사전이 답한 리뷰에서 모델과 같은 라벨인 비율 (agreement)
+- 정답 라벨이 있으면 cascade / 모델 단독 정확도
+를 비교한다. 사전을 고치거나 SENTIMENT_CASCADE_THRESHOLD 를 정할 때 사용.
+
+실행: python scripts/evaluate_cascade.py [--corpus reviews.jsonl] [--thresholds 0.8,0.9,0.95] [--show-disagreements 20]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.lexicon import CASCADE_MAX_LENGTH, LEXICON_VERSION, score_text
+from app.services.onnx_engine import OnnxSentimentEngine
+from app.services.sentiment import normalize_label
+
+# 설정
+MODEL_DIR = Path("./app/models/sentiment")
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "data" / "sample_reviews.jsonl"
+
+
+def load_corpus(path: Path):
+    """JSONL ({"text": ..., "label": 선택}) 읽기"""
+    texts, labels = [], []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            texts.append(row["text"])
+            labels.append(row.get("label"))
+    return texts, labels
+
+
+def parse_floats(value: str):
+    return [float(v) for v in value.split(",") if v.strip()]
+
+
+def ratio(numerator: int, denominator: int):
+    return round(numerator / denominator, 4) if denominator else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감성 사전 cascade 평가")
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR, help="모델 디렉토리")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="평가 JSONL (label 필드는 선택)")
+    parser.add_argument("--thresholds", type=parse_floats, default=[0.8, 0.85, 0.9, 0.95], help="확신도 기준 목록")
+    parser.add_argument("--show-disagreements", type=int, default=0, help="모델과 다른 사전 결과 N개 출력")
+    args = parser.parse_args()
+
+    texts, gold = load_corpus(args.corpus)
+    has_gold = all(label is not None for label in gold)
+
+    print("=" * 60, file=sys.stderr)
+    print(f"감성 사전 cascade 평가 ({LEXICON_VERSION}, 최대 {CASCADE_MAX_LENGTH}자)", file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
+    print(f"코퍼스: {args.corpus} ({len(texts)}개)", file=sys.stderr)
+
+    # 모델 단독
+    engine = OnnxSentimentEngine(args.model_dir)
+    engine.predict(texts[:1])  # 워밍업
+
+    start = time.perf_counter()
+    model_labels = [normalize_label(output["label"]) for output in engine.predict(texts)]
+    model_ms = (time.perf_counter() - start) * 1000 / len(texts)
+
+    # 사전
+    start = time.perf_counter()
+    lexicon_scores = [score_text(text) for text in texts]
+    lexicon_us = (time.perf_counter() - start) * 1_000_000 / len(texts)
+
+    report = {
+        "lexicon_version": LEXICON_VERSION,
+        "corpus": str(args.corpus),
+        "size": len(texts),
+        "model_ms_per_review": round(model_ms, 3),
+        "lexicon_us_per_review": round(lexicon_us, 2),
+        "model_accuracy": ratio(sum(m == g for m, g in zip(model_labels, gold)), len(texts)) if has_gold else None,
+        "thresholds": []
+    }
+
+    for threshold in args.thresholds:
+        answered = [
+            i for i, scored in enumerate(lexicon_scores)
+            if scored is not None and scored[1] >= threshold
+        ]
+        agree = sum(lexicon_scores[i][0] == model_labels[i] for i in answered)
+
+        row = {
+            "threshold": threshold,
+            "coverage": ratio(len(answered), len(texts)),
+            "answered": len(answered),
+            "agreement_with_model": ratio(agree, len(answered))
+        }
+
+        if has_gold:
+            cascade_labels = list(model_labels)
+            for i in answered:
+                cascade_labels[i] = lexicon_scores[i][0]
+            row["lexicon_accuracy"] = ratio(sum(lexicon_scores[i][0] == gold[i] for i in answered), len(answered))
+            row["cascade_accuracy"] = ratio(sum(c == g for c, g in zip(cascade_labels, gold)), len(texts))
+
+        report["thresholds"].append(row)
+        print(
+            f"  threshold={threshold:<5} coverage={row['coverage']}  agreement={row['agreement_with_model']}"
+            + (f"  cascade_acc={row['cascade_accuracy']}" if has_gold else ""),
+            file=sys.stderr
+        )
+
+    if args.show_disagreements:
+        print("\n모델과 다른 사전 결과:", file=sys.stderr)
+        shown = 0
+        for i, scored in enumerate(lexicon_scores):
+            if scored is not None and scored[0] != model_labels[i]:
+                print(f"  [{scored[0]} {scored[1]} / model {model_labels[i]}] {texts[i][:60]}", file=sys.stderr)
+                shown += 1
+                if shown >= args.show_disagreements:
+                    break
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
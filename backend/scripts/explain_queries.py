@@ -0,0 +1,149 @@
+"""
+자주 실행되는 쿼리의 실행 계획 확인 (EXPLAIN)
+
+API 가 실제로 보내는 쿼리 모양 그대로 EXPLAIN 을 실행해서
+app/models.py 에 선언한 인덱스를 쓰는지 확인한다. 하나라도 안 쓰면 종료 코드 1.
+
+- PostgreSQL: EXPLAIN (FORMAT JSON), 데이터가 적으면 순차 스캔을 고르므로 enable_seqscan 을 끄고 확인
+- SQLite    : EXPLAIN QUERY PLAN
+
+실행: python scripts/explain_queries.py [--verbose]
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import func, select, text, tuple_
+
+from app.database import Base, engine
+from app.migrations import run_migrations
+from app.models import Movie, Review
+from app.services.sentiment import PENDING_LABEL
+
+# 커서 페이지네이션 (app/pagination.py) 다음 페이지 조건
+CURSOR = (datetime(2024, 1, 1), 1000)
+
+
+def page(statement, model, cursor=None):
+    """app.pagination.paginate 와 같은 모양의 쿼리"""
+    if cursor:
+        statement = statement.where(tuple_(model.created_at, model.id) < tuple_(*cursor))
+    return statement.order_by(model.created_at.desc(), model.id.desc()).limit(101)
+
+
+# (이름, 쿼리, 써야 하는 인덱스)
+QUERIES = [
+    (
+        "영화별 리뷰 (GET /reviews/movie/{id})",
+        page(select(Review).where(Review.movie_id == 1), Review),
+        "ix_reviews_movie_id_created_at_id"
+    ),
+    (
+        "영화별 리뷰 다음 페이지 (cursor)",
+        page(select(Review).where(Review.movie_id == 1), Review, CURSOR),
+        "ix_reviews_movie_id_created_at_id"
+    ),
+    (
+        "전체 리뷰 (GET /reviews/)",
+        page(select(Review), Review),
+        "ix_reviews_created_at_id"
+    ),
+    (
+        "전체 리뷰 다음 페이지 (cursor)",
+        page(select(Review), Review, CURSOR),
+        "ix_reviews_created_at_id"
+    ),
+    (
+        "영화 목록 (GET /movies/)",
+        page(select(Movie), Movie),
+        "ix_movies_created_at_id"
+    ),
+    (
+        "영화 목록 다음 페이지 (cursor)",
+        page(select(Movie), Movie, CURSOR),
+        "ix_movies_created_at_id"
+    ),
+    (
+        "추천 (GET /movies/recommend)",
+        select(Movie)
+        .where(Movie.rating >= 0.5, Movie.review_count > 0)
+        .order_by(Movie.rating.desc())
+        .limit(10),
+        "ix_movies_rating_reviewed"
+    ),
+    (
+        "영화 통계 집계 (refresh / reconcile)",
+        select(Review.movie_id, func.count(Review.id), func.sum(Review.sentiment_score))
+        .where(Review.movie_id.in_([1, 2, 3]))
+        .group_by(Review.movie_id),
+        "ix_reviews_movie_id_created_at_id"
+    ),
+    (
+        "백필 대기 리뷰 (SentimentBackfillWorker)",
+        select(Review).where(Review.sentiment_label == PENDING_LABEL).order_by(Review.id).limit(64),
+        "ix_reviews_pending"
+    ),
+]
+
+
+def explain(conn, statement) -> str:
+    """실행 계획을 문자열로"""
+    sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+
+    if engine.dialect.name == "postgresql":
+        plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+        return json.dumps(plan, ensure_ascii=False, indent=2)
+
+    if engine.dialect.name == "sqlite":
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return "\n".join(row[-1] for row in rows)
+
+    return "\n".join(str(row[0]) for row in conn.execute(text(f"EXPLAIN {sql}")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자주 실행되는 쿼리 실행 계획 확인")
+    parser.add_argument("--verbose", action="store_true", help="실행 계획 전체 출력")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"쿼리 실행 계획 확인 ({engine.dialect.name})")
+    print("=" * 60)
+
+    # 인덱스 준비
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    # 인덱스를 방금 만들었으면 새 연결에서 확인 (이전 연결의 스키마 정보를 쓰지 않도록)
+    engine.dispose()
+
+    failed = []
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("SET enable_seqscan = off"))
+
+        for name, statement, index in QUERIES:
+            plan = explain(conn, statement)
+            ok = index in plan
+            if not ok:
+                failed.append(name)
+
+            print(f"{'✅' if ok else '❌'} {name} → {index}")
+            if args.verbose or not ok:
+                print("   " + plan.replace("\n", "\n   "))
+
+        conn.rollback()
+
+    if failed:
+        print(f"\n❌ 인덱스를 쓰지 않는 쿼리 {len(failed)}개")
+        sys.exit(1)
+
+    print("\n✅ 모든 쿼리가 인덱스를 사용합니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+영화 누적 통계 점검 / 복구 (CLI)
+
+Movie 의 review_count / score_sum / scored_count 를 실제 리뷰 집계와 비교해
+어긋난 영화만 다시 계산한다. 평소에는 리뷰 작성/삭제 시 증감으로 유지되므로
+수동으로 DB를 고쳤거나 장애 후 확인이 필요할 때 실행한다.
+
+실행: python scripts/reconcile_movie_stats.py [--batch-size 500] [--dry-run]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import Base, Session, engine
+from app.migrations import run_migrations
+from app.services.movie_stats import reconcile_movie_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영화 누적 통계 점검 / 복구")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 번에 확인할 영화 수")
+    parser.add_argument("--dry-run", action="store_true", help="고치지 않고 불일치만 출력")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("영화 누적 통계 점검" + (" (dry-run)" if args.dry_run else ""))
+    print("=" * 60)
+
+    # score_sum / scored_count 컬럼 준비
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    db = Session()
+    try:
+        drifted = reconcile_movie_stats(db, batch_size=args.batch_size, fix=not args.dry_run, progress=print)
+    finally:
+        db.close()
+
+    if drifted:
+        action = "발견" if args.dry_run else "복구"
+        print(f"⚠️ 불일치 {len(drifted)}개 {action}")
+    else:
+        print("✅ 불일치 없음")
+
+    print(json.dumps(drifted, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+모델 교체 후 전체 리뷰 재채점 (CLI)
+
+활성 모델 버전(app/models/registry.json 또는 SENTIMENT_MODEL_VERSION)으로
+아직 채점되지 않은 리뷰를 id 순서로 다시 채점한다.
+중간에 멈추면 (Ctrl+C) 같은 명령으로 다시 실행해 체크포인트부터 이어서 진행한다.
+API(/admin/rescore)나 다른 CLI 가 같은 작업을 실행 중이면 시작하지 않는다.
+
+실행: python scripts/rescore_reviews.py [--batch-size 256] [--restart] [--all]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import Base, engine
+from app.migrations import run_migrations
+from app.services.rescore import RESCORE_BATCH_SIZE, RescoreJob
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리뷰 감성 재채점")
+    parser.add_argument("--batch-size", type=int, default=RESCORE_BATCH_SIZE, help="배치당 리뷰 수")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 버리고 처음부터")
+    parser.add_argument("--all", action="store_true", help="활성 버전으로 이미 채점된 리뷰도 다시")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("리뷰 감성 재채점")
+    print("=" * 60)
+
+    # 체크포인트 테이블 / model_version 컬럼 준비
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    job = RescoreJob(batch_size=args.batch_size)
+    try:
+        result = job.run(restart=args.restart, rescore_all=args.all)
+    except KeyboardInterrupt:
+        print("\n⏸️ 중단됨: 같은 명령으로 다시 실행하면 체크포인트부터 이어서 진행합니다")
+        sys.exit(130)
+    except RuntimeError as e:
+        # 다른 API 워커 / CLI 가 실행 중이면 체크포인트 행을 잡지 못함 (POST /admin/rescore/stop 으로 중단 가능)
+        print(f"❌ 재채점 실패: {e}")
+        sys.exit(1)
+
+    print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/bin/bash
+# 컨테이너 시작 스크립트
+#
+# SENTIMENT_ENGINE=remote 이면 공유 추론 프로세스와 uvicorn 을 함께 띄우고,
+# 둘 중 하나라도 종료되면 나머지도 내리고 같은 종료 코드로 끝낸다.
+# (추론 프로세스만 죽은 채로 컨테이너가 살아 있지 않도록 → 오케스트레이터가 재시작)
+
+PORT=${PORT:-8080}
+
+if [ "$SENTIMENT_ENGINE" != "remote" ]; then
+    exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT"
+fi
+
+if [ -z "$SENTIMENT_SOCKET_AUTHKEY" ]; then
+    echo "❌ SENTIMENT_ENGINE=remote 에는 SENTIMENT_SOCKET_AUTHKEY 가 필요합니다" >&2
+    exit 1
+fi
+
+python -m app.services.inference_server &
+uvicorn app.main:app --host 0.0.0.0 --port "$PORT" &
+
+# 종료 신호는 두 프로세스 모두에 전달
+trap 'kill -TERM $(jobs -p) 2>/dev/null' TERM INT
+
+wait -n
+status=$?
+
+echo "⚠️ 프로세스 종료 (exit $status), 컨테이너를 종료합니다" >&2
+kill -TERM $(jobs -p) 2>/dev/null
+wait
+exit $status
@@ -0,0 +1,208 @@
+"""
+영화 통계 동시성 스트레스 테스트
+
+스레드 여러 개가 영화 하나에 리뷰 작성 / 삭제를 동시에 퍼붓고,
+같은 리뷰를 여러 스레드가 동시에 지우기도 한다.
+끝난 뒤 Movie 의 review_count / score_sum / scored_count / rating / 라벨별 개수가
+- 성공한 작업으로 계산한 기대값
+- 실제 리뷰 집계 (GROUP BY)
+와 정확히 같은지 확인한다. 하나라도 다르면 종료 코드 1.
+
+DATABASE_URL 이 가리키는 DB에 임시 영화를 만들고 끝나면 지운다 (--keep 이면 남김).
+
+실행: python scripts/stress_movie_stats.py [--threads 16] [--ops 200] [--delete-ratio 0.4]
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+
+from app.database import Base, Session, engine
+from app.migrations import run_migrations
+from app.models import Movie, Review
+from app.routers.reviews import _save_review, delete_review
+from app.schemas import ReviewCreate
+from app.services.movie_stats import LABEL_COLUMNS, RATING_TOLERANCE, SCORE_TOLERANCE, _aggregate, expected_rating
+
+# SQLite 처럼 DB 전체를 잠그는 경우 "database is locked" 재시도 횟수
+MAX_RETRIES = 20
+
+
+class Tally:
+    """성공한 작업 기준 기대값 (스레드 공유)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.review_count = 0
+        self.score_sum = 0.0
+        self.created = 0
+        self.deleted = 0
+        self.not_found = 0
+        self.retries = 0
+        self.review_ids = []
+
+
+def _retry(operation):
+    """잠금 충돌(OperationalError)이면 잠깐 쉬고 다시 시도 → (결과, 재시도 횟수)"""
+    for attempt in range(MAX_RETRIES):
+        try:
+            return operation(), attempt
+        except OperationalError:
+            time.sleep(random.uniform(0.001, 0.02))
+    return operation(), MAX_RETRIES
+
+
+def worker(movie_id: int, ops: int, delete_ratio: float, tally: Tally, seed: int):
+    rng = random.Random(seed)
+    db = Session()
+    try:
+        for i in range(ops):
+            with tally.lock:
+                candidates = list(tally.review_ids)
+
+            if candidates and rng.random() < delete_ratio:
+                # 다른 스레드와 같은 리뷰를 고를 수 있음 (이중 삭제 경쟁)
+                review_id = rng.choice(candidates)
+                score = db.query(Review.sentiment_score).filter(Review.id == review_id).scalar()
+                db.rollback()
+
+                def remove():
+                    try:
+                        delete_review(review_id, db)
+                        return True
+                    except HTTPException:
+                        return False
+                    except OperationalError:
+                        db.rollback()
+                        raise
+
+                removed, retries = _retry(remove)
+                with tally.lock:
+                    tally.retries += retries
+                    if removed:
+                        tally.deleted += 1
+                        tally.review_count -= 1
+                        tally.score_sum -= score
+                        tally.review_ids.remove(review_id)
+                    else:
+                        tally.not_found += 1
+            else:
+                score = round(rng.random(), 4)
+                review = ReviewCreate(movie_id=movie_id, author=f"stress-{seed}", content=f"스트레스 테스트 리뷰 {seed}-{i}")
+                sentiment = {"label": "positive" if score >= 0.5 else "negative", "score": score, "model_version": "stress"}
+
+                def create():
+                    try:
+                        return _save_review(review, sentiment, db)
+                    except OperationalError:
+                        db.rollback()
+                        raise
+
+                saved, retries = _retry(create)
+                with tally.lock:
+                    tally.retries += retries
+                    tally.created += 1
+                    tally.review_count += 1
+                    tally.score_sum += score
+                    tally.review_ids.append(saved.id)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영화 통계 동시성 스트레스 테스트")
+    parser.add_argument("--threads", type=int, default=16, help="동시 스레드 수")
+    parser.add_argument("--ops", type=int, default=200, help="스레드당 작업 수")
+    parser.add_argument("--delete-ratio", type=float, default=0.4, help="삭제 작업 비율")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 테스트 영화를 지우지 않음")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"영화 통계 동시성 스트레스 테스트 ({engine.dialect.name})")
+    print("=" * 60)
+
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    db = Session()
+    movie = Movie(title=f"stress-test-{int(time.time())}")
+    db.add(movie)
+    db.commit()
+    movie_id = movie.id
+
+    tally = Tally()
+    threads = [
+        threading.Thread(target=worker, args=(movie_id, args.ops, args.delete_ratio, tally, args.seed + n))
+        for n in range(args.threads)
+    ]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    db.expire_all()
+    stored = db.query(Movie).filter(Movie.id == movie_id).one()
+    actual = _aggregate([movie_id], db)[movie_id]
+    review_count, score_sum, scored_count = actual["review_count"], actual["score_sum"], actual["scored_count"]
+    rating = expected_rating(tally.score_sum, tally.review_count)
+
+    checks = {
+        "review_count == expected": stored.review_count == tally.review_count,
+        "review_count == actual": stored.review_count == review_count,
+        "scored_count == actual": stored.scored_count == scored_count,
+        "score_sum == expected": abs(stored.score_sum - tally.score_sum) <= SCORE_TOLERANCE,
+        "score_sum == actual": abs(stored.score_sum - score_sum) <= SCORE_TOLERANCE,
+        "rating == expected": abs(stored.rating - rating) <= RATING_TOLERANCE + SCORE_TOLERANCE,
+        "label counts == actual": all(getattr(stored, column) == actual[column] for column in LABEL_COLUMNS.values())
+    }
+
+    report = {
+        "movie_id": movie_id,
+        "threads": args.threads,
+        "ops": args.threads * args.ops,
+        "seconds": round(elapsed, 2),
+        "created": tally.created,
+        "deleted": tally.deleted,
+        "delete_not_found": tally.not_found,
+        "lock_retries": tally.retries,
+        "stored": {
+            "review_count": stored.review_count,
+            "score_sum": stored.score_sum,
+            "scored_count": stored.scored_count,
+            "rating": stored.rating,
+            **{column: getattr(stored, column) for column in LABEL_COLUMNS.values()}
+        },
+        "expected": {"review_count": tally.review_count, "score_sum": tally.score_sum, "rating": rating},
+        "actual": actual,
+        "checks": checks
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if not args.keep:
+        db.query(Review).filter(Review.movie_id == movie_id).delete()
+        db.query(Movie).filter(Movie.id == movie_id).delete()
+        db.commit()
+    db.close()
+
+    if all(checks.values()):
+        print("✅ 모든 통계가 정확합니다")
+    else:
+        print("❌ 통계 불일치: " + ", ".join(name for name, ok in checks.items() if not ok))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 # frontend/app.py
 import streamlit as st
-import requests
 import os
 
+from utils.api_client import get_all_pages, get_catalog_stats
+from components.pager import load_paged, render_load_more
+
 st.set_page_config(
     page_title="Movie GPT - AI 영화 리뷰 플랫폼",
     page_icon="🎬",
@@ -13,30 +15,30 @@ st.set_page_config(
 BASE_URL = os.getenv("BASE_URL", "http://backend:8000")
 
 
-def get_movies(limit=None):
-    """영화 목록 가져오기"""
+def get_movies(limit):
+    """최근 영화 limit 개 가져오기 (최신순)"""
     try:
-        response = requests.get(f"{BASE_URL}/movies/", timeout=10)
-        if response.status_code == 200:
-            movies = response.json()
-            return movies[:limit] if limit else movies
-        return []
+        return get_all_pages(f"{BASE_URL}/movies/", max_items=limit)
     except:
         return []
 
 
-def get_reviews(limit=None):
-    """리뷰 목록 가져오기"""
+def get_reviews(limit):
+    """최근 리뷰 limit 개 가져오기 (최신순)"""
     try:
-        response = requests.get(f"{BASE_URL}/reviews/", timeout=10)
-        if response.status_code == 200:
-            reviews = response.json()
-            return reviews[:limit] if limit else reviews
-        return []
+        return get_all_pages(f"{BASE_URL}/reviews/", max_items=limit)
     except:
         return []
 
 
+def get_stats():
+    """전체 현황 (목록을 다 받아 세지 않고 백엔드 누적값 사용)"""
+    try:
+        return get_catalog_stats(BASE_URL)
+    except:
+        return {}
+
+
 # ========================================
 # Hero Section
 # ========================================
@@ -55,28 +57,29 @@ st.markdown("---")
 # ========================================
 st.subheader("📊 현황")
 
-movies = get_movies()
-reviews = get_reviews()
+stats = get_stats()
+movie_count = stats.get('movie_count', 0)
+review_count = stats.get('review_count', 0)
 
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     st.metric(
         label="등록된 영화",
-        value=f"{len(movies)}개",
-        delta="TMDB 연동" if movies else None
+        value=f"{movie_count}개",
+        delta="TMDB 연동" if movie_count else None
     )
 
 with col2:
     st.metric(
         label="전체 리뷰",
-        value=f"{len(reviews)}개",
-        delta="AI 분석" if reviews else None
+        value=f"{review_count}개",
+        delta="AI 분석" if review_count else None
     )
 
 with col3:
-    if movies:
-        avg_rating = sum(m.get('rating', 0) for m in movies) / len(movies)
+    if movie_count:
+        avg_rating = stats.get('average_rating', 0)
         st.metric(
             label="평균 평점",
             value=f"{avg_rating:.2f}",
@@ -86,11 +89,11 @@ with col3:
         st.metric(label="평균 평점", value="0.00")
 
 with col4:
-    reviewed_movies = len([m for m in movies if m.get('review_count', 0) > 0])
+    reviewed_movies = stats.get('reviewed_movie_count', 0)
     st.metric(
         label="리뷰 있는 영화",
         value=f"{reviewed_movies}개",
-        delta=f"{reviewed_movies}/{len(movies)}" if movies else None
+        delta=f"{reviewed_movies}/{movie_count}" if movie_count else None
     )
 
 st.markdown("---")
@@ -150,7 +153,8 @@ if recent_reviews:
             
             with col2:
                 sentiment = review.get('sentiment_label', '')
-                score = review.get('sentiment_score', 0)
+                # 채점 대기 / 감성 사전 결과는 점수 없음
+                score = review.get('sentiment_score') or 0
                 
                 if sentiment == 'positive':
                     st.success(f"😊 {score:.2f}")
@@ -191,7 +195,11 @@ st.markdown("---")
 # ========================================
 st.subheader("🎞️ 영화 갤러리")
 
-all_movies = get_movies()
+# 한 페이지씩 보여주고 "더 보기" 로 다음 페이지를 이어 붙임 (정렬은 불러온 영화 안에서)
+try:
+    all_movies = load_paged("gallery_movies", f"{BASE_URL}/movies/")
+except:
+    all_movies = []
 
 if all_movies:
     # 정렬 옵션
@@ -248,6 +256,8 @@ if all_movies:
                 # 리뷰 개수
                 review_count = movie.get('review_count', 0)
                 st.caption(f"💬 리뷰 {review_count}개")
+    
+    render_load_more("gallery_movies")
 else:
     st.info("등록된 영화가 없습니다. 첫 영화를 추가해보세요!")
     
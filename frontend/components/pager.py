@@ -0,0 +1,52 @@
+# frontend/components/pager.py
+import streamlit as st
+
+from utils.api_client import PAGE_SIZE, get_page
+
+
+def load_paged(key: str, url: str, params: dict = None, limit: int = PAGE_SIZE):
+    """
+    커서 목록 API 를 한 페이지씩 보여주기 → 지금까지 불러온 목록
+
+    첫 페이지는 매번 새로 받고, "더 보기" 로 불러온 다음 페이지들은 session_state[key] 에 커서와 함께 보관
+    (첫 페이지가 바뀌었거나 url / params 가 바뀌면 보관한 페이지는 버림)
+    실패하면 requests.RequestException 발생
+    """
+    items, cursor = get_page(url, params, limit=limit)
+    head = [item.get("id") for item in items]
+
+    state = st.session_state.get(key)
+    if state and state["url"] == url and state["params"] == params and state["head"] == head:
+        return items + state["more"]
+
+    st.session_state[key] = {
+        "url": url,
+        "params": params,
+        "limit": limit,
+        "head": head,
+        "more": [],
+        "cursor": cursor
+    }
+    return items
+
+
+def render_load_more(key: str, label: str = "⬇️ 더 보기"):
+    """다음 페이지가 있으면 "더 보기" 버튼 (누르면 저장된 커서로 한 페이지 더 불러옴)"""
+    state = st.session_state.get(key)
+    if not state or not state["cursor"]:
+        return
+
+    if st.button(label, key=f"{key}_load_more", use_container_width=True):
+        try:
+            items, cursor = get_page(state["url"], state["params"], cursor=state["cursor"], limit=state["limit"])
+        except Exception as e:
+            st.error(f"❌ 다음 페이지 조회 실패: {str(e)}")
+            return
+        state["more"].extend(items)
+        state["cursor"] = cursor
+        st.rerun()
+
+
+def reset_paged(key: str):
+    """보관한 다음 페이지 버리기 (삭제 / 추가 후 호출)"""
+    st.session_state.pop(key, None)
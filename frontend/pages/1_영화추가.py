@@ -16,7 +16,7 @@ import os
 import streamlit as st
 from typing import List, Dict, Any
 
-from utils.api_client import client
+from utils.api_client import client, get_catalog_stats
 
 st.set_page_config(page_title="영화 추가", page_icon="🎬", layout="wide")
 
@@ -233,10 +233,8 @@ with st.sidebar:
     
     # 통계 표시
     try:
-        movies_response = requests.get(f"{BASE_URL}/movies/", timeout=5)
-        if movies_response.status_code == 200:
-            movies = movies_response.json()
-            st.metric("📊 등록된 영화", f"{len(movies)}개")
+        stats = get_catalog_stats(BASE_URL, timeout=5)
+        st.metric("📊 등록된 영화", f"{stats.get('movie_count', 0)}개")
     except:
         pass
 
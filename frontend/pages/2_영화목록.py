@@ -10,19 +10,31 @@ import sys
 sys.path.append('/app')  # Docker 경로
 
 from components.chatbot import render_chatbot_button
+from components.pager import load_paged, render_load_more, reset_paged
+from utils.api_client import get_catalog_stats
 
-def get_all_movies():
-    """전체 영화 목록 가져오기"""
+# 영화 목록 페이지 상태 (불러온 다음 페이지 + 커서) session_state 키
+MOVIES_PAGER_KEY = "movie_list_movies"
+
+
+def get_movies():
+    """영화 목록 가져오기 (첫 페이지 + "더 보기" 로 불러온 페이지)"""
     try:
-        response = requests.get(f"{BASE_URL}/movies/", timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        return []
+        return load_paged(MOVIES_PAGER_KEY, f"{BASE_URL}/movies/")
     except Exception as e:
         st.error(f"❌ 영화 목록 조회 실패: {str(e)}")
         return []
 
 
+def get_stats():
+    """전체 현황 (백엔드 누적값)"""
+    try:
+        return get_catalog_stats(BASE_URL)
+    except Exception as e:
+        st.error(f"❌ 통계 조회 실패: {str(e)}")
+        return {}
+
+
 def delete_movie(movie_id: int):
     """영화 삭제"""
     try:
@@ -38,14 +50,15 @@ st.markdown("---")
 
 # 영화 목록 가져오기
 with st.spinner("📥 영화 목록을 불러오는 중..."):
-    movies = get_all_movies()
+    movies = get_movies()
+    stats = get_stats()
 
 if not movies:
     st.info("📭 등록된 영화가 없습니다. '영화 추가' 페이지에서 영화를 추가해보세요!")
     st.stop()
 
 # 통계
-st.success(f"✅ 총 {len(movies)}개의 영화가 등록되어 있습니다")
+st.success(f"✅ 총 {stats.get('movie_count', len(movies))}개의 영화가 등록되어 있습니다")
 
 # 정렬 옵션
 col1, col2 = st.columns([3, 1])
@@ -79,6 +92,7 @@ for movie in movies:
     poster_url = movie.get("poster_url")
     rating = movie.get("rating", 0.0)
     review_count = movie.get("review_count", 0)
+    unscored_count = movie.get("unscored_count", 0)
     tmdb_id = movie.get("tmdb_id")
     
     # 카드 레이아웃
@@ -120,6 +134,9 @@ for movie in movies:
                 st.caption(f"{stars} {rating:.2f}/1.0")
             else:
                 st.caption("⭐ 평점 없음")
+            # 감성 사전이 답한 리뷰는 점수가 없어 평점에서 빠짐
+            if unscored_count:
+                st.caption(f"ℹ️ 감성 사전 판정 {unscored_count}개는 평점 제외")
         
         with col_reviews:
             st.caption(f"💬 리뷰 {review_count}개")
@@ -140,30 +157,29 @@ for movie in movies:
         # 삭제 버튼
         if st.button("🗑️ 삭제", key=f"delete_{movie_id}", use_container_width=True):
             if delete_movie(movie_id):
+                reset_paged(MOVIES_PAGER_KEY)
                 st.success("✅ 삭제 완료!")
                 st.rerun()
     
     st.markdown("---")
 
+render_load_more(MOVIES_PAGER_KEY)
+
 # 사이드바
 with st.sidebar:
     st.header("📊 통계")
-    st.metric("등록된 영화", f"{len(movies)}개")
+    st.metric("등록된 영화", f"{stats.get('movie_count', 0)}개")
     
-    if movies:
-        # 평점 있는 영화
-        rated_movies = [m for m in movies if m.get("rating", 0) > 0]
-        if rated_movies:
-            avg_rating = sum(m.get("rating", 0) for m in rated_movies) / len(rated_movies)
-            st.metric("평균 평점", f"{avg_rating:.2f}/1.0")
+    if stats:
+        # 평균 평점
+        if stats.get("average_rating", 0) > 0:
+            st.metric("평균 평점", f"{stats['average_rating']:.2f}/1.0")
         
         # 리뷰 있는 영화
-        reviewed_movies = [m for m in movies if m.get("review_count", 0) > 0]
-        st.metric("리뷰 있는 영화", f"{len(reviewed_movies)}개")
+        st.metric("리뷰 있는 영화", f"{stats.get('reviewed_movie_count', 0)}개")
         
         # 총 리뷰 수
-        total_reviews = sum(m.get("review_count", 0) for m in movies)
-        st.metric("총 리뷰 수", f"{total_reviews}개")
+        st.metric("총 리뷰 수", f"{stats.get('review_count', 0)}개")
     
     st.markdown("---")
     
@@ -11,14 +11,16 @@ import sys
 sys.path.append('/app')  # Docker 경로
 
 from components.chatbot import render_chatbot_button
+from components.pager import load_paged, render_load_more
 
-def get_all_movies():
-    """전체 영화 목록 가져오기"""
+# 영화 선택 목록 페이지 상태 session_state 키
+MOVIES_PAGER_KEY = "review_write_movies"
+
+
+def get_movies():
+    """영화 목록 가져오기 (첫 페이지 + "더 보기" 로 불러온 페이지)"""
     try:
-        response = requests.get(f"{BASE_URL}/movies/", timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        return []
+        return load_paged(MOVIES_PAGER_KEY, f"{BASE_URL}/movies/")
     except Exception as e:
         st.error(f"❌ 영화 목록 조회 실패: {str(e)}")
         return []
@@ -36,8 +38,14 @@ def create_review(movie_id: int, author: str, content: str):
             },
             timeout=10
         )
-        if response.status_code == 201:
+        # 202: 감성 분석 지연 모드 (pending 상태로 저장됨)
+        if response.status_code in (201, 202):
             return True, response.json()
+        # 503: 감성 분석이 몰려서 잠시 받지 않음
+        elif response.status_code == 503:
+            retry_after = response.headers.get("Retry-After", "몇")
+            st.warning(f"⏳ 요청이 많아 잠시 후 다시 시도해주세요 ({retry_after}초 후)")
+            return False, None
         else:
             return False, None
     except Exception as e:
@@ -58,7 +66,7 @@ st.markdown("---")
 
 # 영화 목록 가져오기
 with st.spinner("📥 영화 목록을 불러오는 중..."):
-    movies = get_all_movies()
+    movies = get_movies()
 
 if not movies:
     st.warning("⚠️ 등록된 영화가 없습니다.")
@@ -81,6 +89,9 @@ selected_movie_label = st.selectbox(
     label_visibility="collapsed"
 )
 
+# 목록에 없으면 다음 페이지 영화 불러오기
+render_load_more(MOVIES_PAGER_KEY, label="⬇️ 영화 더 불러오기")
+
 selected_movie_id = movie_options[selected_movie_label]
 selected_movie = next((m for m in movies if m.get("id") == selected_movie_id), None)
 
@@ -171,12 +182,14 @@ if st.session_state.review_submitted and st.session_state.review_data:
     st.subheader("📊 감성 분석 결과")
     
     sentiment_label = review_data.get("sentiment_label", "알 수 없음")
-    sentiment_score = review_data.get("sentiment_score", 0)
+    sentiment_score = review_data.get("sentiment_score") or 0
     
     col1, col2 = st.columns(2)
     
     with col1:
-        if sentiment_label == "positive":
+        if sentiment_label == "pending":
+            st.info("⏳ 감성 분석 대기 중입니다 (잠시 후 리뷰 목록에서 확인)")
+        elif sentiment_label == "positive":
             st.success("😊 긍정적인 리뷰입니다")
         elif sentiment_label == "negative":
             st.error("😞 부정적인 리뷰입니다")
@@ -3,7 +3,6 @@ import streamlit as st
 import requests
 import os
 import plotly.graph_objects as go
-from collections import defaultdict
 
 st.set_page_config(page_title="리뷰 목록", page_icon="💬", layout="wide")
 
@@ -13,31 +12,87 @@ import sys
 sys.path.append('/app')  # Docker 경로
 
 from components.chatbot import render_chatbot_button
+from components.pager import load_paged, render_load_more, reset_paged
+from utils.api_client import get_catalog_stats
 
-def get_all_reviews():
-    """전체 리뷰 목록 가져오기"""
+# 목록 페이지 상태 (불러온 다음 페이지 + 커서) session_state 키
+REVIEWS_PAGER_KEY = "review_list_reviews"
+MOVIES_PAGER_KEY = "review_list_movies"
+
+
+def get_reviews(movie_id=None):
+    """리뷰 목록 가져오기 (첫 페이지 + "더 보기" 로 불러온 페이지, movie_id 가 있으면 그 영화만)"""
+    url = f"{BASE_URL}/reviews/movie/{movie_id}" if movie_id else f"{BASE_URL}/reviews/"
     try:
-        response = requests.get(f"{BASE_URL}/reviews/", timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        return []
+        return load_paged(REVIEWS_PAGER_KEY, url)
     except Exception as e:
         st.error(f"❌ 리뷰 목록 조회 실패: {str(e)}")
         return []
 
 
-def get_all_movies():
-    """전체 영화 목록 가져오기"""
+def get_movies():
+    """영화 목록 가져오기 (첫 페이지 + "더 보기" 로 불러온 페이지)"""
     try:
-        response = requests.get(f"{BASE_URL}/movies/", timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        return []
+        return load_paged(MOVIES_PAGER_KEY, f"{BASE_URL}/movies/")
     except Exception as e:
         st.error(f"❌ 영화 목록 조회 실패: {str(e)}")
         return []
 
 
+def get_movie_titles(movie_ids):
+    """불러온 영화 목록에 없는 영화 제목 가져오기 (한 번 받은 제목은 session_state 에 보관) → {movie_id: title}"""
+    titles = st.session_state.setdefault("review_list_titles", {})
+    for movie_id in movie_ids:
+        if movie_id in titles:
+            continue
+        try:
+            response = requests.get(f"{BASE_URL}/movies/{movie_id}", timeout=10)
+            if response.status_code == 200:
+                titles[movie_id] = response.json().get('title', '제목 없음')
+        except Exception:
+            pass
+    return titles
+
+
+def get_stats():
+    """전체 현황 (백엔드 누적값)"""
+    try:
+        return get_catalog_stats(BASE_URL)
+    except Exception as e:
+        st.error(f"❌ 통계 조회 실패: {str(e)}")
+        return {}
+
+
+def get_sentiment_summaries(movie_ids):
+    """영화별 감성 분포 가져오기 (백엔드에 누적된 개수) → {movie_id: summary}"""
+    summaries = {}
+    movie_ids = list(movie_ids)
+    try:
+        # 한 번에 200개까지 받을 수 있음
+        for start in range(0, len(movie_ids), 200):
+            chunk = movie_ids[start:start + 200]
+            response = requests.get(
+                f"{BASE_URL}/movies/sentiment-summary",
+                params={"ids": ",".join(str(movie_id) for movie_id in chunk)},
+                timeout=10
+            )
+            if response.status_code == 200:
+                for summary in response.json():
+                    summaries[summary["movie_id"]] = summary
+    except Exception as e:
+        st.error(f"❌ 감성 분포 조회 실패: {str(e)}")
+    return summaries
+
+
+def to_sentiment_counts(summary):
+    """감성 분포 (영화별 요약 또는 전체 현황) → 차트용 개수 (분석 대기 리뷰는 기존처럼 중립에 포함)"""
+    return {
+        'positive': summary.get('positive_count', 0),
+        'negative': summary.get('negative_count', 0),
+        'neutral': summary.get('neutral_count', 0) + summary.get('pending_count', 0)
+    }
+
+
 def delete_review(review_id: int):
     """리뷰 삭제"""
     try:
@@ -48,21 +103,8 @@ def delete_review(review_id: int):
         return False
 
 
-def create_sentiment_pie_chart(reviews, title="감성 분석 분포", height=400):
-    """감성 분석 파이 차트 생성"""
-    # 감성별 개수 집계
-    sentiment_counts = {
-        'positive': 0,
-        'negative': 0,
-        'neutral': 0
-    }
-    
-    for review in reviews:
-        label = review.get('sentiment_label', 'neutral')
-        if label in sentiment_counts:
-            sentiment_counts[label] += 1
-        else:
-            sentiment_counts['neutral'] += 1
+def create_sentiment_pie_chart(sentiment_counts, title="감성 분석 분포", height=400):
+    """감성 분석 파이 차트 생성 (sentiment_counts: 감성별 개수)"""
     
     # 데이터 준비
     labels_korean = {
@@ -113,26 +155,16 @@ def create_sentiment_pie_chart(reviews, title="감성 분석 분포", height=400
     return fig, sentiment_counts
 
 
-def get_reviews_by_movie(reviews):
-    """영화별로 리뷰 그룹핑"""
-    movie_reviews = defaultdict(list)
-    for review in reviews:
-        movie_id = review.get('movie_id')
-        if movie_id:
-            movie_reviews[movie_id].append(review)
-    return movie_reviews
-
-
 # 메인 UI
 st.title("💬 리뷰 목록")
 st.markdown("---")
 
-# 리뷰 목록 가져오기
+# 현황 + 영화 목록 가져오기 (리뷰는 필터를 고른 뒤 한 페이지씩)
 with st.spinner("📥 리뷰 목록을 불러오는 중..."):
-    reviews = get_all_reviews()
-    movies = get_all_movies()
+    stats = get_stats()
+    movies = get_movies()
 
-if not reviews:
+if not stats.get('review_count'):
     st.info("📭 작성된 리뷰가 없습니다. '리뷰 작성' 페이지에서 첫 리뷰를 작성해보세요!")
     
     if st.button("✍️ 리뷰 작성하러 가기", type="primary"):
@@ -145,10 +177,9 @@ if not reviews:
 # ========================================
 st.subheader("🎬 영화별 통계")
 
-movie_reviews = get_reviews_by_movie(reviews)
-
-# 리뷰가 있는 영화만 필터링
-movies_with_reviews = [m for m in movies if m.get('id') in movie_reviews]
+# 리뷰가 있는 영화만 필터링 + 감성 분포 (리뷰를 다시 세지 않고 백엔드 누적값 사용)
+movies_with_reviews = [m for m in movies if m.get('review_count', 0) > 0]
+sentiment_summaries = get_sentiment_summaries(m.get('id') for m in movies_with_reviews)
 
 if not movies_with_reviews:
     st.info("아직 리뷰가 작성된 영화가 없습니다.")
@@ -162,9 +193,9 @@ else:
     
     # 정렬 적용
     if sort_by == "리뷰 많은 순":
-        movies_with_reviews = sorted(movies_with_reviews, key=lambda m: len(movie_reviews.get(m.get('id'), [])), reverse=True)
+        movies_with_reviews = sorted(movies_with_reviews, key=lambda m: m.get('review_count', 0), reverse=True)
     elif sort_by == "리뷰 적은 순":
-        movies_with_reviews = sorted(movies_with_reviews, key=lambda m: len(movie_reviews.get(m.get('id'), [])))
+        movies_with_reviews = sorted(movies_with_reviews, key=lambda m: m.get('review_count', 0))
     elif sort_by == "평점 높은 순":
         movies_with_reviews = sorted(movies_with_reviews, key=lambda m: m.get('rating', 0), reverse=True)
     else:  # 평점 낮은 순
@@ -179,13 +210,15 @@ else:
         movie_poster = movie.get('poster_url')
         movie_rating = movie.get('rating', 0)
         
-        reviews_for_movie = movie_reviews.get(movie_id, [])
+        summary = sentiment_summaries.get(movie_id)
         
-        if not reviews_for_movie:
+        if not summary or summary.get('review_count', 0) == 0:
             continue
         
+        review_count_movie = summary['review_count']
+        
         # ✅ Expander로 감싸서 공간 절약
-        with st.expander(f"🎬 {movie_title} (리뷰 {len(reviews_for_movie)}개)", expanded=True):
+        with st.expander(f"🎬 {movie_title} (리뷰 {review_count_movie}개)", expanded=True):
             # 상단: 영화 기본 정보
             col_info1, col_info2 = st.columns([1, 3])
             
@@ -220,22 +253,8 @@ else:
             col_chart, col_stats = st.columns([2.5, 1.5])
             
             with col_chart:
-                # 파이 차트
-                reviews_for_movie_list = movie_reviews.get(movie_id, [])
-                
-                # 감성별 개수 집계
-                sentiment_counts_movie = {
-                    'positive': 0,
-                    'negative': 0,
-                    'neutral': 0
-                }
-                
-                for review in reviews_for_movie_list:
-                    label = review.get('sentiment_label', 'neutral')
-                    if label in sentiment_counts_movie:
-                        sentiment_counts_movie[label] += 1
-                    else:
-                        sentiment_counts_movie['neutral'] += 1
+                # 감성별 개수 (백엔드 누적값)
+                sentiment_counts_movie = to_sentiment_counts(summary)
                 
                 # 파이 차트 생성
                 labels_korean = {
@@ -284,7 +303,7 @@ else:
             with col_stats:
                 st.markdown("### 📊 통계")
                 
-                st.metric("총 리뷰", f"{len(reviews_for_movie)}개")
+                st.metric("총 리뷰", f"{review_count_movie}개")
                 
                 st.markdown("---")
                 
@@ -294,13 +313,14 @@ else:
                 st.write(f"😞 부정: {sentiment_counts_movie['negative']}개")
                 st.write(f"😐 중립: {sentiment_counts_movie['neutral']}개")
                 
-                # 평균 감성 점수
-                movie_scores = [r.get('sentiment_score', 0) for r in reviews_for_movie if r.get('sentiment_score') is not None]
-                if movie_scores:
-                    avg_movie_score = sum(movie_scores) / len(movie_scores)
+                # 평균 감성 점수 (점수가 있는 리뷰만, 분석 대기 / 감성 사전 판정 리뷰 제외)
+                if summary.get('scored_count', 0) > 0:
+                    avg_movie_score = summary.get('rating', 0)
                     
                     st.markdown("---")
                     st.metric("평균 감성", f"{avg_movie_score:.3f}")
+                    if summary.get('unscored_count', 0):
+                        st.caption(f"리뷰 {summary['scored_count']}개 기준 (감성 사전 판정 {summary['unscored_count']}개 제외)")
                     
                     # 감성 평가
                     if avg_movie_score >= 0.6:
@@ -309,6 +329,12 @@ else:
                         st.error("😞 부정적")
                     else:
                         st.info("😐 중립적")
+                elif summary.get('unscored_count', 0):
+                    st.markdown("---")
+                    st.caption(f"평균 감성 없음 (감성 사전 판정 {summary['unscored_count']}개는 점수 없음)")
+
+# 다음 페이지 영화 (영화별 통계 / 영화 필터 목록에 추가됨)
+render_load_more(MOVIES_PAGER_KEY, label="⬇️ 영화 더 보기")
 
 st.markdown("---")
 
@@ -336,21 +362,24 @@ with col2:
         key="sort_option"
     )
 
-# 필터링 적용
-filtered_reviews = reviews.copy()
+# 영화 필터 (백엔드에서 그 영화 리뷰만 한 페이지씩 받음)
+selected_movie_id = movie_dict[movie_filter] if movie_filter != "전체" else None
+filtered_reviews = get_reviews(selected_movie_id)
 
-# 영화 필터
-if movie_filter != "전체":
-    selected_movie_id = movie_dict[movie_filter]
-    filtered_reviews = [r for r in filtered_reviews if r.get('movie_id') == selected_movie_id]
+# 전체 개수는 누적값 (불러온 목록 길이가 아님)
+if selected_movie_id:
+    selected_summary = sentiment_summaries.get(selected_movie_id) or {}
+    total_filtered = selected_summary.get('review_count', len(filtered_reviews))
+else:
+    total_filtered = stats.get('review_count', len(filtered_reviews))
 
-# 정렬
+# 정렬 (불러온 리뷰 안에서)
 if sort_option == "오래된순":
     filtered_reviews = sorted(filtered_reviews, key=lambda x: x.get('id', 0))
 elif sort_option == "감성 점수 높은순":
-    filtered_reviews = sorted(filtered_reviews, key=lambda x: x.get('sentiment_score', 0), reverse=True)
+    filtered_reviews = sorted(filtered_reviews, key=lambda x: x.get('sentiment_score') or 0, reverse=True)
 elif sort_option == "감성 점수 낮은순":
-    filtered_reviews = sorted(filtered_reviews, key=lambda x: x.get('sentiment_score', 0))
+    filtered_reviews = sorted(filtered_reviews, key=lambda x: x.get('sentiment_score') or 0)
 else:  # 최신순
     filtered_reviews = sorted(filtered_reviews, key=lambda x: x.get('id', 0), reverse=True)
 
@@ -359,15 +388,17 @@ st.markdown("---")
 # ========================================
 # 리뷰 목록 표시
 # ========================================
-st.subheader(f"📝 리뷰 목록 ({len(filtered_reviews)}개)")
+st.subheader(f"📝 리뷰 목록 ({total_filtered}개 중 {len(filtered_reviews)}개 표시)")
 
 if not filtered_reviews:
     st.info("필터 조건에 맞는 리뷰가 없습니다.")
 else:
+    # 영화 제목 (불러온 영화 목록에 없으면 따로 조회)
+    movie_titles = {m.get('id'): m.get('title', '제목 없음') for m in movies}
+    movie_titles.update(get_movie_titles({r.get('movie_id') for r in filtered_reviews} - movie_titles.keys()))
+    
     for review in filtered_reviews:
-        # 영화 정보 찾기
-        movie = next((m for m in movies if m.get('id') == review.get('movie_id')), None)
-        movie_title = movie.get('title', '알 수 없음') if movie else '알 수 없음'
+        movie_title = movie_titles.get(review.get('movie_id'), '알 수 없음')
         
         # 리뷰 카드
         with st.container():
@@ -386,9 +417,11 @@ else:
             with col2:
                 # 감성 분석 결과
                 sentiment_label = review.get('sentiment_label', 'neutral')
-                sentiment_score = review.get('sentiment_score', 0)
+                sentiment_score = review.get('sentiment_score') or 0
                 
-                if sentiment_label == 'positive':
+                if sentiment_label == 'pending':
+                    st.info("⏳ 분석 대기")
+                elif sentiment_label == 'positive':
                     st.success("😊 긍정")
                     st.metric("감성 점수", f"{sentiment_score:.3f}")
                 elif sentiment_label == 'negative':
@@ -405,34 +438,35 @@ else:
                 # 삭제 버튼
                 if st.button("🗑️ 삭제", key=f"delete_{review.get('id')}", use_container_width=True):
                     if delete_review(review.get('id')):
+                        reset_paged(REVIEWS_PAGER_KEY)
                         st.success("✅ 삭제 완료!")
                         st.rerun()
             
             st.markdown("---")
 
+    render_load_more(REVIEWS_PAGER_KEY, label="⬇️ 리뷰 더 보기")
+
 # ========================================
 # 사이드바
 # ========================================
 with st.sidebar:
     st.header("📊 통계 요약")
     
-    st.metric("총 리뷰", f"{len(reviews)}개")
-    st.metric("필터된 리뷰", f"{len(filtered_reviews)}개")
+    st.metric("총 리뷰", f"{stats.get('review_count', 0)}개")
+    st.metric("필터된 리뷰", f"{total_filtered}개")
     
-    # 리뷰가 있는 영화 계산
-    movie_reviews_dict = get_reviews_by_movie(reviews)
-    movies_with_reviews_count = len([m for m in movies if m.get('id') in movie_reviews_dict])
-    st.metric("리뷰 있는 영화", f"{movies_with_reviews_count}개")
+    # 리뷰가 있는 영화 (백엔드 누적값)
+    st.metric("리뷰 있는 영화", f"{stats.get('reviewed_movie_count', 0)}개")
     
-    if reviews:
+    if stats:
         st.markdown("---")
         st.markdown("### 감성 분포")
         
-        # 전체 통계에서 가져오기
-        _, overall_sentiment = create_sentiment_pie_chart(reviews)
+        # 전체 감성 분포 (백엔드 누적값)
+        overall_sentiment = to_sentiment_counts(stats)
         
         # 프로그레스 바
-        total = len(reviews)
+        total = sum(overall_sentiment.values())
         positive_pct = overall_sentiment['positive'] / total * 100 if total > 0 else 0
         negative_pct = overall_sentiment['negative'] / total * 100 if total > 0 else 0
         neutral_pct = overall_sentiment['neutral'] / total * 100 if total > 0 else 0
@@ -14,20 +14,64 @@ import os
 # FastAPI 백엔드의 기본 URL
 BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
 
+# 목록 API 는 한 페이지(최대 100개)씩 응답하고 다음 페이지 커서를 이 헤더로 보냄
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PAGE_SIZE = 100
+
+
+def get_page(url: str, params: dict = None, cursor: str = None, limit: int = PAGE_SIZE, timeout: float = 10):
+    """
+    커서 페이지네이션 목록 API 한 페이지 조회 → (items, 다음 페이지 커서 또는 None)
+
+    실패하면 requests.RequestException 발생
+    """
+    params = {**(params or {}), "limit": min(limit, PAGE_SIZE)}
+    if cursor:
+        params["cursor"] = cursor
+
+    response = requests.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json(), response.headers.get(NEXT_CURSOR_HEADER)
+
+
+def get_all_pages(url: str, params: dict = None, timeout: float = 10, max_items: int = PAGE_SIZE):
+    """
+    커서 페이지네이션 목록 API 를 X-Next-Cursor 를 따라가며 max_items 개까지 조회
+
+    max_items: 최대 개수 (기본 한 페이지, 화면마다 테이블 전체를 받지 않도록 반드시 상한을 둠)
+    개수 / 합계가 필요하면 목록을 세지 말고 /movies/stats, /movies/sentiment-summary 사용
+    실패하면 requests.RequestException 발생
+    """
+    items, cursor = get_page(url, params, limit=max_items, timeout=timeout)
+
+    while cursor and len(items) < max_items:
+        page, cursor = get_page(url, params, cursor=cursor, limit=max_items - len(items), timeout=timeout)
+        items.extend(page)
+
+    return items[:max_items]
+
+
+def get_catalog_stats(base_url: str = BASE_URL, timeout: float = 10):
+    """
+    전체 현황 (영화 수, 리뷰 수, 평균 평점 등 백엔드 누적값)
+
+    실패하면 requests.RequestException 발생
+    """
+    response = requests.get(f"{base_url}/movies/stats", timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
 class MovieAPIClient:
     """FastAPI 백엔드와 통신하는 클래스"""
 
     def __init__(self, base_url):
         self.base_url = base_url
 
-    def get_all_movies(self):
-        """전체 영화 목록 조회"""
+    def get_all_movies(self, limit: int = PAGE_SIZE):
+        """최근 영화 목록 조회 (최신순 limit 개, 전체 개수는 get_catalog_stats)"""
         try:
-            response = requests.get(f"{self.base_url}/movies/")
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return []
+            return get_all_pages(f"{self.base_url}/movies/", max_items=limit)
         except requests.RequestException as e:
             print(f"Error fetching all movies: {e}")
             return []
@@ -104,17 +148,10 @@ class MovieAPIClient:
             print(f"Error fetching reviews: {e}")
             return []
     
-    def get_movie_reviews(self, movie_id: int):
-        """특정 영화 리뷰 조회"""
+    def get_movie_reviews(self, movie_id: int, limit: int = PAGE_SIZE):
+        """특정 영화 최근 리뷰 조회 (최신순 limit 개, 전체 개수는 영화의 review_count)"""
         try:
-            response = requests.get(
-                f"{self.base_url}/reviews/movie/{movie_id}"
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return []
+            return get_all_pages(f"{self.base_url}/reviews/movie/{movie_id}", max_items=limit)
         
         except Exception as e:
             print(f"Error fetching movie reviews: {e}")